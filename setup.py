@@ -23,11 +23,17 @@ setuptools.setup(
     author_email="carbonsindh@gmail.com",
     description="Media compression encoder with ffmpeg Python wrapper",
     install_requires=required_packages,
+    extras_require={"fasthash": ["blake3", "xxhash"]},
     license="MIT",
     long_description=readme_description,
     long_description_content_type="text/markdown",
     packages=setuptools.find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.8",
-    entry_points={"console_scripts": ["encode=py_media_compressor.entry.encode:main"]},
+    entry_points={
+        "console_scripts": [
+            "encode=py_media_compressor.entry.encode:main",
+            "benchmark=py_media_compressor.entry.benchmark:main",
+        ]
+    },
 )
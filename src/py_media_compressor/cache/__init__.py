@@ -0,0 +1,19 @@
+from .base import SETTINGS, SqliteCacheBase
+from .hash_cache import HashCache, get_cached_file_hash, get_hash_cache
+from .job_journal import JobJournal, JobJournalEntry, get_job_journal, record_job
+from .probe_cache import ProbeCache, get_probe_cache, get_probe_info
+
+__all__ = [
+    "SETTINGS",
+    "SqliteCacheBase",
+    "HashCache",
+    "get_hash_cache",
+    "get_cached_file_hash",
+    "JobJournal",
+    "JobJournalEntry",
+    "get_job_journal",
+    "record_job",
+    "ProbeCache",
+    "get_probe_cache",
+    "get_probe_info",
+]
@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, Iterable, List, Optional, Tuple
+
+from py_media_compressor import log, utils
+
+# 전역 설정
+# dir (str, optional): 캐시 데이터베이스 저장 디렉토리 경로. Defaults to "cache".
+# enabled (bool, optional): 캐시 사용 여부. Defaults to True.
+# max_entries (int, optional): 캐시 테이블당 최대 항목 수. (초과 시, 가장 오래 사용되지 않은 항목부터 제거) Defaults to 1,000,000.
+# max_age_days (int, optional): 해당 기간 동안 사용되지 않은 항목은 제거됩니다. Defaults to 90.
+SETTINGS = {
+    "dir": "cache",
+    "enabled": True,
+    "max_entries": 1_000_000,
+    "max_age_days": 90,
+}
+
+
+class SqliteCacheBase(metaclass=ABCMeta):
+    """SQLite 데이터베이스를 사용하는 영구 캐시의 기반 클래스
+
+    여러 스레드에서 하나의 연결을 공유하므로, 모든 쿼리는 내부 잠금을 통해 실행됩니다.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    @abstractmethod
+    def table_name(self) -> str:
+        pass
+
+    @property
+    @abstractmethod
+    def schema(self) -> str:
+        pass
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not utils.is_str_empty_or_space(dirpath := os.path.dirname(self._filepath)):
+                os.makedirs(dirpath, exist_ok=True)
+
+            conn = sqlite3.connect(self._filepath, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.schema)
+            self._conn = conn
+
+            utils.set_file_permission(self._filepath)
+
+            self.evict()
+
+        return self._conn
+
+    def execute(self, sql: str, parameters: Iterable[Any] = ()) -> List[Tuple]:
+        with self._lock:
+            return self._connect().execute(sql, tuple(parameters)).fetchall()
+
+    def executemany(self, sql: str, parameters: Iterable[Iterable[Any]]):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(sql, parameters)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+    def evict(self, maxEntries: Optional[int] = None, maxAgeDays: Optional[int] = None):
+        """오래 사용되지 않은 항목을 제거합니다.
+
+        테이블에는 `accessed_at` (마지막 사용 시각, 초) 열이 있어야 합니다.
+
+        Args:
+            maxEntries (Optional[int], optional): 최대 항목 수. Defaults to SETTINGS["max_entries"].
+            maxAgeDays (Optional[int], optional): 항목 최대 미사용 기간 (일). Defaults to SETTINGS["max_age_days"].
+        """
+
+        if maxEntries is None:
+            maxEntries = SETTINGS["max_entries"]
+        if maxAgeDays is None:
+            maxAgeDays = SETTINGS["max_age_days"]
+
+        evicted_count = 0
+
+        with self._lock:
+            conn = self._connect()
+
+            if maxAgeDays is not None and maxAgeDays > 0:
+                evicted_count += conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE accessed_at < ?",
+                    (int(time.time()) - maxAgeDays * 86400,),
+                ).rowcount
+
+            if maxEntries is not None and maxEntries > 0:
+                evicted_count += conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE rowid IN "
+                    f"(SELECT rowid FROM {self.table_name} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (maxEntries,),
+                ).rowcount
+
+        if evicted_count > 0:
+            log.get_logger(self.evict).debug(f"{self.table_name}: 오래된 캐시 항목 {evicted_count}개를 제거했습니다.")
+
+    def clear(self):
+        self.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from py_media_compressor import log, utils
+from py_media_compressor.cache.base import SETTINGS, SqliteCacheBase
+
+# 수정된 지 얼마 되지 않은 파일은 아직 쓰는 중일 수 있으므로 캐시하지 않음 (초)
+_MIN_FILE_AGE = 2
+
+
+class HashCache(SqliteCacheBase):
+    """파일 해시값을 (장치, inode, 크기, 수정 시각) 키로 저장하는 영구 캐시
+
+    같은 파일은 수정되기 전까지 알고리즘마다 한 번만 해시가 계산됩니다.
+    """
+
+    @property
+    def table_name(self) -> str:
+        return "hash_cache"
+
+    @property
+    def schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS hash_cache (
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                algorithm TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                accessed_at INTEGER NOT NULL,
+                PRIMARY KEY (device, inode, algorithm)
+            );
+            CREATE INDEX IF NOT EXISTS hash_cache_accessed_at ON hash_cache (accessed_at);
+        """
+
+    def get(self, fileStat: utils.FileStat, algorithm: str) -> Optional[str]:
+        """캐시된 해시값을 가져옵니다. 파일 크기 또는 수정 시각이 달라진 항목은 즉시 제거됩니다.
+
+        Args:
+            fileStat (utils.FileStat): 파일 상태 정보
+            algorithm (str): 해시 알고리즘 이름
+
+        Returns:
+            Optional[str]: 해시값, 캐시되지 않았을 경우 None을 반환합니다.
+        """
+
+        key = (fileStat.device, fileStat.inode, algorithm)
+
+        with self._lock:
+            rows = self.execute(
+                "SELECT size, mtime_ns, digest FROM hash_cache WHERE device = ? AND inode = ? AND algorithm = ?", key
+            )
+            if len(rows) == 0:
+                return None
+
+            size, mtime_ns, digest = rows[0]
+            if (size, mtime_ns) != (fileStat.size, fileStat.mtime_ns):
+                self.execute("DELETE FROM hash_cache WHERE device = ? AND inode = ?", key[:2])
+                return None
+
+            self.execute(
+                "UPDATE hash_cache SET accessed_at = ? WHERE device = ? AND inode = ? AND algorithm = ?",
+                (int(time.time()), *key),
+            )
+
+        return digest
+
+    def set(self, fileStat: utils.FileStat, algorithm: str, digest: str):
+        """해시값을 캐시에 저장합니다.
+
+        Args:
+            fileStat (utils.FileStat): 해시 계산 시점의 파일 상태 정보
+            algorithm (str): 해시 알고리즘 이름
+            digest (str): 해시값
+        """
+
+        self.execute(
+            "INSERT OR REPLACE INTO hash_cache (device, inode, algorithm, size, mtime_ns, digest, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                fileStat.device,
+                fileStat.inode,
+                algorithm,
+                fileStat.size,
+                fileStat.mtime_ns,
+                digest,
+                int(time.time()),
+            ),
+        )
+
+
+_hash_cache: Optional[HashCache] = None
+_hash_cache_lock = threading.Lock()
+
+
+def get_hash_cache() -> Optional[HashCache]:
+    """전역 설정에 따라 공유 HashCache 인스턴스를 가져옵니다.
+
+    Returns:
+        Optional[HashCache]: 캐시를 사용하지 않을 경우 None을 반환합니다.
+    """
+
+    global _hash_cache
+
+    if not SETTINGS["enabled"]:
+        return None
+
+    with _hash_cache_lock:
+        if _hash_cache is None:
+            _hash_cache = HashCache(os.path.join(SETTINGS["dir"], "hash.sqlite3"))
+
+    return _hash_cache
+
+
+def get_cached_file_hash(filepath: str, algorithm: str, hashFunc: Callable[[], str]) -> str:
+    """파일의 해시값을 가져옵니다. 파일이 변경되지 않았다면 캐시된 값을 사용합니다.
+
+    해시 계산 도중 파일이 변경되었거나, 최근에 수정된 파일의 결과는 캐시하지 않습니다.
+
+    Args:
+        filepath (str): 파일 경로
+        algorithm (str): 해시 알고리즘 이름 (캐시 키로 사용됨)
+        hashFunc (Callable[[], str]): 캐시되지 않았을 경우, 해시값을 계산하는 함수
+
+    Returns:
+        str: 해시값
+    """
+
+    if (hash_cache := get_hash_cache()) is None:
+        return hashFunc()
+
+    try:
+        file_stat = utils.get_file_stat(filepath)
+        if (digest := hash_cache.get(file_stat, algorithm)) is not None:
+            return digest
+    except Exception:
+        file_stat = None
+        log.get_logger(get_cached_file_hash).warning("해시 캐시를 읽을 수 없습니다.", exc_info=True)
+
+    digest = hashFunc()
+
+    if file_stat is not None:
+        try:
+            if (
+                utils.get_file_stat(filepath) == file_stat
+                and time.time_ns() - file_stat.mtime_ns > _MIN_FILE_AGE * 1_000_000_000
+            ):
+                hash_cache.set(file_stat, algorithm, digest)
+        except Exception:
+            log.get_logger(get_cached_file_hash).warning("해시 캐시를 저장할 수 없습니다.", exc_info=True)
+
+    return digest
@@ -0,0 +1,241 @@
+import json
+import os
+import threading
+import time
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from py_media_compressor import log
+from py_media_compressor.cache.base import SETTINGS, SqliteCacheBase
+
+
+class JobJournalEntry(NamedTuple):
+    input_filepath: str
+    input_filesize: int
+    status: str
+    output_filepath: Optional[str]
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class JobJournal(SqliteCacheBase):
+    """작업 중인 파일들의 상태, 출력 경로 및 처리 시간을 기록하는 작업 기록
+
+    프로그램이 비정상 종료되거나 중단된 경우, 다음 실행에서 파일 검색 및 완료된 작업을 건너뛰고 이어서 작업할 수 있습니다.
+    상태는 FileTaskStatus 의 이름 (문자열) 으로 기록됩니다.
+    """
+
+    # 이어서 작업할 때, 다시 처리해야 하는 상태
+    # (ERROR 는 중단 시점에 실패로 기록된 작업을 포함하므로 다시 시도)
+    UNFINISHED_STATUSES = ("INIT", "WAITING", "PROCESSING", "SUSPEND", "ERROR")
+
+    @property
+    def table_name(self) -> str:
+        return "job_journal"
+
+    @property
+    def schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS job_journal (
+                input_filepath TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                input_filesize INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                output_filepath TEXT,
+                started_at REAL,
+                finished_at REAL,
+                accessed_at INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS job_journal_accessed_at ON job_journal (accessed_at);
+            CREATE TABLE IF NOT EXISTS job_journal_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """
+
+    def evict(self, maxEntries: Optional[int] = None, maxAgeDays: Optional[int] = None):
+        # 작업 기록은 새 작업을 시작할 때 초기화되므로, 진행 중인 기록의 일부가 제거되지 않도록 함
+        pass
+
+    def start(self, inputPaths: List[str]):
+        """이전 기록을 지우고, 새 작업 기록을 시작합니다.
+
+        Args:
+            inputPaths (List[str]): 입력 경로
+        """
+
+        with self._lock:
+            self.execute("DELETE FROM job_journal")
+            self.execute("DELETE FROM job_journal_meta")
+            self._set_meta("input_paths", json.dumps(inputPaths, ensure_ascii=False))
+            self._set_meta("discovery_completed", "0")
+
+    def get_input_paths(self) -> Optional[List[str]]:
+        """기록된 작업의 입력 경로를 가져옵니다.
+
+        Returns:
+            Optional[List[str]]: 입력 경로, 기록된 작업이 없을 경우 None을 반환합니다.
+        """
+
+        if (value := self._get_meta("input_paths")) is None:
+            return None
+        return json.loads(value)
+
+    def is_discovery_completed(self) -> bool:
+        return self._get_meta("discovery_completed") == "1"
+
+    def set_discovery_completed(self):
+        """모든 입력 파일이 기록되었음을 표시합니다. 이후 이어서 작업할 때, 파일 검색을 생략합니다."""
+
+        self._set_meta("discovery_completed", "1")
+
+    def add(self, sourceFiles: Iterable[Tuple[str, int]]):
+        """처리할 파일을 대기 상태로 기록합니다. 이미 기록된 파일은 무시됩니다.
+
+        Args:
+            sourceFiles (Iterable[Tuple[str, int]]): 파일 경로, 파일 크기
+        """
+
+        now = int(time.time())
+
+        with self._lock:
+            rows = self.execute("SELECT COALESCE(MAX(seq), 0) FROM job_journal")
+            start_seq = rows[0][0] + 1
+
+            self.executemany(
+                "INSERT OR IGNORE INTO job_journal (input_filepath, seq, input_filesize, status, accessed_at) "
+                "VALUES (?, ?, ?, 'WAITING', ?)",
+                (
+                    (filepath, seq, filesize, now)
+                    for seq, (filepath, filesize) in enumerate(sourceFiles, start=start_seq)
+                ),
+            )
+
+    def update(
+        self,
+        inputFilepath: str,
+        status: str,
+        outputFilepath: Optional[str] = None,
+        startedAt: Optional[float] = None,
+        finishedAt: Optional[float] = None,
+    ):
+        """파일의 상태를 기록합니다. None 으로 전달된 값은 기존 기록을 유지합니다.
+
+        Args:
+            inputFilepath (str): 입력 파일 경로
+            status (str): 상태 (FileTaskStatus 의 이름)
+            outputFilepath (Optional[str], optional): 출력 파일 경로. Defaults to None.
+            startedAt (Optional[float], optional): 처리 시작 시각 (초). Defaults to None.
+            finishedAt (Optional[float], optional): 처리 종료 시각 (초). Defaults to None.
+        """
+
+        self.execute(
+            "UPDATE job_journal SET status = ?, output_filepath = COALESCE(?, output_filepath), "
+            "started_at = COALESCE(?, started_at), finished_at = COALESCE(?, finished_at), accessed_at = ? "
+            "WHERE input_filepath = ?",
+            (status, outputFilepath, startedAt, finishedAt, int(time.time()), inputFilepath),
+        )
+
+    def update_many(self, inputFilepaths: Iterable[str], status: str):
+        """여러 파일의 상태를 한 번에 기록합니다.
+
+        Args:
+            inputFilepaths (Iterable[str]): 입력 파일 경로
+            status (str): 상태 (FileTaskStatus 의 이름)
+        """
+
+        now = int(time.time())
+
+        self.executemany(
+            "UPDATE job_journal SET status = ?, accessed_at = ? WHERE input_filepath = ?",
+            ((status, now, filepath) for filepath in inputFilepaths),
+        )
+
+    def get_entries(self, statuses: Optional[Iterable[str]] = None) -> List[JobJournalEntry]:
+        """기록된 파일을 기록된 순서대로 가져옵니다.
+
+        Args:
+            statuses (Optional[Iterable[str]], optional): 가져올 상태, None 일 경우 모든 상태. Defaults to None.
+
+        Returns:
+            List[JobJournalEntry]: 기록된 파일 리스트
+        """
+
+        sql = (
+            "SELECT input_filepath, input_filesize, status, output_filepath, started_at, finished_at FROM job_journal"
+        )
+        parameters = ()
+
+        if statuses is not None:
+            parameters = tuple(statuses)
+            sql += f" WHERE status IN ({', '.join('?' * len(parameters))})"
+
+        return [JobJournalEntry(*row) for row in self.execute(sql + " ORDER BY seq", parameters)]
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        rows = self.execute("SELECT value FROM job_journal_meta WHERE key = ?", (key,))
+        return rows[0][0] if len(rows) > 0 else None
+
+    def _set_meta(self, key: str, value: str):
+        self.execute("INSERT OR REPLACE INTO job_journal_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self.execute("DELETE FROM job_journal_meta")
+
+
+_job_journal: Optional[JobJournal] = None
+_job_journal_lock = threading.Lock()
+
+
+def get_job_journal() -> Optional[JobJournal]:
+    """전역 설정에 따라 공유 JobJournal 인스턴스를 가져옵니다.
+
+    Returns:
+        Optional[JobJournal]: 캐시를 사용하지 않을 경우 None을 반환합니다.
+    """
+
+    global _job_journal
+
+    if not SETTINGS["enabled"]:
+        return None
+
+    with _job_journal_lock:
+        if _job_journal is None:
+            _job_journal = JobJournal(os.path.join(SETTINGS["dir"], "journal.sqlite3"))
+
+    return _job_journal
+
+
+def record_job(
+    inputFilepath: str,
+    status: str,
+    outputFilepath: Optional[str] = None,
+    startedAt: Optional[float] = None,
+    finishedAt: Optional[float] = None,
+):
+    """작업 기록을 사용하는 경우, 파일의 상태를 기록합니다. 기록에 실패하더라도 작업은 계속 진행됩니다.
+
+    Args:
+        inputFilepath (str): 입력 파일 경로
+        status (str): 상태 (FileTaskStatus 의 이름)
+        outputFilepath (Optional[str], optional): 출력 파일 경로. Defaults to None.
+        startedAt (Optional[float], optional): 처리 시작 시각 (초). Defaults to None.
+        finishedAt (Optional[float], optional): 처리 종료 시각 (초). Defaults to None.
+    """
+
+    if (job_journal := get_job_journal()) is None:
+        return
+
+    try:
+        job_journal.update(
+            inputFilepath, status, outputFilepath=outputFilepath, startedAt=startedAt, finishedAt=finishedAt
+        )
+    except Exception:
+        log.get_logger(record_job).warning("작업 기록을 저장할 수 없습니다.", exc_info=True)
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import ffmpeg
+
+from py_media_compressor import log, utils
+from py_media_compressor.cache.base import SETTINGS, SqliteCacheBase
+
+
+class ProbeCache(SqliteCacheBase):
+    """ffprobe 결과를 (경로, 크기, 수정 시각, inode) 키로 저장하는 영구 캐시"""
+
+    @property
+    def table_name(self) -> str:
+        return "probe_cache"
+
+    @property
+    def schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS probe_cache (
+                filepath TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                probe_info TEXT NOT NULL,
+                accessed_at INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS probe_cache_accessed_at ON probe_cache (accessed_at);
+        """
+
+    def get(self, filepath: str, fileStat: Optional[utils.FileStat] = None) -> Optional[Dict]:
+        """캐시된 ffprobe 결과를 가져옵니다.
+
+        파일이 변경되어 키가 일치하지 않는 항목은 즉시 제거됩니다.
+
+        Args:
+            filepath (str): 파일 경로
+            fileStat (Optional[utils.FileStat], optional): 파일 상태 정보. Defaults to None. (None 일 경우, 직접 조회)
+
+        Returns:
+            Optional[Dict]: ffprobe 결과, 캐시되지 않았을 경우 None을 반환합니다.
+        """
+
+        filepath = os.path.abspath(filepath)
+        if fileStat is None:
+            fileStat = utils.get_file_stat(filepath)
+
+        with self._lock:
+            rows = self.execute("SELECT size, mtime_ns, inode, probe_info FROM probe_cache WHERE filepath = ?", (filepath,))
+            if len(rows) == 0:
+                return None
+
+            size, mtime_ns, inode, probe_info = rows[0]
+            if (size, mtime_ns, inode) != (fileStat.size, fileStat.mtime_ns, fileStat.inode):
+                self.execute("DELETE FROM probe_cache WHERE filepath = ?", (filepath,))
+                return None
+
+            self.execute("UPDATE probe_cache SET accessed_at = ? WHERE filepath = ?", (int(time.time()), filepath))
+
+        return json.loads(probe_info)
+
+    def set(self, filepath: str, probeInfo: Dict, fileStat: Optional[utils.FileStat] = None):
+        """ffprobe 결과를 캐시에 저장합니다.
+
+        Args:
+            filepath (str): 파일 경로
+            probeInfo (Dict): ffprobe 결과
+            fileStat (Optional[utils.FileStat], optional): 파일 상태 정보. Defaults to None. (None 일 경우, 직접 조회)
+        """
+
+        filepath = os.path.abspath(filepath)
+        if fileStat is None:
+            fileStat = utils.get_file_stat(filepath)
+
+        self.execute(
+            "INSERT OR REPLACE INTO probe_cache (filepath, size, mtime_ns, inode, probe_info, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                filepath,
+                fileStat.size,
+                fileStat.mtime_ns,
+                fileStat.inode,
+                json.dumps(probeInfo, ensure_ascii=False),
+                int(time.time()),
+            ),
+        )
+
+
+_probe_cache: Optional[ProbeCache] = None
+_probe_cache_lock = threading.Lock()
+
+
+def get_probe_cache() -> Optional[ProbeCache]:
+    """전역 설정에 따라 공유 ProbeCache 인스턴스를 가져옵니다.
+
+    Returns:
+        Optional[ProbeCache]: 캐시를 사용하지 않을 경우 None을 반환합니다.
+    """
+
+    global _probe_cache
+
+    if not SETTINGS["enabled"]:
+        return None
+
+    with _probe_cache_lock:
+        if _probe_cache is None:
+            _probe_cache = ProbeCache(os.path.join(SETTINGS["dir"], "probe.sqlite3"))
+
+    return _probe_cache
+
+
+def get_probe_info(filepath: str) -> Dict:
+    """파일의 ffprobe 결과를 가져옵니다. 파일이 변경되지 않았다면 캐시된 결과를 사용합니다.
+
+    Args:
+        filepath (str): 파일 경로
+
+    Returns:
+        Dict: ffprobe 결과
+    """
+
+    if (probe_cache := get_probe_cache()) is None:
+        return ffmpeg.probe(filepath)
+
+    try:
+        file_stat = utils.get_file_stat(filepath)
+        if (probe_info := probe_cache.get(filepath, fileStat=file_stat)) is not None:
+            return probe_info
+    except Exception:
+        file_stat = None
+        log.get_logger(get_probe_info).warning("Probe 캐시를 읽을 수 없습니다.", exc_info=True)
+
+    probe_info = ffmpeg.probe(filepath)
+
+    if file_stat is not None:
+        try:
+            probe_cache.set(filepath, probe_info, fileStat=file_stat)
+        except Exception:
+            log.get_logger(get_probe_info).warning("Probe 캐시를 저장할 수 없습니다.", exc_info=True)
+
+    return probe_info
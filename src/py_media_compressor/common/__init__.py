@@ -1,4 +1,4 @@
-from .base import DictBase, DictDataBase, DictDataExtendBase
+from .base import DictBase, DictDataBase, DictDataExtendBase, DictField
 from .progress import run_ffmpeg_process_with_msg_queue
 
-__all__ = ["DictBase", "DictDataBase", "DictDataExtendBase", "run_ffmpeg_process_with_msg_queue"]
+__all__ = ["DictBase", "DictDataBase", "DictDataExtendBase", "DictField", "run_ffmpeg_process_with_msg_queue"]
@@ -1,12 +1,16 @@
-import inspect
+import sys
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
-from typing import Any, Dict, Union
+from typing import Any, Dict, Generic, Optional, TypeVar, Union
 
 from py_media_compressor.utils import pformat
 
+T = TypeVar("T")
+
 
 class DictBase(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def _as_dict(self) -> Dict[str, Any]:
         pass
@@ -34,7 +38,8 @@ class DictDataBase(DictBase):
         return self._data
 
     def __get_func_name(self, deep: int = 2):
-        return inspect.stack(0)[deep][3]
+        # 호출한 속성 이름 (inspect.stack 은 모든 프레임의 소스 파일을 읽으므로 사용하지 않음)
+        return sys._getframe(deep).f_code.co_name
 
     def _get_value(self, key: Union[str, None] = None, default=None, deep: int = 2):
         return self._data.get(self.__get_func_name(deep=deep) if (key is None) else key, default)
@@ -62,3 +67,36 @@ class DictDataExtendBase(DictDataBase):
 
     def __delitem__(self, key: str):
         del self._data[key]
+
+
+class DictField(Generic[T]):
+    """DictDataBase 의 _data 항목을 속성으로 노출하는 디스크립터
+
+    _get_value / _set_value 와 달리 호출 스택으로 항목 이름을 찾지 않으므로, 속성 접근 비용이 일반 속성과 비슷합니다.
+    """
+
+    def __init__(self, key: Optional[str] = None, default: Any = None, readonly: bool = True) -> None:
+        """
+        Args:
+            key (Optional[str], optional): _data 항목 이름, None 일 경우 속성 이름을 사용합니다. Defaults to None.
+            default (Any, optional): 항목이 없을 경우 반환할 값. Defaults to None.
+            readonly (bool, optional): 읽기 전용 여부. Defaults to True.
+        """
+
+        self._key = key
+        self._default = default
+        self._readonly = readonly
+
+    def __set_name__(self, owner, name: str):
+        if self._key is None:
+            self._key = name
+
+    def __get__(self, instance: Optional[DictDataBase], owner=None) -> T:
+        if instance is None:
+            return self
+        return instance._data.get(self._key, self._default)
+
+    def __set__(self, instance: DictDataBase, value: T):
+        if self._readonly:
+            raise AttributeError(f"읽기 전용 속성입니다. ({self._key})")
+        instance._data[self._key] = value
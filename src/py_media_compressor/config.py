@@ -0,0 +1,184 @@
+import os
+import threading
+from copy import deepcopy
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import yaml
+
+from py_media_compressor import log, utils
+from py_media_compressor.const import FILE_EXT_FILTER_LIST
+
+# libyaml 을 사용할 수 없는 환경에서는 순수 Python 구현을 사용
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ConfigField(NamedTuple):
+    types: Tuple[type, ...]
+    default: Any = None
+    item_type: Optional[type] = None
+
+
+# 설정 파일 스키마 (항목 이름: 허용 타입, 항목이 없거나 None 을 허용하지 않는 항목이 None 일 경우의 기본값, 리스트 요소 타입)
+ConfigSchema = Dict[str, ConfigField]
+
+USER_ARGS_SCHEMA: ConfigSchema = {
+    "copy": ConfigField(types=(dict,), default={}),
+    "not_copy": ConfigField(types=(dict,), default={}),
+}
+
+# exts 가 None 일 경우, 확장자로 걸러내지 않음
+EXT_FILTER_SCHEMA: ConfigSchema = {
+    "exts": ConfigField(types=(list, type(None)), item_type=str),
+}
+
+
+def validate_config(config: Any, schema: ConfigSchema, filepath: str = "") -> Dict:
+    """설정이 스키마를 만족하는지 확인하고, 없는 항목은 기본값으로 채웁니다.
+
+    Args:
+        config (Any): 불러온 설정
+        schema (ConfigSchema): 설정 스키마
+        filepath (str, optional): 오류 메시지에 표시할 설정 파일 경로. Defaults to "".
+
+    Raises:
+        ValueError: 설정이 스키마를 만족하지 않을 경우
+
+    Returns:
+        Dict: 검사된 설정
+    """
+
+    if config is None:
+        config = {}
+
+    if not isinstance(config, dict):
+        raise ValueError(f"설정 파일의 최상위 항목은 Dict 여야 합니다.\nFilepath: {filepath}\nConfig: {utils.pformat(config)}")
+
+    for key, field in schema.items():
+        value = config.get(key)
+
+        if value is None and type(None) not in field.types:
+            config[key] = deepcopy(field.default)
+            continue
+
+        if not isinstance(value, field.types):
+            raise ValueError(
+                f"설정 항목의 타입이 올바르지 않습니다. ({key}: {', '.join(t.__name__ for t in field.types)})\n"
+                f"Filepath: {filepath}\nValue: {utils.pformat(value)}"
+            )
+
+        if field.item_type is not None and isinstance(value, list):
+            if len(invalid_items := [item for item in value if not isinstance(item, field.item_type)]) > 0:
+                raise ValueError(
+                    f"설정 항목의 요소 타입이 올바르지 않습니다. ({key}: {field.item_type.__name__})\n"
+                    f"Filepath: {filepath}\nItems: {utils.pformat(invalid_items)}"
+                )
+
+    return config
+
+
+class ConfigFile:
+    """YAML 설정 파일을 한 번만 읽어 캐시하고, 파일이 변경된 경우에만 다시 읽습니다.
+
+    파일이 없을 경우 기본 설정으로 파일을 생성합니다.
+    실행 도중 변경된 설정이 올바르지 않을 경우, 이전 설정을 계속 사용합니다.
+    """
+
+    def __init__(self, filepath: str, schema: ConfigSchema, default: Dict) -> None:
+        """
+        Args:
+            filepath (str): 설정 파일 경로
+            schema (ConfigSchema): 설정 스키마
+            default (Dict): 설정 파일이 없을 경우 생성할 기본 설정
+        """
+
+        self._filepath = filepath
+        self._schema = schema
+        self._default = default
+        self._lock = threading.Lock()
+
+        self._stat: Optional[utils.FileStat] = None
+        self._config: Optional[Dict] = None
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def __get_stat(self) -> Optional[utils.FileStat]:
+        try:
+            return utils.get_file_stat(self._filepath)
+        except FileNotFoundError:
+            return None
+
+    def get(self) -> Dict:
+        """설정을 가져옵니다. 마지막으로 읽은 이후 파일이 변경된 경우에만 다시 읽고 검사합니다.
+
+        반환된 설정은 여러 호출에서 공유되므로 변경하지 않습니다.
+
+        Raises:
+            ValueError: 처음 읽은 설정이 스키마를 만족하지 않을 경우
+
+        Returns:
+            Dict: 검사된 설정
+        """
+
+        with self._lock:
+            file_stat = self.__get_stat()
+
+            if self._config is not None and file_stat == self._stat:
+                return self._config
+
+            logger = log.get_logger(self.get)
+
+            if file_stat is None:
+                utils.save_config(self._default, self._filepath)
+                file_stat = self.__get_stat()
+                config = validate_config(deepcopy(self._default), self._schema, self._filepath)
+                logger.debug(f"기본 설정 파일 생성 완료\nFilepath: {self._filepath}")
+            else:
+                try:
+                    with open(self._filepath, "r", encoding="utf-8") as f:
+                        config = validate_config(yaml.load(f, Loader=_YAML_LOADER), self._schema, self._filepath)
+                    logger.debug(f"설정 파일 로드 완료\nFilepath: {self._filepath}")
+                except Exception:
+                    if self._config is None:
+                        raise
+
+                    # 다시 변경되기 전까지 같은 경고를 반복하지 않음
+                    logger.warning(
+                        f"변경된 설정 파일을 불러오지 못했습니다. 이전 설정을 사용합니다.\nFilepath: {self._filepath}",
+                        exc_info=True,
+                    )
+                    config = self._config
+
+            self._stat = file_stat
+            self._config = config
+
+            return config
+
+
+_user_args_config = ConfigFile(
+    os.path.join("config", "user_args.yaml"), USER_ARGS_SCHEMA, default={"copy": {}, "not_copy": {}}
+)
+_ext_filter_config = ConfigFile(
+    os.path.join("config", "filter.yaml"), EXT_FILTER_SCHEMA, default={"exts": FILE_EXT_FILTER_LIST}
+)
+
+
+def get_user_args_config() -> Dict:
+    """사용자 지정 인수 설정 (config/user_args.yaml) 을 가져옵니다.
+
+    Returns:
+        Dict: copy (스트림 복사 시 사용), not_copy (인코딩 시 사용) 인수
+    """
+
+    return _user_args_config.get()
+
+
+def get_ext_filter_config() -> Dict:
+    """파일 확장자 필터 설정 (config/filter.yaml) 을 가져옵니다.
+
+    Returns:
+        Dict: exts (검색할 확장자 리스트, None 일 경우 모든 파일)
+    """
+
+    return _ext_filter_config.get()
@@ -6,6 +6,21 @@ PROCESSER_TAG_END = "AMCP_END"
 IGNORE_STREAM_FILTER = ["png", "mjpeg", "bmp"]
 
 
+# libx264, libx265 인코더 프리셋 (느릴수록 같은 crf 에서 출력 크기가 작아짐)
+ENCODER_PRESET_LIST = [
+    "ultrafast",
+    "superfast",
+    "veryfast",
+    "faster",
+    "fast",
+    "medium",
+    "slow",
+    "slower",
+    "veryslow",
+    "placebo",
+]
+
+
 # 사용자 지정 파일확장자 필터
 FILE_EXT_FILTER_LIST = [
     ".3gp",
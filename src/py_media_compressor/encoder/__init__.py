@@ -7,12 +7,33 @@ from .args_builder import (
     add_user_args,
     add_video_args,
 )
-from .encoder import convert_SI2FI, get_source_file, media_compress_encode
+from .dedup import Deduplicator
+from .encoder import (
+    convert_SI2FI,
+    convert_SI2FR,
+    convert_source_info,
+    convert_source_record,
+    get_source_file,
+    iter_source_files,
+    media_compress_encode,
+)
+from .prefilter import filter_processed_files, is_processed_file
+from .scheduler import estimate_makespan, get_encode_cost, schedule_by_cost
 
 __all__ = [
     "media_compress_encode",
     "get_source_file",
+    "iter_source_files",
     "convert_SI2FI",
+    "convert_SI2FR",
+    "convert_source_info",
+    "convert_source_record",
+    "Deduplicator",
+    "filter_processed_files",
+    "is_processed_file",
+    "get_encode_cost",
+    "estimate_makespan",
+    "schedule_by_cost",
     "add_auto_args",
     "add_stream_copy_args",
     "add_format_args",
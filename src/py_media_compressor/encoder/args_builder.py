@@ -1,14 +1,39 @@
+import functools
 import math
 import os
+import uuid
 from time import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from py_media_compressor import log, utils, version
+from py_media_compressor import config, log, utils, version
 from py_media_compressor.const import PROCESSER_NAME, PROCESSER_TAG_END
-from py_media_compressor.model import FFmpegArgs
+from py_media_compressor.model import EncodeOption, FFmpegArgs
 from py_media_compressor.model.enum import FileTaskStatus, LogLevel
 
 _is_libfdk_aac_enabled = None
 
+# 비디오 스트림 인코딩에만 사용되는 인수 (구간 분할 인코딩, CRF 탐색 시 비디오 인수를 구분하는 데 사용)
+VIDEO_ARG_KEYS = frozenset(
+    [
+        "c:v",
+        "vcodec",
+        "crf",
+        "preset",
+        "tune",
+        "level",
+        "pix_fmt",
+        "vf",
+        "r",
+        "g",
+        "bf",
+        "maxrate",
+        "bufsize",
+        "threads",
+        "x264-params",
+        "x265-params",
+    ]
+)
+
 
 def _status_changer(func):
     def wrapper_function(**kwargs):
@@ -77,6 +102,36 @@ def add_format_args(ffmpegArgs: FFmpegArgs):
     logger.debug(f"포멧 인수 추가\nArgs: {ffmpegArgs}\nFileInfo: {ffmpegArgs.file_info}")
 
 
+@functools.lru_cache(maxsize=None)
+def get_video_codec_args(encodeOption: EncodeOption) -> Tuple[Tuple[str, Any], ...]:
+    """인코드 옵션에만 의존하는 비디오 인코더 인수를 만듭니다. 같은 인코드 옵션에 대해서는 한 번만 계산합니다.
+
+    Args:
+        encodeOption (EncodeOption): 인코드 옵션
+
+    Returns:
+        Tuple[Tuple[str, Any], ...]: (인수 이름, 값) 목록
+    """
+
+    codec_args = []
+
+    compression_mode = encodeOption.codec
+    if compression_mode == "h.264":
+        codec_args.append(("c:v", "libx264"))
+    elif compression_mode == "h.265":
+        codec_args.append(("c:v", "libx265"))
+    codec_args.append(("crf", encodeOption.crf))
+    codec_args.append(("preset", encodeOption.preset))
+
+    # 동시에 여러 작업을 실행할 경우, CPU 과다 점유를 막기 위해 스레드 수를 명시
+    if (threads := encodeOption.threads) > 0:
+        codec_args.append(("threads", threads))
+        if compression_mode == "h.265":
+            codec_args.append(("x265-params", f"pools={threads}"))
+
+    return tuple(codec_args)
+
+
 @_status_changer
 def add_video_args(ffmpegArgs: FFmpegArgs):
     """비디오 인수 추가"""
@@ -84,13 +139,8 @@ def add_video_args(ffmpegArgs: FFmpegArgs):
     logger = log.get_logger(add_video_args)
 
     if not ffmpegArgs.is_only_audio:
-        compression_mode = ffmpegArgs.encode_option.codec
-        if compression_mode == "h.264":
-            ffmpegArgs["c:v"] = "libx264"
-        elif compression_mode == "h.265":
-            ffmpegArgs["c:v"] = "libx265"
-        ffmpegArgs["crf"] = ffmpegArgs.encode_option.crf
-        ffmpegArgs["preset"] = "slower"
+        for key, value in get_video_codec_args(ffmpegArgs.encode_option):
+            ffmpegArgs[key] = value
 
         # 세로 또는 가로 픽셀 수가 짝수가 아닐 경우 발생하는 오류 처리 포함
         if (width := ffmpegArgs.video_stream.get("width")) is None:
@@ -155,45 +205,23 @@ def add_metadata_args(ffmpegArgs: FFmpegArgs):
 
     logger = log.get_logger(add_metadata_args)
 
-    if "format" in ffmpegArgs.probe_info and (tags := ffmpegArgs.probe_info["format"].get("tags")) is not None:
-        _tags = tags
-        tags = {}
-        for key, value in _tags.items():
-            tags[key.lower()] = value
-        del _tags
-    else:
-        tags = {}
-
-    is_ver_tag_exist = False
+    tags = get_format_tags(ffmpegArgs.probe_info)
 
-    start_idx = -1
-    end_idx = -1
-    metadata_lines = []
-    comment_lines = []
-    if not utils.is_str_empty_or_space(comment := tags.get("comment", "")):
-        comment_lines = comment.splitlines(keepends=False)
-        for idx, c in enumerate(comment_lines):
-            if c.startswith(PROCESSER_NAME):
-                start_idx = idx
-                is_ver_tag_exist = True
-            elif c.startswith(PROCESSER_TAG_END):
-                end_idx = idx
-                break
-        if is_ver_tag_exist:
-            if end_idx > 0:
-                metadata_lines = comment_lines[start_idx + 1 : end_idx]
-                comment_lines = comment_lines[:start_idx] + comment_lines[end_idx + 1 :]
-            else:
-                comment_lines = comment_lines[:start_idx]
+    is_ver_tag_exist, metadatas, comment_lines = parse_processed_comment(tags.get("comment", ""))
 
-    metadatas = {}
-    if is_ver_tag_exist:
-        for line in metadata_lines:
-            key, value = line.split("=")
-            metadatas[key.strip().lower()] = value.strip()
-    else:
+    if not is_ver_tag_exist:
         metadatas["amcp_input_filesize"] = ffmpegArgs.file_info.input_filesize
-        metadatas["amcp_input_file_MD5"] = ffmpegArgs.file_info.input_file_MD5
+
+        ffmpegArgs.input_hash_placeholder = None
+        if ffmpegArgs.encode_option.is_hash_while_encoding:
+            if (input_file_MD5 := ffmpegArgs.file_info.get_known_input_file_MD5()) is None:
+                # MD5 해시와 같은 길이의 자리 표시자를 기록하고, 인코딩이 끝난 뒤 실제 해시값으로 교체
+                input_file_MD5 = ffmpegArgs.input_hash_placeholder = uuid.uuid4().hex
+        else:
+            input_file_MD5 = ffmpegArgs.file_info.input_file_MD5
+
+        metadatas["amcp_input_file_MD5"] = input_file_MD5
+        metadatas["amcp_hash_algorithm"] = "md5"
 
     metadatas["amcp_encoded_date"] = int(time())
     metadatas["amcp_ver"] = version.metadata_version
@@ -237,37 +265,89 @@ def add_metadata_args(ffmpegArgs: FFmpegArgs):
     logger.debug(f"메타데이터 인수 추가\nArgs: {ffmpegArgs}\nMetadatas: {utils.pformat(metadatas)}")
 
 
-@_status_changer
-def add_user_args(ffmpegArgs: FFmpegArgs):
-    """사용자 지정 인수 추가"""
+def is_video_arg(key: str) -> bool:
+    """비디오 스트림 인코딩에만 사용되는 인수인지 확인합니다.
 
-    logger = log.get_logger(add_user_args)
+    Args:
+        key (str): ffmpeg 인수 이름
 
-    # 사용자 지정 인수 로드
-    user_args_config_filepath = os.path.join("config", "user_args.yaml")
-    if os.path.isfile(user_args_config_filepath):
-        user_args = utils.load_config(user_args_config_filepath)
+    Returns:
+        bool: 비디오 인수일 경우 True를 반환합니다.
+    """
+
+    return key in VIDEO_ARG_KEYS or key.endswith(":v")
+
+
+def get_format_tags(probeInfo: Dict) -> Dict[str, str]:
+    """ffprobe 결과에서 컨테이너 태그를 가져옵니다. (키는 소문자로 변환됨)
+
+    Args:
+        probeInfo (Dict): ffprobe 결과
+
+    Returns:
+        Dict[str, str]: 컨테이너 태그
+    """
+
+    if "format" in probeInfo and (tags := probeInfo["format"].get("tags")) is not None:
+        return {key.lower(): value for key, value in tags.items()}
     else:
-        user_args = {"copy": {}, "not_copy": {}}
-        utils.save_config(user_args, user_args_config_filepath)
+        return {}
+
+
+def parse_processed_comment(comment: Optional[str]) -> Tuple[bool, Dict[str, str], List[str]]:
+    """Comment 메타데이터에서 해당 프로젝트의 처리 표식을 분석합니다.
+
+    Args:
+        comment (Optional[str]): Comment 메타데이터
+
+    Returns:
+        Tuple[bool, Dict[str, str], List[str]]: 처리 표식 존재 여부, 표식 내의 메타데이터, 표식을 제외한 Comment 줄 리스트
+    """
 
-    copy_user_args = user_args.get("copy")
-    not_copy_user_args = user_args.get("not_copy")
+    is_ver_tag_exist = False
 
-    if copy_user_args is None:
-        copy_user_args = {}
-    if not_copy_user_args is None:
-        not_copy_user_args = {}
+    start_idx = -1
+    end_idx = -1
+    metadata_lines = []
+    comment_lines = []
+    if not utils.is_str_empty_or_space(comment):
+        comment_lines = comment.splitlines(keepends=False)
+        for idx, c in enumerate(comment_lines):
+            if c.startswith(PROCESSER_NAME):
+                start_idx = idx
+                is_ver_tag_exist = True
+            elif c.startswith(PROCESSER_TAG_END):
+                end_idx = idx
+                break
+        if is_ver_tag_exist:
+            if end_idx > 0:
+                metadata_lines = comment_lines[start_idx + 1 : end_idx]
+                comment_lines = comment_lines[:start_idx] + comment_lines[end_idx + 1 :]
+            else:
+                comment_lines = comment_lines[:start_idx]
+
+    metadatas = {}
+    for line in metadata_lines:
+        key, value = line.split("=")
+        metadatas[key.strip().lower()] = value.strip()
+
+    return (is_ver_tag_exist, metadatas, comment_lines)
+
+
+@_status_changer
+def add_user_args(ffmpegArgs: FFmpegArgs):
+    """사용자 지정 인수 추가"""
+
+    logger = log.get_logger(add_user_args)
 
-    assert isinstance(copy_user_args, dict) and isinstance(
-        not_copy_user_args, dict
-    ), f"사용자 지정 인수에 문제가 있습니다. \nArgs: {utils.pformat(user_args)}"
+    # 사용자 지정 인수 로드 (설정 파일이 변경된 경우에만 다시 읽음)
+    user_args = config.get_user_args_config()
 
     if ffmpegArgs.is_streamcopy:
-        for karg, varg in copy_user_args.items():
+        for karg, varg in user_args["copy"].items():
             ffmpegArgs[karg] = varg
     else:
-        for karg, varg in not_copy_user_args.items():
+        for karg, varg in user_args["not_copy"].items():
             ffmpegArgs[karg] = varg
 
     logger.debug(f"사용자 지정 인수 추가\nUserArgs: {utils.pformat(user_args)}")
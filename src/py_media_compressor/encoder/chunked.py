@@ -0,0 +1,364 @@
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+import ffmpeg
+import psutil
+from tqdm import tqdm
+
+from py_media_compressor import log, utils
+from py_media_compressor.common import progress
+from py_media_compressor.const import IGNORE_STREAM_FILTER
+from py_media_compressor.encoder import args_builder
+from py_media_compressor.encoder.estimator import SIZE_SKIP_OFFSET, is_projected_oversize, project_output_size
+from py_media_compressor.model import FFmpegArgs
+from py_media_compressor.model.enum import FileTaskStatus
+
+# 구간 하나의 최소 길이 (초), 짧은 파일은 분할하지 않음
+MIN_CHUNK_DURATION = 30.0
+
+
+def _get_media_streams(ffmpegArgs: FFmpegArgs) -> List[Dict]:
+    return [
+        stm
+        for stm in ffmpegArgs.probe_info["streams"]
+        if str(stm.get("codec_type", "")).lower() in ["video", "audio"]
+        and str(stm.get("codec_name", "")).lower() not in IGNORE_STREAM_FILTER
+    ]
+
+
+def is_chunkable(ffmpegArgs: FFmpegArgs) -> bool:
+    """구간 분할 병렬 인코딩을 사용할 수 있는지 확인합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        bool: 사용할 수 있을 경우 True를 반환합니다.
+    """
+
+    if ffmpegArgs.encode_option.chunks < 2 or ffmpegArgs.is_only_audio or ffmpegArgs.is_streamcopy:
+        return False
+
+    if len([stm for stm in _get_media_streams(ffmpegArgs) if stm["codec_type"] == "video"]) != 1:
+        return False
+
+    try:
+        duration = float(ffmpegArgs.probe_info["format"]["duration"])
+    except (KeyError, ValueError):
+        return False
+
+    return duration >= MIN_CHUNK_DURATION * 2
+
+
+def get_split_points(
+    filepath: str, videoStreamIndex: int, duration: float, startTime: float, chunks: int
+) -> List[float]:
+    """파일을 나눌 위치를 키프레임 기준으로 계산합니다.
+
+    나눌 위치마다 가장 가까운 이전 키프레임 하나만 읽으므로, 파일 전체를 읽지 않습니다.
+
+    Args:
+        filepath (str): 파일 경로
+        videoStreamIndex (int): 비디오 스트림 인덱스
+        duration (float): 파일 재생 시간 (초)
+        startTime (float): 파일 시작 시각 (초)
+        chunks (int): 목표 구간 수
+
+    Returns:
+        List[float]: 나눌 위치 (파일 시작 기준, 초), 첫 위치 (0) 는 포함하지 않습니다.
+    """
+
+    logger = log.get_logger(get_split_points)
+
+    targets = [duration * idx / chunks for idx in range(1, chunks)]
+
+    try:
+        probe_info = ffmpeg.probe(
+            filepath,
+            select_streams=str(videoStreamIndex),
+            read_intervals=",".join(f"{startTime + target:.3f}%+#1" for target in targets),
+            show_entries="packet=pts_time,flags",
+        )
+        split_points = {
+            round(float(packet["pts_time"]) - startTime, 6)
+            for packet in probe_info.get("packets", [])
+            if "K" in packet.get("flags", "") and packet.get("pts_time") not in (None, "N/A")
+        }
+    except Exception:
+        logger.warning("키프레임 위치를 확인할 수 없습니다. 같은 길이로 나눕니다.", exc_info=True)
+        return targets
+
+    return sorted(point for point in split_points if MIN_CHUNK_DURATION <= point <= duration - MIN_CHUNK_DURATION)
+
+
+def _set_x265_param(x265Params: Optional[str], key: str, value) -> str:
+    params = [param for param in (x265Params or "").split(":") if param and param.split("=", 1)[0] != key]
+    params.append(f"{key}={value}")
+    return ":".join(params)
+
+
+def _write_concat_list(filepath: str, segmentFilepaths: List[str]):
+    with open(filepath, "w", encoding="utf-8") as f:
+        for segment_filepath in segmentFilepaths:
+            escaped_filepath = os.path.abspath(segment_filepath).replace("'", "'\\''")
+            f.write(f"file '{escaped_filepath}'\n")
+
+
+def encode_chunked(ffmpegArgs: FFmpegArgs, inputArgs: Optional[Dict] = None, isCanSkip: bool = True):
+    """입력 파일을 여러 구간으로 나누어 비디오를 동시에 인코딩한 뒤, 무손실로 합칩니다.
+
+    비디오 구간은 같은 인수로 각각 별도의 ffmpeg 프로세스에서 인코딩되며, 오디오는 구간을 합칠 때 한 번만 인코딩됩니다.
+    크기 초과 작업 통과 (size_skip) 는 모든 구간의 출력 크기 합계로 판단하며, 일시정지 입력은 모든 구간 프로세스에 적용됩니다.
+    실패할 경우, media_compress_encode 와 같은 방식으로 상태를 변경하고 예외를 발생시킵니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+        inputArgs (Optional[Dict], optional): 입력 파일 인수. Defaults to None.
+        isCanSkip (bool, optional): 크기 초과 시 작업을 통과시킬 수 있는지 여부 (args_builder.pass_filter). Defaults to True.
+    """
+
+    logger = log.get_logger(encode_chunked)
+
+    if inputArgs is None:
+        inputArgs = {}
+
+    file_info = ffmpegArgs.file_info
+    encode_option = ffmpegArgs.encode_option
+    media_streams = _get_media_streams(ffmpegArgs)
+    video_stream_index = next(stm["index"] for stm in media_streams if stm["codec_type"] == "video")
+
+    duration = float(ffmpegArgs.probe_info["format"]["duration"])
+    start_time = float(ffmpegArgs.probe_info["format"].get("start_time", 0) or 0)
+    chunks = min(encode_option.chunks, max(int(duration // MIN_CHUNK_DURATION), 1))
+
+    split_points = get_split_points(file_info.input_filepath, video_stream_index, duration, start_time, chunks)
+    segment_ends: List[Optional[float]] = [*split_points, None]
+    segments: List[Tuple[float, Optional[float]]] = list(zip([0.0, *split_points], segment_ends))
+
+    ffmpeg_args_dict = ffmpegArgs.as_dict()
+    video_args = {key: value for key, value in ffmpeg_args_dict.items() if args_builder.is_video_arg(key)}
+    output_args = {key: value for key, value in ffmpeg_args_dict.items() if not args_builder.is_video_arg(key)}
+    output_args["c:v"] = "copy"
+
+    # 구간마다 CPU 를 나누어 사용
+    if (threads := encode_option.threads) == 0:
+        threads = os.cpu_count() or 1
+    threads_per_chunk = max(threads // len(segments), 1)
+    video_args["threads"] = threads_per_chunk
+    if video_args.get("c:v") == "libx265" or "x265-params" in video_args:
+        # 사용자 지정 x265 인수는 유지하고 pools 만 변경
+        video_args["x265-params"] = _set_x265_param(video_args.get("x265-params"), "pools", threads_per_chunk)
+
+    logger.info(f"구간 분할 병렬 인코딩, 구간 수: {len(segments)}, 구간당 스레드 수: {threads_per_chunk}")
+    logger.debug(f"구간 정보: {segments}")
+
+    output_dirpath = os.path.dirname(os.path.abspath(file_info.output_filepath))
+    temp_dirpath = tempfile.mkdtemp(prefix=".amcp_chunks_", dir=output_dirpath)
+
+    processes = []
+    processes_lock = threading.Lock()
+    stop_event = threading.Event()
+    pause_state = {"is_pause": False}
+    control_queue = queue.Queue()
+
+    is_size_skip_enabled = isCanSkip and encode_option.is_size_skip
+    # 구간별 (출력 크기, 인코딩된 재생 시간)
+    segment_progress: List[Tuple[int, float]] = [(0, 0.0)] * len(segments)
+    size_skip_event = threading.Event()
+    bar = (
+        tqdm(total=round(duration, 2), leave=encode_option.leave, dynamic_ncols=True)
+        if encode_option.use_progressbar
+        else None
+    )
+    progress_lock = threading.Lock()
+
+    def set_process_pause(process, isPause: bool):
+        if process.poll() is not None:
+            return
+        try:
+            if isPause:
+                psutil.Process(process.pid).suspend()
+            else:
+                psutil.Process(process.pid).resume()
+        except psutil.NoSuchProcess:
+            pass
+
+    def set_processes_pause(isPause: bool):
+        with processes_lock:
+            pause_state["is_pause"] = isPause
+            for process in processes:
+                set_process_pause(process, isPause)
+
+    def size_skip_check():
+        if size_skip_event.is_set():
+            return
+
+        with progress_lock:
+            current_size = sum(size for size, _ in segment_progress)
+            current_time = sum(time for _, time in segment_progress)
+
+        if current_size > file_info.input_filesize + SIZE_SKIP_OFFSET:
+            logger.info(f"[size_skip] input size > output size. ({current_size} > {file_info.input_filesize})")
+        elif is_projected_oversize(
+            current_size,
+            current_time,
+            duration,
+            file_info.input_filesize,
+            warmup=encode_option.size_skip_warmup,
+            margin=encode_option.size_skip_margin,
+        ):
+            logger.info(
+                (
+                    f"[size_skip] projected output size > input size. "
+                    f"({int(project_output_size(current_size, current_time, duration))} > "
+                    f"{file_info.input_filesize}, progress: {round(current_time, 2)}/{round(duration, 2)}s)"
+                )
+            )
+        else:
+            return
+
+        size_skip_event.set()
+        control_queue.put("pass")
+
+    def encode_segment(idx: int, start: float, end: Optional[float]) -> str:
+        segment_filepath = os.path.join(temp_dirpath, f"segment_{idx:04d}.mp4")
+
+        segment_input_args = dict(inputArgs)
+        if "threads" in segment_input_args:
+            segment_input_args["threads"] = threads_per_chunk
+        segment_input_args["ss"] = f"{start:.6f}"
+        if end is not None:
+            segment_input_args["t"] = f"{end - start:.6f}"
+
+        stream = ffmpeg.input(file_info.input_filepath, **segment_input_args)[str(video_stream_index)]
+        stream = ffmpeg.output(stream, segment_filepath, format="mp4", **video_args)
+        stream = ffmpeg._ffmpeg.global_args(stream, "-hide_banner")
+        stream = ffmpeg.overwrite_output(stream)
+
+        logger.debug(f"구간 {idx} ffmpeg Arguments: \n[ffmpeg {' '.join(ffmpeg.get_args(stream))}]")
+
+        msg_queue = queue.Queue()
+        with processes_lock:
+            if stop_event.is_set():
+                raise RuntimeWarning("작업이 취소되었습니다.")
+            process = progress.run_ffmpeg_process_with_msg_queue(stream, msg_queue)
+            processes.append(process)
+            # 일시정지 중에 시작된 구간도 정지
+            if pause_state["is_pause"]:
+                set_process_pause(process, True)
+        utils.set_low_process_priority(process.pid)
+
+        msg_storage = []
+        segment_size = 0
+        segment_time = 0.0
+        for msg in iter(msg_queue.get, None):
+            if msg["type"] == "stderr":
+                msg_storage.append(msg["msg"])
+                continue
+
+            try:
+                if "total_size" in msg:
+                    segment_size = int(msg["total_size"])
+                if "out_time_ms" in msg:
+                    out_time = max(round(float(msg["out_time_ms"]) / 1000000.0, 2), 0)
+                    if bar is not None:
+                        with progress_lock:
+                            bar.update(out_time - segment_time)
+                    segment_time = out_time
+            except ValueError:
+                continue
+
+            with progress_lock:
+                segment_progress[idx] = (segment_size, segment_time)
+
+            # 진행 정보 한 묶음이 끝날 때마다, 전체 구간의 출력 크기 합계로 최종 출력 크기를 추정
+            if is_size_skip_enabled and msg.get("progress") == "continue":
+                size_skip_check()
+
+        if process.wait() != 0:
+            raise Exception(f"구간 {idx} 프로세스가 올바르게 종료되지 않았습니다.\nstderr: " + "".join(msg_storage))
+
+        return segment_filepath
+
+    def kill_processes():
+        stop_event.set()
+        with processes_lock:
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+
+    # 동시에 실행 중인 다른 작업과 같은 키보드 입력 스레드를 공유
+    keyboard_control = utils.get_keyboard_control()
+    keyboard_control.register(control_queue)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix="encode_chunk") as executor:
+            futures = [executor.submit(encode_segment, idx, start, end) for idx, (start, end) in enumerate(segments)]
+
+            try:
+                while True:
+                    done, not_done = wait(futures, timeout=0.1, return_when=FIRST_EXCEPTION)
+
+                    while not control_queue.empty():
+                        msg = control_queue.get()
+                        if msg == "pause" and not pause_state["is_pause"]:
+                            set_processes_pause(True)
+                        elif msg == "resume" and pause_state["is_pause"]:
+                            set_processes_pause(False)
+                        elif msg == "pass":
+                            kill_processes()
+                            file_info.status = FileTaskStatus.PASS
+                            raise RuntimeWarning("작업이 통과되었습니다.")
+
+                    if len(not_done) == 0 or any(future.exception() is not None for future in done):
+                        break
+
+                segment_filepaths = [future.result() for future in futures]
+            except KeyboardInterrupt:
+                kill_processes()
+                file_info.status = FileTaskStatus.SUSPEND
+                raise RuntimeWarning("사용자 입력에 의해 취소되었습니다.")
+            except BaseException:
+                kill_processes()
+                raise
+            finally:
+                keyboard_control.unregister(control_queue)
+
+        if bar is not None:
+            bar.set_postfix({"status": "concat"})
+
+        concat_list_filepath = os.path.join(temp_dirpath, "concat.txt")
+        _write_concat_list(concat_list_filepath, segment_filepaths)
+
+        video_input = ffmpeg.input(concat_list_filepath, format="concat", safe=0)
+        audio_input = ffmpeg.input(file_info.input_filepath)
+
+        streams = [
+            video_input["v:0"] if stm["codec_type"] == "video" else audio_input[str(stm["index"])]
+            for stm in media_streams
+        ]
+
+        stream = ffmpeg.output(*streams, **output_args)
+        stream = ffmpeg._ffmpeg.global_args(stream, "-hide_banner")
+        stream = ffmpeg.overwrite_output(stream)
+
+        logger.info(f"구간 합치기 ffmpeg Arguments: \n[ffmpeg {' '.join(ffmpeg.get_args(stream))}]")
+
+        try:
+            ffmpeg.run(stream, capture_stdout=True, capture_stderr=True)
+        except ffmpeg.Error as ex:
+            raise Exception(
+                f"구간을 합치는 프로세스가 올바르게 종료되지 않았습니다.\nstderr: {utils.string_decode(ex.stderr)}"
+            ) from ex
+
+        if bar is not None:
+            bar.update(bar.total - bar.n)
+    finally:
+        if bar is not None:
+            bar.close()
+        shutil.rmtree(temp_dirpath, ignore_errors=True)
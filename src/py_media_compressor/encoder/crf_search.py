@@ -0,0 +1,281 @@
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import ffmpeg
+
+from py_media_compressor import log, utils
+from py_media_compressor.encoder import args_builder
+from py_media_compressor.model import FFmpegArgs
+from py_media_compressor.model.enum import FileTaskStatus
+
+# 샘플 구간 수 및 길이 (초)
+SAMPLE_COUNT = 3
+SAMPLE_DURATION = 5.0
+
+# 코덱별 CRF 탐색 범위
+CRF_SEARCH_RANGE = {
+    "h.264": (18, 35),
+    "h.265": (20, 38),
+}
+
+_SSIM_PATTERN = re.compile(r"SSIM .*All:\s*([0-9.]+)")
+_VMAF_PATTERN = re.compile(r"VMAF score[:=]\s*([0-9.]+)")
+
+
+def is_crf_search_enabled(ffmpegArgs: FFmpegArgs) -> bool:
+    """CRF 탐색을 사용할 수 있는지 확인합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        bool: 사용할 수 있을 경우 True를 반환합니다.
+    """
+
+    encode_option = ffmpegArgs.encode_option
+
+    return (
+        (encode_option.target_size_ratio > 0 or encode_option.target_quality > 0)
+        and not ffmpegArgs.is_only_audio
+        and not ffmpegArgs.is_streamcopy
+        and "crf" in ffmpegArgs
+    )
+
+
+def get_sample_ranges(duration: float) -> List[Tuple[float, float]]:
+    """파일 전체에 고르게 분포된 샘플 구간을 계산합니다.
+
+    Args:
+        duration (float): 파일 재생 시간 (초)
+
+    Returns:
+        List[Tuple[float, float]]: 샘플 구간 (시작 위치, 길이) 리스트
+    """
+
+    if duration <= SAMPLE_COUNT * SAMPLE_DURATION * 2:
+        return [(0.0, duration)]
+
+    return [
+        (duration * (idx + 1) / (SAMPLE_COUNT + 1) - SAMPLE_DURATION / 2, SAMPLE_DURATION)
+        for idx in range(SAMPLE_COUNT)
+    ]
+
+
+def get_audio_bitrate(ffmpegArgs: FFmpegArgs) -> int:
+    """출력 파일의 예상 오디오 비트레이트 합계를 계산합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        int: 오디오 비트레이트 (bps), 인코딩 인수에 비트레이트가 없을 경우 원본 비트레이트를 사용합니다.
+    """
+
+    bitrate = 0
+
+    for idx, audio_stream in enumerate(ffmpegArgs.audio_streams):
+        if (bit_rate := ffmpegArgs.as_dict().get(f"b:a:{idx}")) is None:
+            bit_rate = audio_stream.get("bit_rate", 0)
+
+        try:
+            bitrate += int(bit_rate)
+        except ValueError:
+            pass
+
+    return bitrate
+
+
+def _encode_sample(
+    ffmpegArgs: FFmpegArgs, videoArgs: Dict, inputArgs: Dict, start: float, duration: float, outputFilepath: str
+):
+    stream = ffmpeg.input(ffmpegArgs.file_info.input_filepath, ss=f"{start:.3f}", t=f"{duration:.3f}", **inputArgs)
+    stream = ffmpeg.output(stream[str(ffmpegArgs.video_stream["index"])], outputFilepath, format="mp4", **videoArgs)
+    stream = ffmpeg._ffmpeg.global_args(stream, "-hide_banner")
+    stream = ffmpeg.overwrite_output(stream)
+
+    ffmpeg.run(stream, capture_stdout=True, capture_stderr=True)
+
+
+def _measure_sample_quality(
+    ffmpegArgs: FFmpegArgs, sampleFilepath: str, start: float, duration: float, metric: str
+) -> Optional[float]:
+    distorted = ffmpeg.input(sampleFilepath)["v:0"]
+    reference = ffmpeg.input(ffmpegArgs.file_info.input_filepath, ss=f"{start:.3f}", t=f"{duration:.3f}")[
+        str(ffmpegArgs.video_stream["index"])
+    ]
+
+    # 원본을 출력 해상도로 맞춘 뒤 비교 (w, h 를 지정하지 않으면 원본 해상도가 유지되어, 축소된 출력과 비교할 수 없음)
+    scaled = ffmpeg.filter_multi_output([reference, distorted], "scale2ref", w="rw", h="rh")
+    if metric == "vmaf":
+        stream = ffmpeg.filter([scaled[1], scaled[0]], "libvmaf")
+        pattern = _VMAF_PATTERN
+    else:
+        stream = ffmpeg.filter([scaled[1], scaled[0]], "ssim")
+        pattern = _SSIM_PATTERN
+
+    stream = ffmpeg.output(stream, "-", format="null")
+    stream = ffmpeg._ffmpeg.global_args(stream, "-hide_banner")
+
+    _, stderr = ffmpeg.run(stream, capture_stdout=True, capture_stderr=True)
+
+    if (match := pattern.search(utils.string_decode(stderr))) is None:
+        return None
+    return float(match.group(1))
+
+
+def measure_crf(
+    ffmpegArgs: FFmpegArgs, crf: int, inputArgs: Optional[Dict] = None, tempDirpath: Optional[str] = None
+) -> Tuple[float, Optional[float]]:
+    """샘플 구간을 지정한 CRF 로 인코딩하여, 예상 출력 크기 비율 및 품질을 측정합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+        crf (int): CRF 값
+        inputArgs (Optional[Dict], optional): 입력 파일 인수. Defaults to None.
+        tempDirpath (Optional[str], optional): 샘플 파일을 저장할 디렉토리 경로. Defaults to None.
+
+    Returns:
+        Tuple[float, Optional[float]]: 입력 파일 대비 예상 출력 크기 비율, 품질 점수 (목표 품질이 없을 경우 None)
+    """
+
+    if inputArgs is None:
+        inputArgs = {}
+
+    encode_option = ffmpegArgs.encode_option
+    duration = float(ffmpegArgs.probe_info["format"]["duration"])
+
+    video_args = {key: value for key, value in ffmpegArgs.as_dict().items() if args_builder.is_video_arg(key)}
+    video_args["crf"] = crf
+
+    sample_bytes = 0
+    sample_duration = 0.0
+    quality_scores = []
+
+    for idx, (start, length) in enumerate(get_sample_ranges(duration)):
+        sample_filepath = os.path.join(tempDirpath or "", f"sample_{crf}_{idx}.mp4")
+
+        _encode_sample(ffmpegArgs, video_args, inputArgs, start, length, sample_filepath)
+        sample_bytes += os.path.getsize(sample_filepath)
+        sample_duration += length
+
+        if encode_option.target_quality > 0:
+            if (
+                score := _measure_sample_quality(
+                    ffmpegArgs, sample_filepath, start, length, encode_option.quality_metric
+                )
+            ) is not None:
+                quality_scores.append(score)
+
+        utils.remove(sample_filepath, raise_error=False)
+
+    estimated_bitrate = sample_bytes * 8 / sample_duration + get_audio_bitrate(ffmpegArgs)
+    input_bitrate = ffmpegArgs.file_info.input_filesize * 8 / duration
+
+    # 가장 나쁜 구간을 기준으로 품질을 판단
+    quality = min(quality_scores) if len(quality_scores) > 0 else None
+
+    return (estimated_bitrate / input_bitrate, quality)
+
+
+def search_crf(ffmpegArgs: FFmpegArgs, inputArgs: Optional[Dict] = None) -> Optional[int]:
+    """목표 크기 비율 또는 목표 품질을 만족하는 CRF 를 이진 탐색합니다.
+
+    - 목표 품질만 있을 경우, 품질을 만족하는 가장 큰 CRF (가장 작은 출력) 를 찾습니다.
+    - 목표 크기 비율만 있을 경우, 크기를 만족하는 가장 작은 CRF (가장 좋은 품질) 를 찾습니다.
+    - 둘 다 있을 경우, 품질을 만족하는 가장 큰 CRF 가 크기도 만족해야 합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+        inputArgs (Optional[Dict], optional): 입력 파일 인수. Defaults to None.
+
+    Returns:
+        Optional[int]: CRF 값, 목표 크기 비율을 만족할 수 없는 경우 None을 반환합니다.
+    """
+
+    logger = log.get_logger(search_crf)
+
+    encode_option = ffmpegArgs.encode_option
+    crf_min, crf_max = CRF_SEARCH_RANGE.get(encode_option.codec, (18, 35))
+
+    measurements: Dict[int, Tuple[float, Optional[float]]] = {}
+    temp_dirpath = tempfile.mkdtemp(
+        prefix=".amcp_crf_", dir=os.path.dirname(os.path.abspath(ffmpegArgs.file_info.output_filepath))
+    )
+
+    def measure(crf: int) -> Tuple[float, Optional[float]]:
+        if crf not in measurements:
+            measurements[crf] = measure_crf(ffmpegArgs, crf, inputArgs=inputArgs, tempDirpath=temp_dirpath)
+            logger.debug(f"CRF 탐색: crf={crf}, 크기 비율={measurements[crf][0]:.3f}, 품질={measurements[crf][1]}")
+        return measurements[crf]
+
+    def is_size_ok(crf: int) -> bool:
+        return encode_option.target_size_ratio <= 0 or measure(crf)[0] <= encode_option.target_size_ratio
+
+    def is_quality_ok(crf: int) -> bool:
+        if encode_option.target_quality <= 0:
+            return True
+        quality = measure(crf)[1]
+        return quality is not None and quality >= encode_option.target_quality
+
+    try:
+        if encode_option.target_quality > 0:
+            # 품질을 만족하는 가장 큰 CRF
+            lo, hi = crf_min, crf_max
+            if not is_quality_ok(lo):
+                logger.warning(f"목표 품질을 만족하는 CRF 가 없습니다. 가장 작은 CRF 를 사용합니다. (crf={lo})")
+                crf = lo
+            else:
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if is_quality_ok(mid):
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                crf = lo
+
+            return crf if is_size_ok(crf) else None
+
+        # 크기를 만족하는 가장 작은 CRF
+        lo, hi = crf_min, crf_max
+        if not is_size_ok(hi):
+            return None
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if is_size_ok(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+    finally:
+        shutil.rmtree(temp_dirpath, ignore_errors=True)
+
+
+def apply_crf_search(ffmpegArgs: FFmpegArgs, inputArgs: Optional[Dict] = None):
+    """CRF 를 탐색하여 인코딩 인수에 반영합니다.
+
+    목표를 만족할 수 없는 경우 작업 상태를 PASS 로 변경하여, 전체 인코딩을 실행하지 않도록 합니다.
+    탐색에 실패한 경우에는 기존 CRF 를 그대로 사용합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+        inputArgs (Optional[Dict], optional): 입력 파일 인수. Defaults to None.
+    """
+
+    logger = log.get_logger(apply_crf_search)
+
+    try:
+        crf = search_crf(ffmpegArgs, inputArgs=inputArgs)
+    except Exception:
+        logger.warning(f"CRF 탐색 실패, 기존 CRF 를 사용합니다. (crf={ffmpegArgs['crf']})", exc_info=True)
+        return
+
+    if crf is None:
+        logger.info(f"[crf_search] 목표 크기를 만족하는 CRF 가 없습니다.\nFileInfo: {ffmpegArgs.file_info}")
+        ffmpegArgs.file_info.status = FileTaskStatus.PASS
+        return
+
+    logger.info(f"[crf_search] CRF 결정: {ffmpegArgs['crf']} -> {crf}")
+    ffmpegArgs["crf"] = crf
@@ -0,0 +1,245 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from tqdm import tqdm
+
+from py_media_compressor import log, utils
+
+
+class Deduplicator:
+    """파일 경로, 크기, 해시를 단계적으로 비교하여 중복 파일을 찾습니다.
+
+    중복되지 않은 파일은 경로 및 파일 크기 별로 색인되며, 해시는 크기가 같은 파일이 있을 때만 파일당 한 번 계산됩니다.
+    파일 정보는 {"input_file": 경로, "input_file_size": 크기} 형식의 Dict 이며, 계산된 해시는 해당 Dict 에 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        deduplicationMode: str = "staged",
+        partialHashSize: int = 4194304,
+        hashAlgorithm: str = "md5",
+        maxWorkers: int = 4,
+        maxWorkersPerDevice: int = 2,
+    ) -> None:
+        """
+        Args:
+            deduplicationMode (str, optional): 크기가 같은 파일의 내용 비교 방식. Defaults to "staged".
+                - "full": 파일 전체의 해시만 비교합니다.
+                - "staged": 부분 해시 (처음, 중간, 마지막 부분) 를 먼저 비교하고, 일치할 경우에만 전체 해시를 비교합니다.
+                - "partial": 부분 해시만 비교합니다. (가장 빠르지만, 드물게 다른 파일을 중복으로 판단할 수 있음)
+            partialHashSize (int, optional): 부분 해시의 각 부분 크기. Defaults to 4194304 (4MB).
+            hashAlgorithm (str, optional): 해시 알고리즘. Defaults to "md5".
+            maxWorkers (int, optional): 동시에 해시를 계산할 최대 스레드 수. Defaults to 4.
+            maxWorkersPerDevice (int, optional): 같은 저장 장치에서 동시에 해시를 계산할 최대 스레드 수. Defaults to 2.
+        """
+
+        assert deduplicationMode in ["full", "staged", "partial"], "지원하지 않는 중복 확인 모드입니다."
+        assert hashAlgorithm in utils.get_available_hash_algorithms(), "지원하지 않는 해시 알고리즘입니다."
+        assert maxWorkers > 0 and maxWorkersPerDevice > 0
+
+        self._mode = deduplicationMode
+        self._partial_hash_size = partialHashSize
+        self._hash_algorithm = hashAlgorithm
+        self._max_workers = maxWorkers
+        self._max_workers_per_device = maxWorkersPerDevice
+
+        # MD5 해시값만 FileInfo 로 전달됨 (convert_SI2FI)
+        self._hash_key = "input_md5_hash" if hashAlgorithm == "md5" else f"input_{hashAlgorithm}_hash"
+
+        # 중복되지 않은 파일 정보 색인 (경로, 파일 크기 별)
+        self._unique_fileinfo_by_path: Dict[str, Dict] = {}
+        self._unique_fileinfos_by_size: Dict[int, List[Dict]] = {}
+
+        self._device_semaphores: Dict[int, threading.BoundedSemaphore] = {}
+        self._device_semaphores_lock = threading.Lock()
+
+    @property
+    def hash_key(self) -> str:
+        return self._hash_key
+
+    def _is_partial_hash_conclusive(self, fileinfo: Dict) -> bool:
+        # 부분 해시가 파일 전체를 포함하는 경우, 전체 해시 비교는 필요하지 않음
+        return self._mode == "partial" or fileinfo["input_file_size"] <= self._partial_hash_size * 3
+
+    def get_hash(self, fileinfo: Dict, useProgressbar=True, progressCallback: Callable[[int], None] = None) -> str:
+        if self._hash_key not in fileinfo:
+            fileinfo[self._hash_key] = utils.get_file_hash(
+                fileinfo["input_file"],
+                self._hash_algorithm,
+                useProgressbar=useProgressbar,
+                progressCallback=progressCallback,
+            )
+        return fileinfo[self._hash_key]
+
+    def get_partial_hash(self, fileinfo: Dict) -> str:
+        if "input_partial_hash" not in fileinfo:
+            fileinfo["input_partial_hash"] = utils.get_partial_file_hash(
+                fileinfo["input_file"], chunkSize=self._partial_hash_size, algorithm=self._hash_algorithm
+            )
+        return fileinfo["input_partial_hash"]
+
+    def is_same_content(self, fileinfo: Dict, o_fileinfo: Dict) -> bool:
+        if self._mode in ["staged", "partial"]:
+            if self.get_partial_hash(fileinfo) != self.get_partial_hash(o_fileinfo):
+                return False
+
+            if self._is_partial_hash_conclusive(fileinfo):
+                return True
+
+        return self.get_hash(fileinfo) == self.get_hash(o_fileinfo)
+
+    def find_duplicate(self, fileinfo: Dict) -> Optional[Dict]:
+        """이미 확인된 파일 중 중복 파일을 찾습니다. 중복되지 않은 경우, 해당 파일을 색인에 추가합니다.
+
+        Args:
+            fileinfo (Dict): 파일 정보
+
+        Returns:
+            Optional[Dict]: 중복된 기존 파일 정보, 중복되지 않은 경우 None을 반환합니다.
+        """
+
+        # 경로가 겹치는 경우 (1차 필터링)
+        if (dupl_info := self._unique_fileinfo_by_path.get(fileinfo["input_file"])) is not None:
+            return dupl_info
+
+        # 파일 크기가 겹치는 경우 (2차 필터링)
+        # 파일 내용이 겹치는 경우 (3차 필터링), 해시는 파일당 한 번만 계산됨
+        for o_fileinfo in self._unique_fileinfos_by_size.get(fileinfo["input_file_size"], []):
+            if self.is_same_content(fileinfo, o_fileinfo):
+                return o_fileinfo
+
+        self._unique_fileinfo_by_path[fileinfo["input_file"]] = fileinfo
+        self._unique_fileinfos_by_size.setdefault(fileinfo["input_file_size"], []).append(fileinfo)
+
+        return None
+
+    def _get_device_semaphore(self, filepath: str) -> threading.BoundedSemaphore:
+        try:
+            device = os.stat(filepath).st_dev
+        except OSError:
+            device = -1
+
+        with self._device_semaphores_lock:
+            if (semaphore := self._device_semaphores.get(device)) is None:
+                semaphore = self._device_semaphores[device] = threading.BoundedSemaphore(self._max_workers_per_device)
+
+        return semaphore
+
+    def _run_concurrently(
+        self,
+        fileinfos: List[Dict],
+        hashFunc: Callable[[Dict, Callable[[int], None]], None],
+        sizeFunc: Callable[[Dict], int],
+        desc: str,
+        useProgressbar: bool,
+    ):
+        logger = log.get_logger(self._run_concurrently)
+
+        if len(fileinfos) == 0:
+            return
+
+        bar = (
+            tqdm(
+                total=sum(sizeFunc(fileinfo) for fileinfo in fileinfos),
+                desc=desc,
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+                leave=False,
+                dynamic_ncols=True,
+            )
+            if useProgressbar
+            else None
+        )
+        bar_lock = threading.Lock()
+
+        def update_progress(size: int):
+            if bar is not None:
+                with bar_lock:
+                    bar.update(size)
+
+        def job(fileinfo: Dict):
+            reported_size = 0
+
+            def progress_callback(size: int):
+                nonlocal reported_size
+                reported_size += size
+                update_progress(size)
+
+            with self._get_device_semaphore(fileinfo["input_file"]):
+                try:
+                    hashFunc(fileinfo, progress_callback)
+                finally:
+                    # 캐시된 해시를 사용한 경우 등, 보고되지 않은 크기를 반영
+                    update_progress(sizeFunc(fileinfo) - reported_size)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="dedup_hash") as executor:
+                futures = {executor.submit(job, fileinfo): fileinfo for fileinfo in fileinfos}
+                for future in as_completed(futures):
+                    if (ex := future.exception()) is not None:
+                        # 실패한 파일은 이후 순차 확인 단계에서 다시 시도됨
+                        logger.warning(f"해시 계산 실패\nFileInfo: {futures[future]}", exc_info=ex)
+        finally:
+            if bar is not None:
+                bar.close()
+
+    def prefetch_hashes(self, fileinfos: List[Dict], useProgressbar=False):
+        """중복 확인에 필요한 해시를 스레드 풀에서 미리 계산합니다.
+
+        크기가 같은 파일 묶음 안에서만 해시가 계산되며, 이후 find_duplicate 는 계산된 값을 사용합니다.
+        해시 계산은 GIL 을 해제하므로, 여러 파일을 동시에 읽어 저장 장치의 대역폭을 활용할 수 있습니다.
+
+        Args:
+            fileinfos (List[Dict]): 파일 정보 리스트
+            useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
+        """
+
+        size_buckets: Dict[int, List[Dict]] = {}
+        seen_paths = set(self._unique_fileinfo_by_path)
+        for fileinfo in fileinfos:
+            if fileinfo["input_file"] in seen_paths:
+                continue
+            seen_paths.add(fileinfo["input_file"])
+            size_buckets.setdefault(fileinfo["input_file_size"], []).append(fileinfo)
+
+        # 이미 색인된 파일도 크기가 같은 후보에 포함
+        candidate_groups = []
+        for size, bucket in size_buckets.items():
+            group = self._unique_fileinfos_by_size.get(size, []) + bucket
+            if len(group) > 1:
+                candidate_groups.append(group)
+
+        if self._mode in ["staged", "partial"]:
+            self._run_concurrently(
+                [fi for group in candidate_groups for fi in group if "input_partial_hash" not in fi],
+                lambda fi, _: self.get_partial_hash(fi),
+                lambda fi: min(fi["input_file_size"], self._partial_hash_size * 3),
+                "[DupCheck] 부분 해시 계산 중...",
+                useProgressbar,
+            )
+
+            # 부분 해시까지 같은 파일만 전체 해시 계산 대상
+            full_hash_groups = []
+            for group in candidate_groups:
+                partial_groups: Dict[str, List[Dict]] = {}
+                for fileinfo in group:
+                    if (partial_hash := fileinfo.get("input_partial_hash")) is not None:
+                        partial_groups.setdefault(partial_hash, []).append(fileinfo)
+                full_hash_groups.extend(
+                    partial_group
+                    for partial_group in partial_groups.values()
+                    if len(partial_group) > 1 and not self._is_partial_hash_conclusive(partial_group[0])
+                )
+        else:
+            full_hash_groups = candidate_groups
+
+        self._run_concurrently(
+            [fi for group in full_hash_groups for fi in group if self._hash_key not in fi],
+            lambda fi, progress: self.get_hash(fi, useProgressbar=False, progressCallback=progress),
+            lambda fi: fi["input_file_size"],
+            "[DupCheck] 해시 계산 중...",
+            useProgressbar,
+        )
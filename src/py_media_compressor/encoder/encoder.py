@@ -2,7 +2,7 @@ import logging
 import os
 import queue
 from threading import Thread
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import bitmath
 import ffmpeg
@@ -11,8 +11,10 @@ from tqdm import tqdm
 from py_media_compressor import log, utils
 from py_media_compressor.common import progress
 from py_media_compressor.const import IGNORE_STREAM_FILTER
-from py_media_compressor.encoder import args_builder
-from py_media_compressor.model import FFmpegArgs, FileInfo
+from py_media_compressor.encoder import args_builder, chunked, crf_search, estimator
+from py_media_compressor.encoder.dedup import Deduplicator
+from py_media_compressor.encoder.estimator import SIZE_SKIP_OFFSET, is_projected_oversize, project_output_size
+from py_media_compressor.model import FFmpegArgs, FileInfo, FileRecord
 from py_media_compressor.model.enum import FileTaskStatus, LogDestination, LogLevel
 from py_media_compressor.utils import pformat
 
@@ -29,10 +31,21 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
 
     logger = log.get_logger(media_compress_encode)
 
+    # 샘플 인코딩 (CRF 탐색, 크기 예측 보정) 에도 같은 입력 인수를 사용
+    input_Args = get_input_args(ffmpegArgs)
+
     if ffmpegArgs.file_info.status == FileTaskStatus.INIT:
         args_builder.add_auto_args(ffmpegArgs=ffmpegArgs)
         logger.debug("ffmpeg 인수 자동 생성 완료")
 
+        # 전체 인코딩 전에 샘플 구간으로 목표를 만족하는 CRF 탐색
+        if ffmpegArgs.file_info.status == FileTaskStatus.WAITING and crf_search.is_crf_search_enabled(ffmpegArgs):
+            crf_search.apply_crf_search(ffmpegArgs, inputArgs=input_Args)
+
+        # 출력 크기가 충분히 줄어들지 않을 것으로 예상되는 파일은 인코딩하지 않음 (CRF 탐색 시, 탐색된 CRF 로 예측)
+        if ffmpegArgs.file_info.status == FileTaskStatus.WAITING and estimator.is_estimate_enabled(ffmpegArgs):
+            estimator.apply_estimate_filter(ffmpegArgs, inputArgs=input_Args)
+
     logger.info(f"현재 작업 파일 정보: \n{pformat(ffmpegArgs.get_all_in_one_dict())}")
 
     if ffmpegArgs.file_info.status in [FileTaskStatus.SKIPPED, FileTaskStatus.PASS]:
@@ -46,18 +59,9 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
 
     ffmpeg_args_dict = ffmpegArgs.as_dict()
 
-    input_Args = {}
-
-    if (
-        ffmpegArgs.encode_option.is_cuda
-        and not ffmpegArgs.is_only_audio
-        and not ffmpegArgs.video_stream["codec_name"].lower().startswith("wmv")
-    ):  # wmv 코덱 중, 하드웨어 디코드 오류가 발생하는 문제가 있음
-        input_Args["hwaccel"] = "cuda"
+    if "hwaccel" in input_Args:
         logger.info("CUDA 디코더 활성화")
 
-    skip_offset_size = 10485760  # 10 * 1024 * 1024 (10MB)
-
     is_can_skip = args_builder.pass_filter(ffmpegArgs=ffmpegArgs)
 
     stream = ffmpeg.input(ffmpegArgs.file_info.input_filepath, **input_Args)
@@ -84,102 +88,6 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
 
     stream = ffmpeg.overwrite_output(stream)
 
-    def msg_reader(
-        logger: logging.Logger,
-        queue: queue.Queue,
-        ffmpegArgs: FFmpegArgs,
-        control_queue: queue.Queue,
-        msg_storage: List = None,
-    ):
-        file_info = ffmpegArgs.file_info
-        total_duration = float(ffmpegArgs.probe_info["format"]["duration"])
-        bar = tqdm(total=round(total_duration, 2), leave=ffmpegArgs.encode_option.leave, dynamic_ncols=True)
-        info = {
-            "spd": "",
-            "time": "",
-            "size": "",
-            "frame": "",
-            "fps": "",
-            "br": "",
-        }
-
-        for msg in iter(queue.get, None):
-            if msg["type"] == "stderr":
-                logger.debug(f"ffmpeg output str: \n{pformat(msg)}")
-
-                if msg_storage is not None:
-                    msg_storage.append(msg["msg"])
-
-            elif msg["type"] == "stdout":
-                update_value = None
-                try:
-                    if "out_time_ms" in msg:
-                        time = max(round(float(msg["out_time_ms"]) / 1000000.0, 2), 0)
-                        update_value = time - bar.n
-                    elif "progress" in msg and msg["progress"] == "end":
-                        update_value = bar.total - bar.n
-                except ValueError:
-                    update_value = None
-
-                for key, value in msg.items():
-                    if key in [
-                        "frame",
-                        "fps",
-                        "total_size",
-                        "bitrate",
-                        "out_time",
-                        "speed",
-                        "dup_frames",
-                        "drop_frames",
-                    ]:
-                        if key == "total_size":
-                            key = "size"
-                            f_value = int(value)
-                            p_value = str(bitmath.best_prefix(f_value, system=bitmath.SI)).split(" ")
-                            value = f"{round(float(p_value[0]), 1)} {p_value[1]}"
-                            if (
-                                is_can_skip
-                                and ffmpegArgs.encode_option.is_size_skip
-                                and not ffmpegArgs.is_streamcopy
-                                and not ffmpegArgs.is_only_audio
-                                and control_queue is not None
-                            ):
-                                if f_value > file_info.input_filesize + skip_offset_size:
-                                    control_queue.put("pass")
-                                    logger.info(
-                                        (
-                                            f"[size_skip] input size > output size. "
-                                            f"({f_value} > {file_info.input_filesize})"
-                                        )
-                                    )
-                        elif key == "out_time":
-                            key = "time"
-                            value = value.split(".")[0]
-                        elif key == "bitrate":
-                            key = "br"
-                        elif key == "speed":
-                            key = "spd"
-                        elif key == "dup_frames":
-                            if value == "0":
-                                continue
-                            else:
-                                key = "dup_f"
-                        elif key == "drop_frames":
-                            if value == "0":
-                                continue
-                            else:
-                                key = "drop_f"
-
-                        info[key] = value
-
-                if update_value is not None:
-                    bar.set_postfix(info, refresh=False)
-                    bar.update(update_value)
-                else:
-                    bar.set_postfix(info)
-
-        bar.close()
-
     def error_output_check(ffmpegArgs: FFmpegArgs):
         if (
             ffmpegArgs.encode_option.remove_error_output
@@ -195,8 +103,18 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
 
     logger.info(f"ffmpeg Arguments: \n[ffmpeg {' '.join(ffmpeg.get_args(stream))}]")
 
+    # 인코딩 시작 전 입력 파일 전체를 읽지 않도록, 입력 파일 해시를 인코딩과 동시에 계산
+    # (이전 작업에서 계산 중인 해시가 있을 경우, 파일을 다시 읽지 않고 해당 결과를 사용)
+    input_hash_future = None
+    if ffmpegArgs.input_hash_placeholder is not None:
+        input_hash_future = ffmpegArgs.file_info.start_input_file_MD5()
+        logger.debug("입력 파일 해시를 인코딩과 동시에 계산합니다.")
+
     try:
-        if ffmpegArgs.encode_option.use_progressbar:
+        if chunked.is_chunkable(ffmpegArgs):
+            chunked.encode_chunked(ffmpegArgs, inputArgs=input_Args, isCanSkip=is_can_skip)
+
+        elif ffmpegArgs.encode_option.use_progressbar:
             msg_queue = queue.Queue()
             control_queue = queue.Queue()
             msg_storage = []
@@ -211,6 +129,7 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
                     ffmpegArgs,
                     control_queue,
                     msg_storage,
+                    is_can_skip,
                 ],
             )
             watch_thread.start()
@@ -248,6 +167,19 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
 
             logger.info(utils.string_decode(stderr), {"dest": LogDestination.CONSOLE})
 
+        if input_hash_future is not None:
+            try:
+                input_md5 = input_hash_future.result()
+            except Exception as ex:
+                raise Exception("입력 파일 해시를 계산하지 못했습니다.") from ex
+
+            if not utils.patch_mp4_comment(
+                ffmpegArgs.file_info.output_filepath, ffmpegArgs.input_hash_placeholder, input_md5
+            ):
+                raise Exception("출력 파일 메타데이터에 입력 파일 해시를 기록하지 못했습니다.")
+
+            logger.debug(f"출력 파일 메타데이터에 입력 파일 해시를 기록했습니다. MD5: {input_md5}")
+
     except Exception:
         if ffmpegArgs.file_info.status == FileTaskStatus.SUSPEND:
             logger.warning("작업이 중단되었습니다.")
@@ -259,14 +191,188 @@ def media_compress_encode(ffmpegArgs: FFmpegArgs) -> FileInfo:
     else:
         ffmpegArgs.file_info.status = FileTaskStatus.SUCCESS
     finally:
+        # 작업이 끝난 뒤에도 입력 파일을 계속 읽지 않도록 해시 계산을 중단
+        # (통과된 작업을 스트림 복사로 덮어쓸 경우, 스트림 복사 작업에서 계산 중인 해시를 이어서 사용)
+        if input_hash_future is not None and not (
+            ffmpegArgs.file_info.status == FileTaskStatus.PASS and ffmpegArgs.encode_option.is_replace
+        ):
+            ffmpegArgs.file_info.cancel_input_file_MD5()
+
         utils.set_file_permission(ffmpegArgs.file_info.output_filepath)
-        return error_output_check(ffmpegArgs)
+        error_output_check(ffmpegArgs)
+        # 출력 파일이 생성, 변경 또는 제거되었으므로 출력 파일의 상태 정보를 다시 가져오도록 함
+        ffmpegArgs.file_info.refresh_stat(isInput=False)
+        return ffmpegArgs.file_info
+
+
+def get_input_args(ffmpegArgs: FFmpegArgs) -> Dict:
+    """입력 파일 인수 (하드웨어 디코더, 스레드 수) 를 만듭니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        Dict: 입력 파일 인수
+    """
+
+    input_args = {}
+
+    if (
+        ffmpegArgs.encode_option.is_cuda
+        and not ffmpegArgs.is_only_audio
+        and not ffmpegArgs.video_stream["codec_name"].lower().startswith("wmv")
+    ):  # wmv 코덱 중, 하드웨어 디코드 오류가 발생하는 문제가 있음
+        input_args["hwaccel"] = "cuda"
+
+    if ffmpegArgs.encode_option.threads > 0:
+        input_args["threads"] = ffmpegArgs.encode_option.threads
+
+    return input_args
+
+
+def msg_reader(
+    logger: logging.Logger,
+    queue: queue.Queue,
+    ffmpegArgs: FFmpegArgs,
+    control_queue: queue.Queue,
+    msg_storage: List = None,
+    is_can_skip: bool = True,
+):
+    """ffmpeg 진행 메시지를 읽어 진행바를 갱신하고, 출력 크기가 입력 파일보다 커질 경우 작업을 통과시킵니다.
+
+    Args:
+        logger (logging.Logger): 로거
+        queue (queue.Queue): progress.parser 가 전달하는 메시지 대기열
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+        control_queue (queue.Queue): 프로세스 제어 대기열 ("pass" 전달 시 작업 통과)
+        msg_storage (List, optional): stderr 메시지를 저장할 리스트. Defaults to None.
+        is_can_skip (bool, optional): 크기 초과 시 작업을 통과시킬 수 있는지 여부 (args_builder.pass_filter). Defaults to True.
+    """
+
+    file_info = ffmpegArgs.file_info
+    total_duration = float(ffmpegArgs.probe_info["format"]["duration"])
+    is_size_skip_enabled = (
+        is_can_skip
+        and ffmpegArgs.encode_option.is_size_skip
+        and not ffmpegArgs.is_streamcopy
+        and not ffmpegArgs.is_only_audio
+        and control_queue is not None
+    )
+    is_size_skipped = False
+    current_size = 0
+    current_time = 0.0
+    bar = tqdm(total=round(total_duration, 2), leave=ffmpegArgs.encode_option.leave, dynamic_ncols=True)
+    info = {
+        "spd": "",
+        "time": "",
+        "size": "",
+        "frame": "",
+        "fps": "",
+        "br": "",
+    }
+
+    for msg in iter(queue.get, None):
+        if msg["type"] == "stderr":
+            logger.debug(f"ffmpeg output str: \n{pformat(msg)}")
+
+            if msg_storage is not None:
+                msg_storage.append(msg["msg"])
+
+        elif msg["type"] == "stdout":
+            update_value = None
+            try:
+                if "out_time_ms" in msg:
+                    current_time = max(round(float(msg["out_time_ms"]) / 1000000.0, 2), 0)
+                    update_value = current_time - bar.n
+                elif "progress" in msg and msg["progress"] == "end":
+                    update_value = bar.total - bar.n
+            except ValueError:
+                update_value = None
+
+            # 진행 정보 한 묶음이 끝날 때마다, 최종 출력 크기를 추정하여 입력 파일보다 확실히 커질 경우 미리 중단
+            if is_size_skip_enabled and not is_size_skipped and msg.get("progress") == "continue":
+                if is_projected_oversize(
+                    current_size,
+                    current_time,
+                    total_duration,
+                    file_info.input_filesize,
+                    warmup=ffmpegArgs.encode_option.size_skip_warmup,
+                    margin=ffmpegArgs.encode_option.size_skip_margin,
+                ):
+                    is_size_skipped = True
+                    control_queue.put("pass")
+                    logger.info(
+                        (
+                            f"[size_skip] projected output size > input size. "
+                            f"({int(project_output_size(current_size, current_time, total_duration))} > "
+                            f"{file_info.input_filesize}, progress: {current_time}/{round(total_duration, 2)}s)"
+                        )
+                    )
+
+            for key, value in msg.items():
+                if key in [
+                    "frame",
+                    "fps",
+                    "total_size",
+                    "bitrate",
+                    "out_time",
+                    "speed",
+                    "dup_frames",
+                    "drop_frames",
+                ]:
+                    if key == "total_size":
+                        key = "size"
+                        f_value = current_size = int(value)
+                        p_value = str(bitmath.best_prefix(f_value, system=bitmath.SI)).split(" ")
+                        value = f"{round(float(p_value[0]), 1)} {p_value[1]}"
+                        if is_size_skip_enabled and not is_size_skipped:
+                            if f_value > file_info.input_filesize + SIZE_SKIP_OFFSET:
+                                is_size_skipped = True
+                                control_queue.put("pass")
+                                logger.info(
+                                    (
+                                        f"[size_skip] input size > output size. "
+                                        f"({f_value} > {file_info.input_filesize})"
+                                    )
+                                )
+                    elif key == "out_time":
+                        key = "time"
+                        value = value.split(".")[0]
+                    elif key == "bitrate":
+                        key = "br"
+                    elif key == "speed":
+                        key = "spd"
+                    elif key == "dup_frames":
+                        if value == "0":
+                            continue
+                        else:
+                            key = "dup_f"
+                    elif key == "drop_frames":
+                        if value == "0":
+                            continue
+                        else:
+                            key = "drop_f"
+
+                    info[key] = value
+
+            if update_value is not None:
+                bar.set_postfix(info, refresh=False)
+                bar.update(update_value)
+            else:
+                bar.set_postfix(info)
+
+    bar.close()
 
 
 def get_source_file(
     inputPaths: List[str],
     mediaExtFilter: Union[List[str], None] = None,
     useDeduplicationFilter=True,
+    deduplicationMode: str = "staged",
+    partialHashSize: int = 4194304,
+    hashAlgorithm: str = "md5",
+    hashWorkers: int = 4,
+    hashWorkersPerDevice: int = 2,
     useProgressbar=False,
     leave=True,
 ) -> Tuple[List, int, int]:
@@ -276,6 +382,15 @@ def get_source_file(
         inputPaths (List[str]): 입력 경로
         mediaExtFilter (Union[List[str], None], optional): 미디어 확장자 필터. Defaults to None.
         useDeduplicationFilter (bool, optional): 중복 파일 필터링 사용 여부. Defaults to True.
+        deduplicationMode (str, optional): 크기가 같은 파일의 내용 비교 방식. Defaults to "staged".
+            - "full": 파일 전체의 해시만 비교합니다.
+            - "staged": 부분 해시 (처음, 중간, 마지막 부분) 를 먼저 비교하고, 일치할 경우에만 전체 해시를 비교합니다.
+            - "partial": 부분 해시만 비교합니다. (가장 빠르지만, 드물게 다른 파일을 중복으로 판단할 수 있음)
+        partialHashSize (int, optional): 부분 해시의 각 부분 크기. Defaults to 4194304 (4MB).
+        hashAlgorithm (str, optional): 중복 확인에 사용할 해시 알고리즘. Defaults to "md5".
+            "md5" 일 경우, 계산된 해시값이 메타데이터 기록 단계에서 재사용됩니다.
+        hashWorkers (int, optional): 동시에 해시를 계산할 최대 스레드 수. Defaults to 4.
+        hashWorkersPerDevice (int, optional): 같은 저장 장치에서 동시에 해시를 계산할 최대 스레드 수. Defaults to 2.
         useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
         leave (bool, optional): 중첩된 진행바를 사용할 경우, False 를 권장합니다. Defaults to True.
 
@@ -285,50 +400,20 @@ def get_source_file(
 
     logger = log.get_logger(get_source_file)
 
-    temp_hash_dupl_list = []
-
-    def gen_fileinfo(path: str, tqdm_manager: tqdm = None):
-        is_dupl = False
-        dupl_info = None
-        fileinfo = {"input_file": path, "input_file_size": os.path.getsize(path)}
-
-        if useDeduplicationFilter:
-            if isinstance(tqdm_manager, tqdm):
-                tqdm_manager.set_description("[DupCheck] 중복 파일 확인 중...")
-
-            for o_fileinfo in temp_hash_dupl_list:
-                if fileinfo["input_file"] == o_fileinfo["input_file"]:  # 경로가 겹치는 경우 (1차 필터링)
-                    is_dupl = True
-                    dupl_info = o_fileinfo
-                    break
-                elif fileinfo["input_file_size"] == o_fileinfo["input_file_size"]:  # 파일 크기가 겹치는 경우 (2차 필터링)
-                    if isinstance(tqdm_manager, tqdm):
-                        tqdm_manager.set_description("[DupCheck] MD5 해시 계산 중...")
-
-                    fileinfo["input_md5_hash"] = utils.get_MD5_hash(fileinfo["input_file"], useProgressbar=True)
-
-                    if "input_md5_hash" not in o_fileinfo:
-                        o_fileinfo["input_md5_hash"] = utils.get_MD5_hash(o_fileinfo["input_file"], useProgressbar=True)
-
-                    if fileinfo["input_md5_hash"] == o_fileinfo["input_md5_hash"]:  # MD5 해시가 겹치는 경우 (3차 필터링)
-                        is_dupl = True
-                        dupl_info = o_fileinfo
-                        break
-
-            if isinstance(tqdm_manager, tqdm):
-                if is_dupl:
-                    tqdm_manager.set_description("[DupCheck] 중복 파일 감지됨")
-                else:
-                    tqdm_manager.set_description("[DupCheck] 확인 완료")
-
-            if not is_dupl:
-                temp_hash_dupl_list.append(fileinfo)
+    deduplicator = (
+        Deduplicator(
+            deduplicationMode=deduplicationMode,
+            partialHashSize=partialHashSize,
+            hashAlgorithm=hashAlgorithm,
+            maxWorkers=hashWorkers,
+            maxWorkersPerDevice=hashWorkersPerDevice,
+        )
+        if useDeduplicationFilter
+        else None
+    )
 
-        return (not is_dupl, fileinfo, dupl_info)
-
-    file_count = 0
-    dupl_file_count = 0
-    source_infos = []
+    # 1. 입력 경로에서 파일 검색
+    detected_targets = []
 
     input_iter = (
         tqdm(inputPaths, desc="입력 경로에서 파일 검색 중...", leave=leave, dynamic_ncols=True) if useProgressbar else inputPaths
@@ -340,31 +425,111 @@ def get_source_file(
         input_filepath = os.path.normpath(input_filepath)
         detected_fileinfos = []
 
-        media_files = utils.get_media_files(input_filepath, mediaExtFilter=mediaExtFilter)
-        media_files_iter = tqdm(media_files, leave=False, dynamic_ncols=True) if useProgressbar else media_files
-        for detected_filepath in media_files_iter:
+        # 검색과 동시에 처리하며, 파일 크기는 검색 시 얻은 정보를 재사용
+        media_files = utils.scan_media_files(input_filepath, mediaExtFilter=mediaExtFilter)
+        media_files_iter = (
+            tqdm(media_files, unit="file", leave=False, dynamic_ncols=True) if useProgressbar else media_files
+        )
+        for detected_filepath, detected_filesize in media_files_iter:
             if useProgressbar:
                 media_files_iter.set_postfix(filepath=detected_filepath.replace(input_filepath, ""))
 
-            if (
-                dupl_test_result := gen_fileinfo(
-                    detected_filepath, tqdm_manager=media_files_iter if useProgressbar else None
-                )
-            )[0]:
-                detected_fileinfos.append(dupl_test_result[1])
-                file_count += 1
-            else:
-                logger.warning(
-                    f"중복 파일이 제외되었습니다.\nOrigin: {pformat(dupl_test_result[1])}\nTest: {pformat(dupl_test_result[2])}"
-                )
+            detected_fileinfos.append({"input_file": detected_filepath, "input_file_size": detected_filesize})
+
+        detected_targets.append((input_filepath, detected_fileinfos))
+
+    # 2. 크기가 같은 파일의 해시를 병렬로 미리 계산
+    if deduplicator is not None:
+        deduplicator.prefetch_hashes(
+            [fileinfo for _, fileinfos in detected_targets for fileinfo in fileinfos], useProgressbar=useProgressbar
+        )
+
+    # 3. 검색 순서대로 중복 파일 제외 (먼저 검색된 파일을 유지)
+    file_count = 0
+    dupl_file_count = 0
+    source_infos = []
+
+    for input_filepath, detected_fileinfos in detected_targets:
+        unique_fileinfos = []
+
+        for fileinfo in detected_fileinfos:
+            if deduplicator is not None and (dupl_info := deduplicator.find_duplicate(fileinfo)) is not None:
+                logger.warning(f"중복 파일이 제외되었습니다.\nOrigin: {pformat(fileinfo)}\nTest: {pformat(dupl_info)}")
                 dupl_file_count += 1
+            else:
+                unique_fileinfos.append(fileinfo)
+                file_count += 1
 
-        if len(detected_fileinfos) > 0:
-            source_infos.append({"target": input_filepath, "files": detected_fileinfos})
+        if len(unique_fileinfos) > 0:
+            source_infos.append({"target": input_filepath, "files": unique_fileinfos})
 
     return (source_infos, file_count, dupl_file_count)
 
 
+def iter_source_files(
+    inputPaths: List[str],
+    mediaExtFilter: Union[List[str], None] = None,
+    useDeduplicationFilter=True,
+    deduplicationMode: str = "staged",
+    partialHashSize: int = 4194304,
+    hashAlgorithm: str = "md5",
+) -> Iterator[Tuple[Dict, Optional[Dict]]]:
+    """입력 경로에서 소스파일을 검색하는 즉시 반환합니다.
+
+    get_source_file 과 달리 전체 검색이 끝나기를 기다리지 않으며, 중복 여부는 지금까지 검색된 파일을 기준으로 판단합니다.
+
+    Args:
+        inputPaths (List[str]): 입력 경로
+        mediaExtFilter (Union[List[str], None], optional): 미디어 확장자 필터. Defaults to None.
+        useDeduplicationFilter (bool, optional): 중복 파일 필터링 사용 여부. Defaults to True.
+        deduplicationMode (str, optional): 크기가 같은 파일의 내용 비교 방식. Defaults to "staged".
+        partialHashSize (int, optional): 부분 해시의 각 부분 크기. Defaults to 4194304 (4MB).
+        hashAlgorithm (str, optional): 중복 확인에 사용할 해시 알고리즘. Defaults to "md5".
+
+    Yields:
+        Tuple[Dict, Optional[Dict]]: 소스 파일 정보, 중복된 기존 파일 정보 (중복되지 않은 경우 None)
+    """
+
+    deduplicator = (
+        Deduplicator(
+            deduplicationMode=deduplicationMode,
+            partialHashSize=partialHashSize,
+            hashAlgorithm=hashAlgorithm,
+        )
+        if useDeduplicationFilter
+        else None
+    )
+
+    for input_filepath in inputPaths:
+        input_filepath = os.path.normpath(input_filepath)
+
+        for detected_filepath, detected_filesize in utils.scan_media_files(
+            input_filepath, mediaExtFilter=mediaExtFilter
+        ):
+            fileinfo = {"input_file": detected_filepath, "input_file_size": detected_filesize}
+
+            yield (fileinfo, deduplicator.find_duplicate(fileinfo) if deduplicator is not None else None)
+
+
+def convert_source_info(sourceInfo: Dict[str, Any]) -> FileInfo:
+    """소스 파일 정보 Dict 하나를 FileInfo로 변환합니다.
+
+    Args:
+        sourceInfo (Dict[str, Any]): 소스 파일 정보
+
+    Returns:
+        FileInfo: 변환된 FileInfo
+    """
+
+    # 입력 파일 크기는 FileInfo 생성 시 만들어지는 상태 정보 스냅숏에서 가져옴
+    file_info = FileInfo(sourceInfo["input_file"])
+
+    if input_md5_hash := sourceInfo.get("input_md5_hash"):
+        file_info.input_file_MD5 = input_md5_hash
+
+    return file_info
+
+
 def convert_SI2FI(source_infos: List[Dict[str, Any]]) -> List[FileInfo]:
     """소스 파일 정보 Dict의 형식을 FileInfo로 변환합니다.
 
@@ -375,16 +540,44 @@ def convert_SI2FI(source_infos: List[Dict[str, Any]]) -> List[FileInfo]:
         List[FileInfo]: 변환된 FileInfo 리스트
     """
 
-    result = []
+    return [convert_source_info(file) for source_info in source_infos for file in source_info["files"]]
+
+
+def convert_source_record(sourceInfo: Dict[str, Any]) -> FileRecord:
+    """소스 파일 정보 Dict 하나를 FileRecord로 변환합니다.
+
+    FileInfo 와 달리 파일 시스템에 접근하지 않으며, 파일이 존재하는지는 FileInfo 로 변환할 때 확인합니다.
+
+    Args:
+        sourceInfo (Dict[str, Any]): 소스 파일 정보
+
+    Returns:
+        FileRecord: 변환된 FileRecord
+    """
+
+    return FileRecord(
+        sourceInfo["input_file"],
+        inputFilesize=sourceInfo.get("input_file_size") or 0,
+        inputFileMD5=sourceInfo.get("input_md5_hash"),
+    )
+
+
+def convert_SI2FR(source_infos: List[Dict[str, Any]]) -> List[FileRecord]:
+    """소스 파일 정보 Dict의 형식을 FileRecord로 변환합니다.
+
+    변환이 끝난 소스 파일 정보는 순서대로 비워지므로, 변환 도중에도 메모리 사용량이 늘어나지 않습니다.
 
-    for source_info in [file for source_info in source_infos for file in source_info["files"]]:
-        result.append(file_info := FileInfo(source_info["input_file"]))
+    Args:
+        source_infos (List[Dict[str, Any]]): 소스 파일 정보 리스트
 
-        data = file_info.as_dict()
+    Returns:
+        List[FileRecord]: 변환된 FileRecord 리스트
+    """
 
-        if input_file_size := source_info.get("input_file_size"):
-            data["input_filesize"] = input_file_size
-        if input_md5_hash := source_info.get("input_md5_hash"):
-            data["input_file_MD5"] = input_md5_hash
+    file_records = []
+    for source_info in source_infos:
+        files = source_info["files"]
+        file_records.extend(convert_source_record(file) for file in files)
+        files.clear()
 
-    return result
+    return file_records
@@ -0,0 +1,243 @@
+from fractions import Fraction
+from typing import Dict, Optional
+
+from py_media_compressor import log
+from py_media_compressor.encoder import crf_search
+from py_media_compressor.model import FFmpegArgs
+from py_media_compressor.model.enum import FileTaskStatus
+
+# 크기 초과 작업 통과 기준, 출력 크기가 입력 파일 크기보다 이 값 이상 커질 경우 즉시 통과
+SIZE_SKIP_OFFSET = 10485760  # 10 * 1024 * 1024 (10MB)
+
+# 같은 화질에 필요한 비트레이트의 상대적인 비율 (h.264 = 1.0)
+CODEC_BITRATE_FACTORS = {
+    "mpeg1video": 2.0,
+    "mpeg2video": 2.0,
+    "mjpeg": 4.0,
+    "mpeg4": 1.5,
+    "msmpeg4v2": 1.6,
+    "msmpeg4v3": 1.6,
+    "wmv1": 1.6,
+    "wmv2": 1.5,
+    "wmv3": 1.3,
+    "vc1": 1.3,
+    "h263": 1.7,
+    "vp8": 1.1,
+    "h264": 1.0,
+    "vp9": 0.7,
+    "hevc": 0.6,
+    "av1": 0.5,
+}
+
+# 출력 코덱별 기준 CRF 및 해당 CRF 에서의 평균 비트/픽셀 (CRF 가 6 증가할 때마다 약 절반이 됨)
+OUTPUT_BPP_REFERENCES = {
+    "h.264": (23, 0.08),
+    "h.265": (28, 0.05),
+}
+
+
+def _parse_frame_rate(value: Optional[str]) -> Optional[float]:
+    try:
+        frame_rate = float(Fraction(value))
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return frame_rate if frame_rate > 0 else None
+
+
+def is_estimate_enabled(ffmpegArgs: FFmpegArgs) -> bool:
+    """출력 크기 비율 예측을 사용할 수 있는지 확인합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        bool: 사용할 수 있을 경우 True를 반환합니다.
+    """
+
+    return (
+        ffmpegArgs.encode_option.estimate_threshold > 0
+        and not ffmpegArgs.is_only_audio
+        and not ffmpegArgs.is_streamcopy
+        and "crf" in ffmpegArgs
+    )
+
+
+def get_video_info(ffmpegArgs: FFmpegArgs) -> Optional[Dict]:
+    """예측에 필요한 입력 비디오 정보를 ffprobe 결과에서 가져옵니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        Optional[Dict]: 코덱, 해상도, 프레임 레이트, 재생 시간, 비디오 비트레이트, 필요한 정보가 없을 경우 None을 반환합니다.
+    """
+
+    video_stream = ffmpegArgs.video_stream
+    format_info = ffmpegArgs.probe_info.get("format", {})
+
+    width = video_stream.get("width") or video_stream.get("coded_width")
+    height = video_stream.get("height") or video_stream.get("coded_height")
+    frame_rate = _parse_frame_rate(video_stream.get("avg_frame_rate")) or _parse_frame_rate(
+        video_stream.get("r_frame_rate")
+    )
+
+    try:
+        duration = float(format_info["duration"])
+    except (KeyError, ValueError):
+        return None
+
+    if not width or not height or frame_rate is None or duration <= 0:
+        return None
+
+    # 스트림 비트레이트가 없는 컨테이너 (mkv 등) 는 전체 비트레이트에서 오디오 비트레이트를 제외하여 계산
+    try:
+        video_bitrate = int(video_stream["bit_rate"])
+    except (KeyError, ValueError):
+        audio_bitrate = 0
+        for audio_stream in ffmpegArgs.audio_streams:
+            try:
+                audio_bitrate += int(audio_stream.get("bit_rate", 0))
+            except ValueError:
+                pass
+        video_bitrate = ffmpegArgs.file_info.input_filesize * 8 / duration - audio_bitrate
+
+    if video_bitrate <= 0:
+        return None
+
+    return {
+        "codec_name": str(video_stream.get("codec_name", "")).lower(),
+        "width": int(width),
+        "height": int(height),
+        "frame_rate": frame_rate,
+        "duration": duration,
+        "video_bitrate": video_bitrate,
+    }
+
+
+def estimate_output_ratio(ffmpegArgs: FFmpegArgs) -> Optional[float]:
+    """ffprobe 결과만으로 입력 파일 대비 출력 크기 비율을 예측합니다.
+
+    출력 비트레이트는 출력 코덱, CRF 및 출력 해상도의 평균적인 비트/픽셀로 계산하고,
+    입력 비트/픽셀이 이미 낮은 효율적인 코덱일수록 출력이 상대적으로 커지는 것으로 예측합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+
+    Returns:
+        Optional[float]: 예상 출력 크기 비율, 예측할 수 없는 경우 None을 반환합니다.
+    """
+
+    encode_option = ffmpegArgs.encode_option
+
+    if (video_info := get_video_info(ffmpegArgs)) is None:
+        return None
+
+    width, height = video_info["width"], video_info["height"]
+    if height > (max_height := encode_option.max_height) > 0:
+        width, height = width * max_height / height, max_height
+
+    crf = ffmpegArgs["crf"]
+    reference_crf, reference_bpp = OUTPUT_BPP_REFERENCES.get(encode_option.codec, OUTPUT_BPP_REFERENCES["h.264"])
+    output_bpp = reference_bpp * 2 ** ((reference_crf - crf) / 6)
+
+    # 원본이 같은 화질을 표현하는 데 사용한 비트/픽셀 (h.264 기준으로 환산) 보다 더 많은 비트를 사용하지 않음
+    input_bpp = video_info["video_bitrate"] / (video_info["width"] * video_info["height"] * video_info["frame_rate"])
+    input_h264_bpp = input_bpp / CODEC_BITRATE_FACTORS.get(video_info["codec_name"], 1.0)
+    output_codec_factor = CODEC_BITRATE_FACTORS["hevc" if encode_option.codec == "h.265" else "h264"]
+    output_bpp = min(output_bpp, input_h264_bpp * output_codec_factor * 1.25)
+
+    output_bitrate = output_bpp * width * height * video_info["frame_rate"] + crf_search.get_audio_bitrate(ffmpegArgs)
+    input_bitrate = ffmpegArgs.file_info.input_filesize * 8 / video_info["duration"]
+
+    return output_bitrate / input_bitrate
+
+
+def apply_estimate_filter(ffmpegArgs: FFmpegArgs, inputArgs: Optional[Dict] = None):
+    """예상 출력 크기 비율이 기준보다 클 경우, 작업 상태를 PASS 로 변경하여 전체 인코딩을 실행하지 않도록 합니다.
+
+    Args:
+        ffmpegArgs (FFmpegArgs): 인코더, 파일 소스를 포함한 인수
+        inputArgs (Optional[Dict], optional): 샘플 인코딩 시 사용할 입력 파일 인수. Defaults to None.
+    """
+
+    logger = log.get_logger(apply_estimate_filter)
+
+    encode_option = ffmpegArgs.encode_option
+
+    try:
+        estimated_ratio = estimate_output_ratio(ffmpegArgs)
+    except Exception:
+        logger.warning("출력 크기를 예측할 수 없습니다.", exc_info=True)
+        return
+
+    if estimated_ratio is None:
+        logger.debug("출력 크기를 예측하기 위한 정보가 부족합니다.")
+        return
+
+    logger.debug(f"[estimate] 예상 출력 크기 비율: {estimated_ratio:.3f}")
+
+    if encode_option.is_estimate_with_sample:
+        try:
+            estimated_ratio, _ = crf_search.measure_crf(ffmpegArgs, ffmpegArgs["crf"], inputArgs=inputArgs)
+            logger.debug(f"[estimate] 샘플 인코딩 기준 예상 출력 크기 비율: {estimated_ratio:.3f}")
+        except Exception:
+            logger.warning("샘플 인코딩 실패, ffprobe 결과로 예측한 값을 사용합니다.", exc_info=True)
+
+    if estimated_ratio > encode_option.estimate_threshold:
+        logger.info(
+            f"[estimate] 출력 크기가 충분히 줄어들지 않을 것으로 예상됩니다. "
+            f"({estimated_ratio:.3f} > {encode_option.estimate_threshold})\nFileInfo: {ffmpegArgs.file_info}"
+        )
+        ffmpegArgs.file_info.status = FileTaskStatus.PASS
+
+
+def project_output_size(currentSize: int, currentTime: float, totalDuration: float) -> Optional[float]:
+    """현재까지의 출력 크기와 인코딩된 재생 시간으로 최종 출력 크기를 추정합니다.
+
+    Args:
+        currentSize (int): 현재 출력 크기
+        currentTime (float): 인코딩된 재생 시간 (초)
+        totalDuration (float): 전체 재생 시간 (초)
+
+    Returns:
+        Optional[float]: 예상 최종 출력 크기, 추정할 수 없는 경우 None을 반환합니다.
+    """
+
+    if currentTime <= 0 or totalDuration <= 0:
+        return None
+
+    return currentSize / min(currentTime / totalDuration, 1.0)
+
+
+def is_projected_oversize(
+    currentSize: int,
+    currentTime: float,
+    totalDuration: float,
+    inputFilesize: int,
+    warmup: float = 0.1,
+    margin: float = 0.2,
+) -> bool:
+    """예상 최종 출력 크기가 입력 파일 크기를 확실히 넘는지 확인합니다.
+
+    진행률이 낮을수록 추정 오차가 크므로, 남은 진행률에 비례하는 여유분을 두고 판단합니다.
+    (예: margin=0.2, 진행률 25% 일 경우 예상 크기가 입력 크기의 115% 를 넘어야 함)
+
+    Args:
+        currentSize (int): 현재 출력 크기
+        currentTime (float): 인코딩된 재생 시간 (초)
+        totalDuration (float): 전체 재생 시간 (초)
+        inputFilesize (int): 입력 파일 크기
+        warmup (float, optional): 추정을 시작할 최소 진행률 (0~1). Defaults to 0.1.
+        margin (float, optional): 진행률 0% 기준 여유분 비율. Defaults to 0.2.
+
+    Returns:
+        bool: 입력 파일보다 커질 것으로 판단될 경우 True를 반환합니다.
+    """
+
+    if totalDuration <= 0 or (progress := currentTime / totalDuration) < warmup:
+        return False
+
+    if (projected_size := project_output_size(currentSize, currentTime, totalDuration)) is None:
+        return False
+
+    return projected_size > inputFilesize * (1 + margin * max(1 - progress, 0))
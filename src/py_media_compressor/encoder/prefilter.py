@@ -0,0 +1,108 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from py_media_compressor import cache, log, utils
+from py_media_compressor.const import IGNORE_STREAM_FILTER
+from py_media_compressor.encoder.args_builder import get_format_tags, parse_processed_comment
+from py_media_compressor.model import EncodeOption, FileInfo
+from py_media_compressor.model.enum import FileTaskStatus
+
+
+def _get_video_height(probeInfo: Dict) -> Optional[int]:
+    for stream in probeInfo.get("streams", []):
+        if stream.get("codec_type") == "video" and stream.get("codec_name") not in IGNORE_STREAM_FILTER:
+            if (height := stream.get("height")) is None:
+                height = stream.get("coded_height")
+            return height
+    return None
+
+
+def is_processed_file(fileInfo: FileInfo, encodeOption: EncodeOption) -> bool:
+    """ffprobe 를 실행하지 않고, 이미 처리되어 건너뛸 수 있는 파일인지 확인합니다.
+
+    캐시된 ffprobe 결과가 있다면 이를 사용하고, 없다면 MP4 컨테이너의 Comment 메타데이터를 직접 읽습니다.
+    판단할 수 없는 경우에는 False를 반환하며, 이후 단계에서 기존 방식대로 확인됩니다.
+
+    Args:
+        fileInfo (FileInfo): 파일 정보
+        encodeOption (EncodeOption): 인코드 옵션
+
+    Returns:
+        bool: 이미 처리된 파일일 경우 True, 아니거나 판단할 수 없는 경우 False를 반환합니다.
+    """
+
+    if encodeOption.is_force:
+        return False
+
+    probe_info = None
+    if (probe_cache := cache.get_probe_cache()) is not None:
+        probe_info = probe_cache.get(fileInfo.input_filepath)
+
+    if probe_info is not None:
+        is_processed, _, _ = parse_processed_comment(get_format_tags(probe_info).get("comment"))
+
+        if (
+            is_processed
+            and encodeOption.is_force_res
+            and encodeOption.max_height > 0
+            and (height := _get_video_height(probe_info)) is not None
+            and height > encodeOption.max_height
+        ):
+            return False
+
+        return is_processed
+
+    # 해상도 비교가 필요한 경우, 스트림 정보 없이 판단할 수 없음
+    if encodeOption.is_force_res:
+        return False
+
+    if os.path.splitext(fileInfo.input_filepath)[1].lower() not in utils.MP4_FILE_EXT_LIST:
+        return False
+
+    is_processed, _, _ = parse_processed_comment(utils.read_mp4_comment(fileInfo.input_filepath))
+    return is_processed
+
+
+def filter_processed_files(
+    fileInfos: List[FileInfo],
+    encodeOption: EncodeOption,
+    useProgressbar=False,
+    leave=True,
+) -> Tuple[List[FileInfo], List[FileInfo]]:
+    """이미 처리된 파일을 인코딩 전에 걸러냅니다.
+
+    Args:
+        fileInfos (List[FileInfo]): 파일 정보 리스트
+        encodeOption (EncodeOption): 인코드 옵션
+        useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
+        leave (bool, optional): 중첩된 진행바를 사용할 경우, False 를 권장합니다. Defaults to True.
+
+    Returns:
+        Tuple[List[FileInfo], List[FileInfo]]: 처리가 필요한 파일 정보 리스트, 건너뛴 파일 정보 리스트
+    """
+
+    logger = log.get_logger(filter_processed_files)
+
+    remaining_file_infos = []
+    skipped_file_infos = []
+
+    file_infos_iter = (
+        tqdm(fileInfos, desc="이미 처리된 파일 확인 중...", leave=leave, dynamic_ncols=True) if useProgressbar else fileInfos
+    )
+    for file_info in file_infos_iter:
+        try:
+            is_processed = is_processed_file(file_info, encodeOption)
+        except Exception:
+            logger.debug(f"사전 검사 실패, 기존 방식으로 확인합니다.\nFileInfo: {file_info}", exc_info=True)
+            is_processed = False
+
+        if is_processed:
+            file_info.status = FileTaskStatus.SKIPPED
+            skipped_file_infos.append(file_info)
+            logger.debug(f"이미 처리된 미디어입니다. (사전 검사)\nFileInfo: {file_info}")
+        else:
+            remaining_file_infos.append(file_info)
+
+    return (remaining_file_infos, skipped_file_infos)
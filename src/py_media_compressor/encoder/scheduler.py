@@ -0,0 +1,161 @@
+import heapq
+from fractions import Fraction
+from typing import Dict, List, Optional
+
+from tqdm import tqdm
+
+from py_media_compressor import cache, log
+from py_media_compressor.const import IGNORE_STREAM_FILTER
+from py_media_compressor.model import EncodeOption, FileInfo
+
+# 출력 코덱별 픽셀당 상대적인 인코딩 비용 (h.264 = 1.0)
+ENCODE_COST_FACTORS = {
+    "h.264": 1.0,
+    "h.265": 2.5,
+}
+
+# 입력 코덱별 픽셀당 상대적인 디코딩 비용 (h.264 인코딩 = 1.0 기준)
+DECODE_COST_FACTORS = {
+    "mpeg1video": 0.05,
+    "mpeg2video": 0.05,
+    "mjpeg": 0.05,
+    "mpeg4": 0.08,
+    "h264": 0.1,
+    "vp8": 0.1,
+    "vp9": 0.15,
+    "hevc": 0.2,
+    "av1": 0.3,
+}
+
+# 오디오만 있는 파일의 초당 비용 (1080p30 비디오 인코딩 비용의 약 1/300)
+AUDIO_COST_PER_SECOND = 2e5
+
+# 비디오 비트/픽셀 평균값, ffprobe 결과가 없을 경우 파일 크기로 비용을 추정할 때 사용
+FALLBACK_BITS_PER_PIXEL = 0.1
+
+
+def _get_video_stream(probeInfo: Dict) -> Optional[Dict]:
+    for stream in probeInfo.get("streams", []):
+        if (
+            str(stream.get("codec_type", "")).lower() == "video"
+            and str(stream.get("codec_name", "")).lower() not in IGNORE_STREAM_FILTER
+        ):
+            return stream
+    return None
+
+
+def _get_frame_rate(videoStream: Dict) -> float:
+    for key in ["avg_frame_rate", "r_frame_rate"]:
+        try:
+            if (frame_rate := float(Fraction(videoStream.get(key)))) > 0:
+                return frame_rate
+        except (TypeError, ValueError, ZeroDivisionError):
+            pass
+    return 30.0
+
+
+def get_encode_cost(fileInfo: FileInfo, encodeOption: EncodeOption) -> float:
+    """ffprobe 결과로 파일의 상대적인 인코딩 비용을 추정합니다.
+
+    비용은 재생 시간 × 프레임 레이트 × 픽셀 수 × 코덱별 비용 계수로 계산되며, 단위는 파일 사이에서 비교하는 용도로만 사용합니다.
+    ffprobe 결과를 가져올 수 없는 경우, 파일 크기로 추정합니다.
+
+    Args:
+        fileInfo (FileInfo): 파일 정보
+        encodeOption (EncodeOption): 인코드 옵션
+
+    Returns:
+        float: 추정 인코딩 비용
+    """
+
+    encode_factor = ENCODE_COST_FACTORS.get(encodeOption.codec, 1.0)
+    fallback_cost = fileInfo.input_filesize * 8 / FALLBACK_BITS_PER_PIXEL * encode_factor
+
+    try:
+        probe_info = cache.get_probe_info(fileInfo.input_filepath)
+        duration = float(probe_info["format"]["duration"])
+    except Exception:
+        log.get_logger(get_encode_cost).debug(f"인코딩 비용을 추정할 수 없습니다.\nFileInfo: {fileInfo}", exc_info=True)
+        return fallback_cost
+
+    if (video_stream := _get_video_stream(probe_info)) is None:
+        return duration * AUDIO_COST_PER_SECOND
+
+    width = video_stream.get("width") or video_stream.get("coded_width")
+    height = video_stream.get("height") or video_stream.get("coded_height")
+    if not width or not height:
+        return fallback_cost
+
+    frames = duration * _get_frame_rate(video_stream)
+    decode_cost = width * height * DECODE_COST_FACTORS.get(str(video_stream.get("codec_name", "")).lower(), 0.1)
+
+    # 최대 세로 픽셀보다 큰 경우, 축소된 해상도로 인코딩됨
+    if height > (max_height := encodeOption.max_height) > 0:
+        width, height = width * max_height / height, max_height
+    encode_cost = width * height * encode_factor
+
+    return frames * (encode_cost + decode_cost)
+
+
+def estimate_makespan(costs: List[float], jobs: int) -> float:
+    """주어진 순서대로 비어 있는 작업자에게 할당할 때, 전체 작업 완료까지의 비용을 계산합니다.
+
+    Args:
+        costs (List[float]): 할당 순서대로 정렬된 작업별 비용
+        jobs (int): 작업자 수
+
+    Returns:
+        float: 가장 늦게 끝나는 작업자의 누적 비용
+    """
+
+    workers = [0.0] * max(jobs, 1)
+
+    for cost in costs:
+        heapq.heapreplace(workers, workers[0] + cost)
+
+    return max(workers)
+
+
+def schedule_by_cost(
+    fileInfos: List[FileInfo], encodeOption: EncodeOption, jobs: int = 1, useProgressbar=False, leave=True
+) -> List[FileInfo]:
+    """추정 인코딩 비용이 큰 파일부터 처리하도록 정렬합니다. (LPT, Longest Processing Time first)
+
+    작업자는 정렬된 순서대로 다음 파일을 가져가므로, 긴 작업이 먼저 시작되고 짧은 작업이 마지막에 남는 작업자의 빈 시간을 채웁니다.
+
+    Args:
+        fileInfos (List[FileInfo]): 파일 정보 리스트
+        encodeOption (EncodeOption): 인코드 옵션
+        jobs (int, optional): 동시에 실행할 작업 수. Defaults to 1.
+        useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
+        leave (bool, optional): 중첩된 진행바를 사용할 경우, False 를 권장합니다. Defaults to True.
+
+    Returns:
+        List[FileInfo]: 정렬된 파일 정보 리스트
+    """
+
+    logger = log.get_logger(schedule_by_cost)
+
+    costs = {
+        id(file_info): get_encode_cost(file_info, encodeOption)
+        for file_info in (
+            tqdm(fileInfos, desc="Estimating cost...", leave=leave, dynamic_ncols=True) if useProgressbar else fileInfos
+        )
+    }
+
+    scheduled_file_infos = sorted(fileInfos, key=lambda fi: costs[id(fi)], reverse=True)
+
+    if jobs > 1 and len(scheduled_file_infos) > 0:
+        scheduled_costs = [costs[id(file_info)] for file_info in scheduled_file_infos]
+        lower_bound = max(sum(scheduled_costs) / jobs, scheduled_costs[0])
+        makespan = estimate_makespan(scheduled_costs, jobs)
+        sorted_makespan = estimate_makespan(sorted(scheduled_costs), jobs)
+
+        # 모든 작업의 비용이 0 일 경우 (재생 시간을 알 수 없는 파일 등), 효율을 계산할 수 없음
+        if makespan > 0 and sorted_makespan > 0:
+            logger.info(
+                f"예상 전체 작업 비용 대비 효율: {lower_bound / makespan:.1%} "
+                f"(비용 오름차순 정렬 시: {lower_bound / sorted_makespan:.1%})"
+            )
+
+    return scheduled_file_infos
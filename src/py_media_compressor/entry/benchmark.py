@@ -0,0 +1,417 @@
+import csv
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+import ffmpeg
+import psutil
+
+from py_media_compressor import cache, encoder, log, model, utils
+from py_media_compressor.const import ENCODER_PRESET_LIST
+from py_media_compressor.entry.micro_benchmark import MICRO_BENCHMARK_CASES, run_micro_benchmarks
+from py_media_compressor.model.enum import FileTaskStatus, LogLevel
+from py_media_compressor.utils import pformat
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 합성 미디어 프레임 레이트
+SAMPLE_FRAME_RATE = 30
+
+# 합성 미디어 비디오 소스 (lavfi)
+SAMPLE_VIDEO_SOURCES = {
+    # 움직이는 패턴, 일반적인 영상과 비슷한 압축 난이도
+    "testsrc2": "testsrc2=size={width}x{height}:rate={rate}:duration={duration}",
+    # 매 프레임 무작위 잡음, 압축이 가장 어려운 경우
+    "noise": "color=c=gray:size={width}x{height}:rate={rate}:duration={duration},noise=alls=60:allf=t+u",
+}
+
+REPORT_FIELDS = [
+    "source",
+    "height",
+    "duration",
+    "codec",
+    "preset",
+    "requested_crf",
+    "crf",
+    "status",
+    "frames",
+    "fps",
+    "wall_time",
+    "cpu_time",
+    "peak_rss",
+    "input_filesize",
+    "output_filesize",
+    "output_ratio",
+]
+
+
+class ChildProcessMonitor:
+    """현재 프로세스의 자식 프로세스 (ffmpeg) 가 사용한 CPU 시간 및 최대 메모리 사용량을 측정합니다.
+
+    CPU 시간은 가능한 경우 종료된 자식 프로세스의 자원 사용량 (getrusage) 을 사용하고, 아닐 경우 주기적으로 측정한 값을 사용합니다.
+    """
+
+    def __init__(self, interval: float = 0.1) -> None:
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="benchmark_monitor", daemon=True)
+        self._process = psutil.Process()
+
+        self._cpu_times: Dict[int, float] = {}
+        self._peak_rss = 0
+        self._start_rusage_cpu_time = None
+
+        self.cpu_time = 0.0
+        self.peak_rss = 0
+
+    def _get_rusage_cpu_time(self) -> Optional[float]:
+        if resource is None:
+            return None
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
+
+    def _sample(self):
+        total_rss = 0
+        for child in self._process.children(recursive=True):
+            try:
+                with child.oneshot():
+                    cpu_times = child.cpu_times()
+                    self._cpu_times[child.pid] = cpu_times.user + cpu_times.system
+                    total_rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        self._peak_rss = max(self._peak_rss, total_rss)
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            self._sample()
+
+    def __enter__(self):
+        self._start_rusage_cpu_time = self._get_rusage_cpu_time()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop_event.set()
+        self._thread.join()
+
+        if self._start_rusage_cpu_time is not None:
+            self.cpu_time = self._get_rusage_cpu_time() - self._start_rusage_cpu_time
+        else:
+            self.cpu_time = sum(self._cpu_times.values())
+        self.peak_rss = self._peak_rss
+
+
+def generate_sample(source: str, height: int, duration: float, dirpath: str) -> str:
+    """lavfi 소스를 사용하여 벤치마크용 합성 미디어를 생성합니다.
+
+    압축 전 원본과 비슷하도록 높은 화질의 mpeg4 비디오, 440Hz 사인파 aac 오디오로 저장됩니다.
+
+    Args:
+        source (str): 비디오 소스 이름 (SAMPLE_VIDEO_SOURCES)
+        height (int): 세로 픽셀 수 (가로 픽셀 수는 16:9 비율로 계산됨)
+        duration (float): 재생 시간 (초)
+        dirpath (str): 저장할 디렉토리 경로
+
+    Returns:
+        str: 생성된 파일 경로
+    """
+
+    width = (height * 16 // 9 + 1) // 2 * 2
+    filepath = os.path.join(dirpath, f"sample_{source}_{height}p_{duration:g}s.mp4")
+
+    if os.path.isfile(filepath):
+        return filepath
+
+    video = ffmpeg.input(
+        SAMPLE_VIDEO_SOURCES[source].format(width=width, height=height, rate=SAMPLE_FRAME_RATE, duration=duration),
+        format="lavfi",
+    )
+    audio = ffmpeg.input(f"sine=frequency=440:sample_rate=48000:duration={duration}", format="lavfi")
+
+    stream = ffmpeg.output(
+        video, audio, filepath, pix_fmt="yuv420p", **{"c:v": "mpeg4", "q:v": 2, "c:a": "aac", "b:a": "320k"}
+    )
+    stream = ffmpeg._ffmpeg.global_args(stream, "-hide_banner")
+    stream = ffmpeg.overwrite_output(stream)
+
+    try:
+        ffmpeg.run(stream, capture_stdout=True, capture_stderr=True)
+    except ffmpeg.Error as ex:
+        raise Exception(f"합성 미디어를 생성할 수 없습니다.\nstderr: {utils.string_decode(ex.stderr)}") from ex
+
+    return filepath
+
+
+def run_case(
+    sampleFilepath: str, encodeOption: model.EncodeOption, outputDirpath: str, requestedCrf: Optional[int] = None
+) -> Dict:
+    """합성 미디어 하나를 실제 인코딩 과정 (add_auto_args + media_compress_encode) 으로 인코딩하고 측정합니다.
+
+    결과의 crf 는 실제 인코딩에 사용된 값이며, 입력한 값은 requested_crf 에 기록됩니다.
+
+    Args:
+        sampleFilepath (str): 합성 미디어 파일 경로
+        encodeOption (model.EncodeOption): 인코드 옵션
+        outputDirpath (str): 출력 디렉토리 경로
+        requestedCrf (Optional[int], optional): 입력한 crf 값, None 일 경우 인코드 옵션의 값. Defaults to None.
+
+    Returns:
+        Dict: 측정 결과
+    """
+
+    file_info = model.FileInfo(sampleFilepath)
+    ffmpeg_args = model.FFmpegArgs(fileInfo=file_info, encodeOption=encodeOption)
+
+    name = os.path.splitext(os.path.basename(sampleFilepath))[0]
+    file_info.output_filepath = os.path.join(
+        outputDirpath,
+        f"{name}_{encodeOption.codec}_{encodeOption.preset}_{encodeOption.crf}{ffmpeg_args.expected_ext}",
+    )
+
+    duration = float(ffmpeg_args.probe_info["format"]["duration"])
+    frames = round(duration * SAMPLE_FRAME_RATE)
+
+    with ChildProcessMonitor() as monitor:
+        start_time = time.perf_counter()
+        file_info = encoder.media_compress_encode(ffmpeg_args)
+        wall_time = time.perf_counter() - start_time
+
+    is_success = file_info.status == FileTaskStatus.SUCCESS
+    output_filesize = file_info.output_filesize if is_success else None
+
+    if is_success:
+        utils.remove(file_info.output_filepath, raise_error=False)
+
+    return {
+        "codec": encodeOption.codec,
+        "preset": encodeOption.preset,
+        "requested_crf": requestedCrf if requestedCrf is not None else encodeOption.crf,
+        # add_auto_args 및 crf 탐색으로 결정된 실제 crf 값 (-1 을 입력한 경우 코덱 기본값)
+        "crf": ffmpeg_args.as_dict().get("crf"),
+        "status": file_info.status.name,
+        "frames": frames,
+        "fps": round(frames / wall_time, 3) if wall_time > 0 else None,
+        "wall_time": round(wall_time, 3),
+        "cpu_time": round(monitor.cpu_time, 3),
+        "peak_rss": monitor.peak_rss,
+        "input_filesize": file_info.input_filesize,
+        "output_filesize": output_filesize,
+        "output_ratio": round(output_filesize / file_info.input_filesize, 4) if is_success else None,
+    }
+
+
+def write_result_line(line: str):
+    """측정 결과 한 줄을 표준 출력에 기록합니다.
+
+    측정 결과는 로그 레벨과 관계없이 항상 출력되어야 하므로, 로거 대신 표준 출력을 사용합니다.
+
+    Args:
+        line (str): 출력할 결과
+    """
+
+    sys.stdout.write(f"{line}\n")
+    sys.stdout.flush()
+
+
+def save_report(results: List[Dict], filepath: str):
+    """측정 결과를 저장합니다. 확장자가 .csv 일 경우 CSV, 아닐 경우 JSON 으로 저장됩니다.
+    CSV 의 열은 인코딩 측정 결과일 경우 REPORT_FIELDS, 아닐 경우 첫 결과의 항목 순서를 따릅니다.
+
+    Args:
+        results (List[Dict]): 측정 결과 리스트
+        filepath (str): 저장할 파일 경로
+    """
+
+    if (dirpath := os.path.dirname(filepath)) != "":
+        os.makedirs(dirpath, exist_ok=True)
+
+    if os.path.splitext(filepath)[1].lower() == ".csv":
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
+            fieldnames = REPORT_FIELDS if len(results) == 0 or "codec" in results[0] else list(results[0].keys())
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="합성 미디어로 인코딩 속도, 자원 사용량 및 압축률을 측정합니다.")
+
+    parser.add_argument(
+        "-o",
+        dest="output",
+        default="benchmark_report.json",
+        help="측정 결과 저장 경로 (.json 또는 .csv, 기본값: benchmark_report.json)",
+    )
+    parser.add_argument(
+        "--work_dir",
+        dest="work_dir",
+        default="",
+        help="합성 미디어 및 출력 파일을 저장할 디렉토리 경로, 지정할 경우 생성된 합성 미디어를 다음 실행에서 재사용합니다. (기본값: 임시 디렉토리)",
+    )
+    parser.add_argument(
+        "--sources",
+        dest="sources",
+        nargs="+",
+        choices=list(SAMPLE_VIDEO_SOURCES.keys()),
+        default=["testsrc2", "noise"],
+        help="합성 비디오 소스 (testsrc2 = 움직이는 패턴, noise = 무작위 잡음)",
+    )
+    parser.add_argument(
+        "--heights",
+        dest="heights",
+        nargs="+",
+        type=int,
+        default=[480, 720, 1080],
+        help="합성 미디어의 세로 픽셀 수 (가로는 16:9 비율)",
+    )
+    parser.add_argument(
+        "--durations",
+        dest="durations",
+        nargs="+",
+        type=float,
+        default=[10.0],
+        help="합성 미디어의 재생 시간 (초)",
+    )
+    parser.add_argument(
+        "--codecs",
+        dest="codecs",
+        nargs="+",
+        choices=["h.264", "h.265"],
+        default=["h.264", "h.265"],
+        help="측정할 비디오 코덱",
+    )
+    parser.add_argument(
+        "--presets",
+        dest="presets",
+        nargs="+",
+        choices=ENCODER_PRESET_LIST,
+        default=["medium", "slower"],
+        help="측정할 인코더 프리셋",
+    )
+    parser.add_argument(
+        "--crfs",
+        dest="crfs",
+        nargs="+",
+        type=int,
+        default=[-1],
+        help="측정할 crf 값 (-1을 입력하면 코덱에 따라 기본값이 자동으로 계산됩니다.)",
+    )
+    parser.add_argument(
+        "--threads",
+        dest="threads",
+        type=int,
+        default=0,
+        help="ffmpeg 스레드 수 (0을 입력하면 ffmpeg가 결정)",
+    )
+    parser.add_argument(
+        "--micro",
+        dest="micro",
+        action="store_true",
+        help="인코딩 대신, Python 코드의 주요 실행 경로 (DictDataBase, get_logger, 진행 메시지 처리, 중복 확인) 를 측정합니다. (ffmpeg 불필요)",
+    )
+    parser.add_argument(
+        "--micro_cases",
+        dest="micro_cases",
+        nargs="+",
+        choices=list(MICRO_BENCHMARK_CASES.keys()),
+        default=None,
+        help="--micro 사용 시, 측정할 대상 (기본값: 전체)",
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=5,
+        help="--micro 사용 시, 측정 반복 횟수 (기본값: 5)",
+    )
+    parser.add_argument(
+        "--log_level",
+        dest="log_level",
+        choices=[ll.name.lower() for ll in LogLevel if ll.name != "DEFAULT"],
+        default="warning",
+        help="로그 레벨 설정",
+    )
+
+    args = vars(parser.parse_args())
+
+    log.SETTINGS["level"] = LogLevel[args["log_level"].upper()]
+    log.SETTINGS["use_rotatingfile"] = False
+
+    # 측정 결과에 캐시 상태가 영향을 주지 않도록 함
+    cache.SETTINGS["enabled"] = False
+
+    logger = log.get_logger(main)
+
+    if args["micro"]:
+        results = run_micro_benchmarks(args["micro_cases"], repeat=max(args["repeat"], 1))
+        for result in results:
+            write_result_line(
+                f"{result['case']:>24} best={result['best_us']:>12.3f}us mean={result['mean_us']:>12.3f}us"
+            )
+
+        save_report(results, args["output"])
+        logger.info(f"측정 결과 저장 완료: {args['output']}")
+        return
+
+    if not utils.check_command_availability("ffmpeg -version")[0]:
+        logger.critical("ffmpeg 동작 확인 불가, 벤치마크는 ffmpeg 및 ffprobe가 필요합니다.")
+        return
+
+    is_temp_work_dir = utils.is_str_empty_or_space(args["work_dir"])
+    work_dirpath = tempfile.mkdtemp(prefix="amcp_benchmark_") if is_temp_work_dir else args["work_dir"]
+    output_dirpath = os.path.join(work_dirpath, "output")
+    os.makedirs(output_dirpath, exist_ok=True)
+
+    results = []
+
+    try:
+        for source, height, duration in itertools.product(args["sources"], args["heights"], args["durations"]):
+            sample_filepath = generate_sample(source, height, duration, work_dirpath)
+            logger.info(f"합성 미디어 생성 완료: {sample_filepath}")
+
+            for codec, preset, crf in itertools.product(args["codecs"], args["presets"], args["crfs"]):
+                encode_option = model.EncodeOption(
+                    maxHeight=max(args["heights"]),
+                    isForce=True,
+                    codec=codec,
+                    crf=crf,
+                    preset=preset,
+                    threads=max(args["threads"], 0),
+                )
+
+                try:
+                    result = run_case(sample_filepath, encode_option, output_dirpath, requestedCrf=crf)
+                except Exception:
+                    logger.error(f"측정 실패: {sample_filepath}", exc_info=True)
+                    continue
+
+                result = {"source": source, "height": height, "duration": duration, **result}
+                results.append(result)
+                write_result_line(
+                    f"{source:>8} {height:>5}p {duration:>6g}s {codec} {preset:>9} crf={str(result['crf']):<2} "
+                    f"fps={result['fps']} wall={result['wall_time']}s cpu={result['cpu_time']}s "
+                    f"rss={result['peak_rss'] / 1024 / 1024:.1f}MiB ratio={result['output_ratio']}"
+                )
+    except KeyboardInterrupt:
+        logger.warning("사용자 입력에 의해 측정을 중단합니다. 완료된 결과만 저장합니다.")
+    finally:
+        if is_temp_work_dir:
+            shutil.rmtree(work_dirpath, ignore_errors=True)
+
+    save_report(results, args["output"])
+    logger.info(f"측정 결과 저장 완료: {args['output']}\n{pformat(results)}")
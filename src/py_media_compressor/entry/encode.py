@@ -1,11 +1,17 @@
+import atexit
 import os
+import queue
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import bitmath
 from tqdm import TqdmWarning, tqdm
 
-from py_media_compressor import encoder, log, model, utils
-from py_media_compressor.const import FILE_EXT_FILTER_LIST
+from py_media_compressor import cache, config, encoder, log, model, utils
+from py_media_compressor.const import ENCODER_PRESET_LIST
 from py_media_compressor.encoder import args_builder
 from py_media_compressor.model.enum import FileTaskStatus, LogLevel
 from py_media_compressor.utils import pformat
@@ -39,7 +45,21 @@ def main():
         "--size_skip",
         dest="size_skip",
         action="store_true",
-        help="빠른 작업을 위해 인코딩 도중 출력파일 크기가 입력파일 크기보다 커지는 순간 즉시 건너뜁니다.",
+        help="빠른 작업을 위해 인코딩 도중 출력파일 크기가 입력파일 크기보다 커지거나, 커질 것으로 예상되는 순간 즉시 건너뜁니다.",
+    )
+    parser.add_argument(
+        "--size_skip_warmup",
+        dest="size_skip_warmup",
+        type=float,
+        default=0.1,
+        help="-p 사용 시, 최종 출력파일 크기 예측을 시작할 최소 진행률 (0~1, 기본값: 0.1)",
+    )
+    parser.add_argument(
+        "--size_skip_margin",
+        dest="size_skip_margin",
+        type=float,
+        default=0.2,
+        help="-p 사용 시, 예측 오차를 고려한 여유분 비율 (진행률이 높을수록 줄어듦, 기본값: 0.2 = 진행률 0%% 기준 입력파일 크기의 120%%)",
     )
     parser.add_argument(
         "-e",
@@ -55,9 +75,9 @@ def main():
     parser.add_argument(
         "--sort_mode",
         dest="sort_mode",
-        choices=["on", "reverse", "off"],
+        choices=["on", "reverse", "off", "cost"],
         default="on",
-        help="파일 사이즈 정렬 옵션 (on = 내림차순, reverse = 오름차순)",
+        help="파일 사이즈 정렬 옵션 (on = 내림차순, reverse = 오름차순, cost = ffprobe 결과로 추정한 인코딩 비용이 큰 파일부터 처리, 여러 작업 사용 시 권장)",
     )
     parser.add_argument(
         "-s",
@@ -83,6 +103,13 @@ def main():
         metavar="{-1~51}",
         help="인코더에 전달되는 crf 값 (-1을 입력하면 코덱에 따라 기본값이 자동으로 계산됩니다.) [h.264 = 23, h.265 = 28]",
     )
+    parser.add_argument(
+        "--preset",
+        dest="preset",
+        choices=ENCODER_PRESET_LIST,
+        default="slower",
+        help="비디오 인코더 프리셋 (느릴수록 같은 crf 에서 출력 크기가 작아짐, 기본값: slower)",
+    )
     parser.add_argument(
         "--scan",
         dest="scan",
@@ -107,6 +134,122 @@ def main():
         action="store_true",
         help="중복 파일 필터링을 사용하지 않습니다.",
     )
+    parser.add_argument(
+        "--dedup_mode",
+        dest="dedup_mode",
+        choices=["staged", "full", "partial"],
+        default="staged",
+        help="크기가 같은 파일의 중복 확인 방식 (staged = 부분 해시 비교 후 일치할 경우 전체 해시 비교, full = 전체 해시만 비교, partial = 부분 해시만 비교)",
+    )
+    parser.add_argument(
+        "--dedup_partial_size",
+        dest="dedup_partial_size",
+        type=int,
+        default=4,
+        help="부분 해시 계산 시 파일의 처음, 중간, 마지막에서 읽을 크기 (MB 단위, 기본값: 4)",
+    )
+    parser.add_argument(
+        "--dedup_hash",
+        dest="dedup_hash",
+        choices=utils.get_available_hash_algorithms(),
+        default="md5",
+        help="중복 확인에 사용할 해시 알고리즘 (blake3, xxhash 계열은 해당 패키지가 설치된 경우에만 사용 가능, md5 이외의 알고리즘은 메타데이터 기록 시 MD5 해시를 다시 계산함)",
+    )
+    parser.add_argument(
+        "--hash_workers",
+        dest="hash_workers",
+        type=int,
+        default=4,
+        help="중복 확인 시 동시에 해시를 계산할 최대 스레드 수 (기본값: 4)",
+    )
+    parser.add_argument(
+        "--hash_workers_per_device",
+        dest="hash_workers_per_device",
+        type=int,
+        default=2,
+        help="중복 확인 시 같은 저장 장치에서 동시에 해시를 계산할 최대 스레드 수 (HDD 의 경우 1 권장, 기본값: 2)",
+    )
+    parser.add_argument(
+        "--no_prefilter",
+        dest="no_prefilter",
+        action="store_true",
+        help="ffprobe 실행 전, 이미 처리된 파일을 걸러내는 사전 검사를 사용하지 않습니다.",
+    )
+    parser.add_argument(
+        "--hash_while_encoding",
+        dest="hash_while_encoding",
+        action="store_true",
+        help="입력 파일 해시를 인코딩 시작 전에 계산하지 않고, 인코딩과 동시에 계산합니다. (입력 파일을 미리 전체 읽는 과정이 생략됨)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        dest="pipeline",
+        action="store_true",
+        help="파일 검색, ffprobe 및 인코딩을 동시에 진행합니다. (전체 검색이 끝나기 전에 인코딩을 시작하며, 정렬은 대기 중인 파일 사이에서만 적용됨)",
+    )
+    parser.add_argument(
+        "--pipeline_buffer",
+        dest="pipeline_buffer",
+        type=int,
+        default=64,
+        help="파이프라인 모드에서 인코딩 대기열에 미리 준비해 둘 최대 파일 수 (기본값: 64)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="동시에 인코딩할 파일 수를 설정합니다. (기본값: 1)",
+    )
+    parser.add_argument(
+        "--threads_per_job",
+        dest="threads_per_job",
+        type=int,
+        default=0,
+        help="작업당 ffmpeg 스레드 수를 설정합니다. (0을 입력하면 [CPU 코어 수 / 작업 수]로 자동 계산됩니다. 작업 수가 1일 경우 ffmpeg가 결정)",
+    )
+    parser.add_argument(
+        "--target_size_ratio",
+        dest="target_size_ratio",
+        type=float,
+        default=0.0,
+        help="입력 파일 대비 목표 출력 크기 비율 (예: 0.5), 샘플 구간을 인코딩하여 목표를 만족하는 CRF 를 탐색합니다. 만족할 수 없는 경우 인코딩하지 않고 통과합니다. (기본값: 0, 사용 안 함)",
+    )
+    parser.add_argument(
+        "--target_quality",
+        dest="target_quality",
+        type=float,
+        default=0.0,
+        help="목표 품질 점수 (예: ssim = 0.98, vmaf = 95), 샘플 구간을 인코딩하여 목표를 만족하는 가장 큰 CRF 를 탐색합니다. (기본값: 0, 사용 안 함)",
+    )
+    parser.add_argument(
+        "--quality_metric",
+        dest="quality_metric",
+        choices=["ssim", "vmaf"],
+        default="ssim",
+        help="목표 품질 측정 방식 (vmaf 는 ffmpeg 에 libvmaf 가 포함된 경우에만 사용 가능)",
+    )
+    parser.add_argument(
+        "--estimate_threshold",
+        dest="estimate_threshold",
+        type=float,
+        default=0.0,
+        help="인코딩 전 ffprobe 결과 (코덱, 해상도, 비트레이트) 로 예측한 출력 크기 비율이 이 값보다 크면 인코딩하지 않고 통과합니다. (예: 0.9, 기본값: 0, 사용 안 함)",
+    )
+    parser.add_argument(
+        "--estimate_sample",
+        dest="estimate_sample",
+        action="store_true",
+        help="--estimate_threshold 사용 시, 샘플 구간을 인코딩하여 예측값을 보정합니다.",
+    )
+    parser.add_argument(
+        "--chunks",
+        dest="chunks",
+        type=int,
+        default=0,
+        help="하나의 파일을 키프레임 기준으로 여러 구간으로 나누어 동시에 인코딩합니다. (2 이상일 때 사용, 오디오는 한 번만 인코딩됨, 기본값: 0)",
+    )
     parser.add_argument("--cuda", dest="cuda", action="store_true", help="CUDA 그래픽카드를 사용하여 소스 파일을 디코드합니다.")
     parser.add_argument(
         "--log_level",
@@ -123,6 +266,25 @@ def main():
         help="로그 출력 모드",
     )
     parser.add_argument("--log-path", dest="log_path", default=log.SETTINGS["dir"], help="로그 출력 경로")
+    parser.add_argument(
+        "--no_cache",
+        dest="no_cache",
+        action="store_true",
+        help="ffprobe 결과 등의 영구 캐시를 사용하지 않습니다. (작업 기록도 사용하지 않음)",
+    )
+    parser.add_argument("--cache-path", dest="cache_path", default=cache.SETTINGS["dir"], help="캐시 저장 경로")
+    parser.add_argument(
+        "--resume",
+        dest="resume",
+        action="store_true",
+        help="입력 경로가 같은 이전 작업이 중단된 경우, 작업 기록을 사용하여 파일 검색 및 완료된 작업을 건너뛰고 이어서 작업합니다. 오류가 발생한 작업은 다시 시도합니다.",
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        default="",
+        help="작업 단계 (discovery, prefilter, probe, schedule, encode) 별 cProfile 결과를 저장할 디렉토리 경로 (단계별 .prof, .txt 파일 생성), 메인 스레드에서 실행되는 단계만 측정합니다. (--jobs 2 이상, --pipeline 사용 시 동시에 실행되는 단계는 측정하지 않음)",
+    )
 
     args = vars(parser.parse_args())
 
@@ -133,9 +295,17 @@ def main():
     if not utils.is_str_empty_or_space(args["log_path"]):
         log.SETTINGS["dir"] = args["log_path"]
 
+    cache.SETTINGS["enabled"] = not args["no_cache"]
+    if not utils.is_str_empty_or_space(args["cache_path"]):
+        cache.SETTINGS["dir"] = args["cache_path"]
+
     logger = log.get_logger(main)
 
     logger.info("** 프로그램 시작점 **")
+
+    if not utils.is_str_empty_or_space(args["profile"]):
+        enable_profiler(args["profile"])
+        logger.info(f"작업 단계별 프로파일링 사용, 저장 경로: {args['profile']}")
     logger.debug(f"입력 인수\n{pformat(args)}")
 
     for info in (
@@ -159,36 +329,77 @@ def main():
 
     logger.debug("ffmpeg, ffprobe 동작 확인 완료")
 
-    # 확장자 필터 로드
-    ext_filter_config_filepath = os.path.join("config", "filter.yaml")
-    if os.path.isfile(ext_filter_config_filepath):
-        ext_filter = utils.load_config(ext_filter_config_filepath)
-    else:
-        ext_filter = {"exts": FILE_EXT_FILTER_LIST}
-        utils.save_config(ext_filter, ext_filter_config_filepath)
+    # 설정 파일 로드 및 검사, 인코딩을 시작하기 전에 설정 오류를 확인
+    try:
+        ext_filter = config.get_ext_filter_config()
+        config.get_user_args_config()
+    except Exception:
+        logger.critical("설정 파일에 문제가 있습니다.", exc_info=True)
+        return
 
     logger.info("파일 확장자 필터 로드 완료")
 
     no_use_deduplication_filter = args["no_dedup"]
+    use_pipeline = args["pipeline"] and not args["scan"]
 
-    # 입력 소스 파일 추출 및 중복 제거
-    source_infos, file_count, dupl_file_count = encoder.get_source_file(
-        args["input"],
-        ext_filter.get("exts"),
-        useDeduplicationFilter=not no_use_deduplication_filter,
-        useProgressbar=True,
-    )
-    file_infos = encoder.convert_SI2FI(source_infos)
+    # 작업 기록, 이어서 작업할 경우 이전 기록을 유지
+    job_journal = cache.get_job_journal() if not args["scan"] else None
+    input_paths = [os.path.normpath(input_path) for input_path in args["input"]]
+    is_resume = False
+    if args["resume"] and not args["scan"]:
+        if job_journal is None:
+            logger.warning("캐시를 사용하지 않으므로, 작업 기록을 사용할 수 없습니다. 처음부터 작업합니다.")
+        elif job_journal.get_input_paths() != input_paths:
+            logger.warning("입력 경로가 같은 이전 작업 기록이 없습니다. 처음부터 작업합니다.")
+        else:
+            is_resume = True
+    if job_journal is not None and not is_resume:
+        job_journal.start(input_paths)
 
-    if args["scan"]:
-        logger.info(f"입력 소스파일: \n{pformat(file_infos)}")
-    else:
-        logger.debug(f"입력 소스파일: \n{pformat(file_infos)}")
+    file_infos = []
+    if not use_pipeline and is_resume and job_journal.is_discovery_completed():
+        file_infos = [
+            encoder.convert_source_record(source_info) for source_info in get_resume_source_infos(job_journal)
+        ]
+        logger.info(f"작업 기록에서 이어서 작업할 파일 수: {len(file_infos)}")
+    elif not use_pipeline:
+        # 입력 소스 파일 추출 및 중복 제거
+        source_infos, file_count, dupl_file_count = run_profiled(
+            "discovery",
+            encoder.get_source_file,
+            args["input"],
+            ext_filter.get("exts"),
+            useDeduplicationFilter=not no_use_deduplication_filter,
+            deduplicationMode=args["dedup_mode"],
+            partialHashSize=max(args["dedup_partial_size"], 1) * 1024 * 1024,
+            hashAlgorithm=args["dedup_hash"],
+            hashWorkers=max(args["hash_workers"], 1),
+            hashWorkersPerDevice=max(args["hash_workers_per_device"], 1),
+            useProgressbar=True,
+        )
+        # 파일마다 FileInfo 를 만들지 않고 경량 레코드로 보관하며, 실제로 인코딩할 때 FileInfo 로 변환
+        file_infos = encoder.convert_SI2FR(source_infos)
+        del source_infos
+
+        if args["scan"]:
+            logger.info(f"입력 소스파일: \n{pformat(file_infos)}")
+        else:
+            logger.debug(f"입력 소스파일: \n{pformat(file_infos)}")
 
-    logger.info(f"감지된 소스파일 수: {dupl_file_count + file_count}, 입력 소스파일 수: {file_count}, 중복 소스파일 수: {dupl_file_count}")
+        logger.info(
+            f"감지된 소스파일 수: {dupl_file_count + file_count}, 입력 소스파일 수: {file_count}, 중복 소스파일 수: {dupl_file_count}"
+        )
 
-    if args["scan"]:
-        return
+        if args["scan"]:
+            return
+
+        if job_journal is not None:
+            if is_resume:
+                finished_filepaths = get_finished_filepaths(job_journal)
+                file_infos = [fi for fi in file_infos if fi.input_filepath not in finished_filepaths]
+
+            job_journal.add((fi.input_filepath, fi.input_filesize) for fi in file_infos)
+            job_journal.set_discovery_completed()
 
     output_dirpath = args["output"]
     logger.info(f"출력 디렉토리: {output_dirpath}")
@@ -202,7 +413,13 @@ def main():
     except Exception:
         max_height = 1440
 
-    logger.debug(f"현재 작업 소스 정보: \n{pformat(file_infos)}")
+    if not use_pipeline:
+        logger.debug(f"현재 작업 소스 정보: \n{pformat(file_infos)}")
+
+    jobs = max(args["jobs"], 1)
+    threads_per_job = max(args["threads_per_job"], 0)
+    if threads_per_job == 0 and jobs > 1:
+        threads_per_job = max((os.cpu_count() or 1) // jobs, 1)
 
     encode_option = model.EncodeOption(
         maxHeight=max_height,
@@ -216,136 +433,733 @@ def main():
         isCuda=args["cuda"],
         isReplace=args["replace"],
         isSizeSkip=args["size_skip"],
+        threads=threads_per_job,
+        isHashWhileEncoding=args["hash_while_encoding"],
+        chunks=max(args["chunks"], 0),
+        targetSizeRatio=max(args["target_size_ratio"], 0.0),
+        targetQuality=max(args["target_quality"], 0.0),
+        qualityMetric=args["quality_metric"],
+        sizeSkipWarmup=min(max(args["size_skip_warmup"], 0.0), 1.0),
+        sizeSkipMargin=max(args["size_skip_margin"], 0.0),
+        estimateThreshold=max(args["estimate_threshold"], 0.0),
+        isEstimateWithSample=args["estimate_sample"],
+        preset=args["preset"],
     )
 
     sort_mode = args.get("sort_mode", "on").lower()
+
+    if use_pipeline:
+        logger.info(f"파이프라인 작업 모드, 작업 수: {jobs}, 작업당 스레드 수: {threads_per_job}")
+        if is_resume and job_journal.is_discovery_completed():
+            source_infos = get_resume_source_infos(job_journal)
+            logger.info(f"작업 기록에서 이어서 작업할 파일 수: {len(source_infos)}")
+            source_iter = ((source_info, None) for source_info in source_infos)
+        else:
+            source_iter = encoder.iter_source_files(
+                args["input"],
+                ext_filter.get("exts"),
+                useDeduplicationFilter=not no_use_deduplication_filter,
+                deduplicationMode=args["dedup_mode"],
+                partialHashSize=max(args["dedup_partial_size"], 1) * 1024 * 1024,
+                hashAlgorithm=args["dedup_hash"],
+            )
+
+            if is_resume:
+                finished_filepaths = get_finished_filepaths(job_journal)
+                source_iter = (
+                    (source_info, dupl_info)
+                    for source_info, dupl_info in source_iter
+                    if source_info["input_file"] not in finished_filepaths
+                )
+
+        run_pipeline(
+            source_iter,
+            encode_option,
+            output_dirpath,
+            already_exists_mode,
+            jobs=jobs,
+            sortMode=sort_mode,
+            usePrefilter=not args["no_prefilter"],
+            bufferSize=max(args["pipeline_buffer"], 1),
+        )
+        return
+
+    if not args["no_prefilter"]:
+        file_infos, skipped_file_infos = run_profiled(
+            "prefilter", encoder.filter_processed_files, file_infos, encode_option, useProgressbar=True, leave=False
+        )
+        logger.info(f"사전 검사로 건너뛴 이미 처리된 파일 수: {len(skipped_file_infos)}")
+
+        if job_journal is not None and len(skipped_file_infos) > 0:
+            job_journal.update_many((fi.input_filepath for fi in skipped_file_infos), FileTaskStatus.SKIPPED.name)
+
     if sort_mode == "on":
         file_infos.sort(key=lambda fi: fi.input_filesize)
     elif sort_mode == "reverse":
         file_infos.sort(key=lambda fi: fi.input_filesize, reverse=True)
+    elif sort_mode == "cost":
+        file_infos = run_profiled(
+            "schedule",
+            encoder.schedule_by_cost,
+            file_infos,
+            encode_option,
+            jobs=jobs,
+            useProgressbar=True,
+            leave=False,
+        )
 
-    ffmpeg_args: model.FFmpegArgs
-    for file_info in (file_info_tqdm := tqdm(file_infos, leave=False, dynamic_ncols=True)):
+    if jobs > 1:
+        logger.info(f"병렬 작업 모드, 작업 수: {jobs}, 작업당 스레드 수: {threads_per_job}")
+        run_parallel(file_infos, encode_option, output_dirpath, already_exists_mode, jobs=jobs)
+    else:
+        run_serial(file_infos, encode_option, output_dirpath, already_exists_mode)
+
+
+_stage_profiler: Optional[utils.StageProfiler] = None
+
+
+def enable_profiler(dirpath: str):
+    """작업 단계별 프로파일링을 사용합니다. 측정 결과는 프로그램 종료 시 저장됩니다.
+
+    Args:
+        dirpath (str): 측정 결과를 저장할 디렉토리 경로
+    """
+
+    global _stage_profiler
+
+    _stage_profiler = utils.StageProfiler(dirpath)
+    atexit.register(dump_profiler)
+
+
+def dump_profiler():
+    if _stage_profiler is None:
+        return
+
+    logger = log.get_logger(dump_profiler)
+
+    try:
+        filepaths = _stage_profiler.dump()
+    except Exception:
+        logger.error("프로파일링 결과를 저장할 수 없습니다.", exc_info=True)
+        return
+
+    logger.info(f"프로파일링 결과 저장 완료\n{pformat(filepaths)}")
+
+
+def run_profiled(stageName: str, func, *args, **kwargs):
+    """프로파일링을 사용하는 경우, 함수 실행을 해당 작업 단계로 측정합니다.
+
+    Args:
+        stageName (str): 작업 단계 이름
+        func (Callable): 실행할 함수
+
+    Returns:
+        Any: 함수 실행 결과
+    """
+
+    if _stage_profiler is None:
+        return func(*args, **kwargs)
+
+    is_first_skip = stageName not in _stage_profiler.skipped_stages
+
+    with _stage_profiler.stage(stageName) as is_profiled:
+        if not is_profiled and is_first_skip:
+            log.get_logger(run_profiled).warning(
+                f"메인 스레드가 아닌 곳에서 동시에 실행되는 작업 단계는 프로파일링하지 않습니다. (단계: {stageName})"
+            )
+        return func(*args, **kwargs)
+
+
+def run_serial(
+    fileInfos: List[model.FileRecord],
+    encodeOption: model.EncodeOption,
+    outputDirpath: str,
+    alreadyExistsMode: str,
+):
+    """파일을 하나씩 순서대로 처리합니다.
+
+    Args:
+        fileInfos (List[model.FileRecord]): 처리할 파일 정보 리스트
+        encodeOption (model.EncodeOption): 인코드 옵션
+        outputDirpath (str): 출력 디렉토리 경로
+        alreadyExistsMode (str): 출력 폴더에 같은 이름의 파일이 있을 경우, 사용할 모드
+    """
+
+    for file_info in (file_info_tqdm := tqdm(fileInfos, leave=False, dynamic_ncols=True)):
         file_info_tqdm.set_description(f"Processing... {os.path.basename(file_info.input_filepath)}")
+        file_info_tqdm.set_postfix(size=get_filesize_str(file_info.input_filesize))
+
+        file_info = run_profiled("encode", process_file, file_info, encodeOption, outputDirpath, alreadyExistsMode)
+
+        if file_info is not None and file_info.status == FileTaskStatus.SUSPEND:
+            break
+
+
+def run_parallel(
+    fileInfos: List[model.FileRecord],
+    encodeOption: model.EncodeOption,
+    outputDirpath: str,
+    alreadyExistsMode: str,
+    jobs: int,
+):
+    """작업자 풀을 사용하여 여러 파일을 동시에 처리합니다.
+
+    Args:
+        fileInfos (List[model.FileRecord]): 처리할 파일 정보 리스트 (리스트 순서대로 작업자에게 할당됨)
+        encodeOption (model.EncodeOption): 인코드 옵션
+        outputDirpath (str): 출력 디렉토리 경로
+        alreadyExistsMode (str): 출력 폴더에 같은 이름의 파일이 있을 경우, 사용할 모드
+        jobs (int): 동시에 실행할 작업 수
+    """
+
+    logger = log.get_logger(run_parallel)
+
+    stop_event = threading.Event()
+
+    def job(file_info: model.FileRecord):
+        if stop_event.is_set():
+            return None
+
+        file_info = run_profiled(
+            "encode", process_file, file_info, encodeOption, outputDirpath, alreadyExistsMode, stopEvent=stop_event
+        )
+
+        if file_info is not None and file_info.status == FileTaskStatus.SUSPEND:
+            stop_event.set()
+
+        return file_info
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="encode_job") as executor:
+        futures = [executor.submit(job, file_info) for file_info in fileInfos]
+
+        file_info_tqdm = tqdm(total=len(futures), desc="Processing...", leave=False, dynamic_ncols=True)
+        try:
+            for future in as_completed(futures):
+                file_info_tqdm.update(1)
+                if (file_info := future.result()) is not None:
+                    file_info_tqdm.set_postfix(last=os.path.basename(file_info.input_filepath))
+        except KeyboardInterrupt:
+            stop_event.set()
+            logger.warning("사용자 입력에 의해 남은 작업을 취소합니다. 실행 중인 작업의 종료를 기다립니다...")
+            for future in futures:
+                future.cancel()
+        finally:
+            file_info_tqdm.close()
+
+
+def run_pipeline(
+    sourceIter: Iterable[Tuple[Dict, Optional[Dict]]],
+    encodeOption: model.EncodeOption,
+    outputDirpath: str,
+    alreadyExistsMode: str,
+    jobs: int,
+    sortMode: str = "on",
+    usePrefilter=True,
+    bufferSize: int = 64,
+):
+    """파일 검색, ffprobe, 인코딩 단계를 동시에 진행합니다.
+
+    검색 단계와 ffprobe 단계는 각각 별도의 스레드에서 실행되며, 준비된 파일은 크기가 제한된 우선순위 대기열을 통해 작업자에게 전달됩니다.
+    정렬은 전체 파일이 아닌, 대기열에 있는 파일 사이에서만 적용됩니다.
+
+    Args:
+        sourceIter (Iterable[Tuple[Dict, Optional[Dict]]]): 소스 파일 정보 및 중복된 기존 파일 정보 (encoder.iter_source_files)
+        encodeOption (model.EncodeOption): 인코드 옵션
+        outputDirpath (str): 출력 디렉토리 경로
+        alreadyExistsMode (str): 출력 폴더에 같은 이름의 파일이 있을 경우, 사용할 모드
+        jobs (int): 동시에 실행할 작업 수
+        sortMode (str, optional): 대기열 정렬 옵션 (on, reverse, off, cost). Defaults to "on".
+        usePrefilter (bool, optional): 이미 처리된 파일을 인코딩 전에 걸러낼지 여부. Defaults to True.
+        bufferSize (int, optional): 각 단계 사이 대기열의 최대 크기. Defaults to 64.
+    """
+
+    logger = log.get_logger(run_pipeline)
+
+    stop_event = threading.Event()
+    probe_queue = queue.Queue(maxsize=bufferSize)
+    encode_queue = queue.PriorityQueue(maxsize=bufferSize)
+    # 검색 단계와 ffprobe 단계 스레드에서 함께 갱신
+    counts = {"detected": 0, "duplicated": 0, "skipped": 0}
+    counts_lock = threading.Lock()
+
+    def count(key: str):
+        with counts_lock:
+            counts[key] += 1
 
-        # tqdm 소스 파일 크기 표시
-        input_file_size_h = str(bitmath.best_prefix(int(file_info.input_filesize), system=bitmath.SI)).split(" ")
-        input_file_size_h = f"{round(float(input_file_size_h[0]), 1)} {input_file_size_h[1]}"
-        file_info_tqdm.set_postfix(size=input_file_size_h)
+    # 같은 우선순위일 경우 검색된 순서대로 처리하며, 작업 종료 신호는 항상 마지막에 처리
+    def get_priority(file_info: model.FileRecord) -> float:
+        if sortMode == "on":
+            return file_info.input_filesize
+        elif sortMode == "reverse":
+            return -file_info.input_filesize
+        elif sortMode == "cost":
+            return -encoder.get_encode_cost(file_info, encodeOption)
+        return 0
 
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not stop_event.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    file_info_tqdm = tqdm(total=0, desc="Processing...", leave=False, dynamic_ncols=True)
+    tqdm_lock = threading.Lock()
+
+    job_journal = cache.get_job_journal()
+
+    # ffprobe 캐시를 사용하지 않을 경우, ffprobe 단계의 결과를 인코딩 단계까지 메모리에 보관 (경로: (상태 정보, ffprobe 결과))
+    probe_infos: Dict[str, Tuple[utils.FileStat, Dict]] = {}
+    probe_infos_lock = threading.Lock()
+
+    def pop_probe_info(filepath: str) -> Optional[Dict]:
+        with probe_infos_lock:
+            file_stat, probe_info = probe_infos.pop(filepath, (None, None))
+
+        # ffprobe 이후 파일이 변경된 경우, 인코딩 단계에서 다시 실행
+        try:
+            if probe_info is not None and utils.get_file_stat(filepath) == file_stat:
+                return probe_info
+        except FileNotFoundError:
+            pass
+        return None
+
+    def discover():
         try:
-            ffmpeg_args = model.FFmpegArgs(fileInfo=file_info, encodeOption=encode_option.clone())
+            for source_info, dupl_info in sourceIter:
+                if stop_event.is_set():
+                    break
+
+                count("detected")
+
+                if dupl_info is not None:
+                    logger.warning(f"중복 파일이 제외되었습니다.\nOrigin: {pformat(source_info)}\nTest: {pformat(dupl_info)}")
+                    count("duplicated")
+                    continue
+
+                try:
+                    file_info = encoder.convert_source_record(source_info)
+                except Exception:
+                    logger.error(f"파일 정보를 불러오는 도중 오류가 발생했습니다. Skipped.\nSourceInfo: {source_info}", exc_info=True)
+                    continue
+
+                if job_journal is not None:
+                    job_journal.add([(file_info.input_filepath, file_info.input_filesize)])
+
+                if not put(probe_queue, file_info):
+                    break
+            else:
+                if job_journal is not None:
+                    job_journal.set_discovery_completed()
         except Exception:
-            logger.error(
-                f"파일 정보를 불러오는 도중 오류가 발생했습니다. Skipped.\nFileInfo: {pformat(file_info)}",
-                exc_info=True,
-            )
-            continue
+            logger.error("파일 검색 도중 오류가 발생했습니다. 이후 파일은 검색하지 않습니다.", exc_info=True)
+        finally:
+            put(probe_queue, None)
 
+    def probe():
+        seq = 0
         try:
-            ext = ffmpeg_args.expected_ext
+            while (file_info := probe_queue.get()) is not None:
+                if stop_event.is_set():
+                    break
+
+                try:
+                    # 인코딩 단계에서 ffprobe 캐시 또는 메모리에 보관한 결과를 사용하도록 미리 실행
+                    if cache.get_probe_cache() is not None:
+                        cache.get_probe_info(file_info.input_filepath)
+                    else:
+                        file_stat = utils.get_file_stat(file_info.input_filepath)
+                        probe_info = cache.get_probe_info(file_info.input_filepath)
+                        with probe_infos_lock:
+                            probe_infos[file_info.input_filepath] = (file_stat, probe_info)
+                except Exception:
+                    logger.debug(f"ffprobe 실패, 인코딩 단계에서 다시 확인합니다.\nFileInfo: {file_info}", exc_info=True)
+
+                if usePrefilter:
+                    try:
+                        is_processed = encoder.is_processed_file(file_info, encodeOption)
+                    except Exception:
+                        logger.debug(f"사전 검사 실패, 기존 방식으로 확인합니다.\nFileInfo: {file_info}", exc_info=True)
+                        is_processed = False
+
+                    if is_processed:
+                        pop_probe_info(file_info.input_filepath)
+                        file_info.status = FileTaskStatus.SKIPPED
+                        cache.record_job(file_info.input_filepath, file_info.status.name)
+                        count("skipped")
+                        logger.debug(f"이미 처리된 미디어입니다. (사전 검사)\nFileInfo: {file_info}")
+                        continue
+
+                with tqdm_lock:
+                    file_info_tqdm.total += 1
+                    file_info_tqdm.refresh()
+
+                if not put(encode_queue, (0, get_priority(file_info), seq := seq + 1, file_info)):
+                    break
         except Exception:
-            logger.error(f"출력 파일 확장자를 추정할 수 없습니다. Skipped.\nFFmpegArgs: {pformat(ffmpeg_args)}", exc_info=True)
-            continue
+            logger.error("ffprobe 단계에서 오류가 발생했습니다. 이후 파일은 처리하지 않습니다.", exc_info=True)
+        finally:
+            for _ in range(jobs):
+                put(encode_queue, (1, 0, seq := seq + 1, None))
+
+    def job():
+        while not stop_event.is_set():
+            try:
+                _, _, _, file_info = encode_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            if file_info is None:
+                break
 
-        ffmpeg_args.file_info.output_filepath = os.path.join(
-            output_dirpath, f"{os.path.splitext(os.path.basename(ffmpeg_args.file_info.input_filepath))[0]}{ext}"
+            try:
+                file_info = run_profiled(
+                    "encode",
+                    process_file,
+                    file_info,
+                    encodeOption,
+                    outputDirpath,
+                    alreadyExistsMode,
+                    stopEvent=stop_event,
+                    probeInfo=pop_probe_info(file_info.input_filepath),
+                )
+            except Exception:
+                # 하나의 파일에서 발생한 오류로 파이프라인 전체가 멈추지 않도록 함
+                logger.error(f"작업을 처리하지 못했습니다. Skipped.\nFileInfo: {pformat(file_info)}", exc_info=True)
+                file_info = None
+
+            with tqdm_lock:
+                file_info_tqdm.update(1)
+                if file_info is not None:
+                    file_info_tqdm.set_postfix(last=os.path.basename(file_info.input_filepath))
+
+            if file_info is not None and file_info.status == FileTaskStatus.SUSPEND:
+                stop_event.set()
+
+    stage_threads = [
+        threading.Thread(target=run_profiled, args=["discovery", discover], name="pipeline_discover", daemon=True),
+        threading.Thread(target=run_profiled, args=["probe", probe], name="pipeline_probe", daemon=True),
+    ]
+    for stage_thread in stage_threads:
+        stage_thread.start()
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="encode_job") as executor:
+        futures = [executor.submit(job) for _ in range(jobs)]
+
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except KeyboardInterrupt:
+            stop_event.set()
+            logger.warning("사용자 입력에 의해 남은 작업을 취소합니다. 실행 중인 작업의 종료를 기다립니다...")
+        finally:
+            file_info_tqdm.close()
+
+    with counts_lock:
+        logger.info(
+            f"감지된 소스파일 수: {counts['detected']}, 중복 소스파일 수: {counts['duplicated']}, "
+            f"사전 검사로 건너뛴 이미 처리된 파일 수: {counts['skipped']}"
         )
 
-        if already_exists_mode == "numbering":
+
+def get_resume_source_infos(jobJournal: cache.JobJournal) -> List[Dict]:
+    """작업 기록에서 완료되지 않은 파일을 기록된 순서대로 불러옵니다. 처리 도중 중단된 출력 파일은 제거됩니다.
+
+    Args:
+        jobJournal (cache.JobJournal): 작업 기록
+
+    Returns:
+        List[Dict]: 소스 파일 정보 리스트
+    """
+
+    logger = log.get_logger(get_resume_source_infos)
+
+    source_infos = []
+
+    for entry in jobJournal.get_entries(cache.JobJournal.UNFINISHED_STATUSES):
+        if (
+            entry.status in (FileTaskStatus.PROCESSING.name, FileTaskStatus.SUSPEND.name, FileTaskStatus.ERROR.name)
+            and not utils.is_str_empty_or_space(entry.output_filepath)
+            and os.path.isfile(entry.output_filepath)
+            and os.path.abspath(entry.output_filepath) != os.path.abspath(entry.input_filepath)
+        ):
+            logger.info(f"중단된 작업의 출력 파일을 제거합니다.\nOutput Filepath: {entry.output_filepath}")
+            utils.remove(entry.output_filepath, raise_error=False)
+
+        if not os.path.isfile(entry.input_filepath):
+            logger.warning(f"입력 파일이 존재하지 않습니다. Skipped.\nInput Filepath: {entry.input_filepath}")
+            continue
+
+        # 정렬 및 작업 비용 추정에 사용되므로, 기록된 크기가 아닌 현재 파일 크기를 사용
+        try:
+            input_file_size = os.path.getsize(entry.input_filepath)
+        except OSError:
+            input_file_size = entry.input_filesize
+
+        source_infos.append({"input_file": entry.input_filepath, "input_file_size": input_file_size})
+
+    return source_infos
+
+
+def get_finished_filepaths(jobJournal: cache.JobJournal) -> set:
+    """작업 기록에서 이미 완료된 파일의 경로를 가져옵니다.
+
+    Args:
+        jobJournal (cache.JobJournal): 작업 기록
+
+    Returns:
+        set: 완료된 파일 경로
+    """
+
+    return {
+        entry.input_filepath
+        for entry in jobJournal.get_entries()
+        if entry.status not in cache.JobJournal.UNFINISHED_STATUSES
+    }
+
+
+def get_filesize_str(filesize: int) -> str:
+    filesize_h = str(bitmath.best_prefix(int(filesize), system=bitmath.SI)).split(" ")
+    return f"{round(float(filesize_h[0]), 1)} {filesize_h[1]}"
+
+
+# 병렬 작업 시, 같은 출력 경로가 여러 작업에 할당되는 것을 방지
+_output_filepath_lock = threading.Lock()
+_reserved_output_filepaths = set()
+
+
+def reserve_output_filepath(fileInfo: model.FileInfo, outputDirpath: str, ext: str, alreadyExistsMode: str) -> bool:
+    """출력 파일 경로를 결정하고 예약합니다.
+
+    Args:
+        fileInfo (model.FileInfo): 파일 정보
+        outputDirpath (str): 출력 디렉토리 경로
+        ext (str): 출력 파일 확장자
+        alreadyExistsMode (str): 출력 폴더에 같은 이름의 파일이 있을 경우, 사용할 모드
+
+    Returns:
+        bool: 출력 경로가 결정된 경우 True, 작업을 건너뛰어야 할 경우 False를 반환합니다.
+    """
+
+    output_filepath = os.path.join(
+        outputDirpath, f"{os.path.splitext(os.path.basename(fileInfo.input_filepath))[0]}{ext}"
+    )
+
+    with _output_filepath_lock:
+        if alreadyExistsMode == "numbering":
             count = 0
-            output_filepath = ffmpeg_args.file_info.output_filepath
             temp_filename = os.path.splitext(output_filepath)[0]
-            while os.path.isfile(output_filepath):
+            while os.path.isfile(output_filepath) or output_filepath in _reserved_output_filepaths:
                 output_filepath = f"{temp_filename} ({(count := count + 1)}){ext}"
-            ffmpeg_args.file_info.output_filepath = output_filepath
-        elif already_exists_mode == "skip" and os.path.isfile(ffmpeg_args.file_info.output_filepath):
-            logger.info("이미 출력파일이 존재합니다... skipped.")
-            continue
+        elif alreadyExistsMode == "skip" and (
+            os.path.isfile(output_filepath) or output_filepath in _reserved_output_filepaths
+        ):
+            return False
 
-        is_replace = ffmpeg_args.encode_option.is_replace
+        _reserved_output_filepaths.add(output_filepath)
 
-        try:
-            file_info = encoder.media_compress_encode(ffmpeg_args)
-        except Exception:
-            logger.error(f"처리하지 않은 오류가 발생하였습니다.\nArgs: {pformat(ffmpeg_args.as_dict())}")
-            raise
-
-        del ffmpeg_args
-
-        def replace_input_output(fileInfo: model.FileInfo):
-            dest_filepath = os.path.splitext(fileInfo.input_filepath)[0] + os.path.splitext(fileInfo.output_filepath)[1]
-            src_filepath = fileInfo.output_filepath
-
-            is_removed = False
-            if (  # 파일 시스템이 대소문자를 구분하지 않을 경우
-                os.path.basename(fileInfo.input_filepath).lower() == os.path.basename(fileInfo.output_filepath).lower()
-            ) and os.path.isfile(fileInfo.input_filepath):
-                is_removed = True
-                utils.remove(fileInfo.input_filepath)
-
-            utils.move(src_filepath, dest_filepath)
-            fileInfo.output_filepath = dest_filepath
-
-            utils.set_file_permission(fileInfo.output_filepath)
-
-            if (
-                not is_removed
-                and os.path.basename(fileInfo.input_filepath) != os.path.basename(fileInfo.output_filepath)
-                and os.path.isfile(fileInfo.input_filepath)
-            ):
-                utils.remove(fileInfo.input_filepath)
-
-            logger.info("덮어쓰기 성공")
-
-        def streamcopy(fileInfo: model.FileInfo):
-            logger.info("스트림 복사 및 메타데이터를 삽입합니다.")
-            fileInfo.status = FileTaskStatus.INIT
-            ffmpeg_args = model.FFmpegArgs(fileInfo=fileInfo, encodeOption=encode_option.clone())
-            args_builder.add_stream_copy_args(ffmpegArgs=ffmpeg_args)
-            args_builder.add_metadata_args(ffmpegArgs=ffmpeg_args)
-            args_builder.add_user_args(ffmpegArgs=ffmpeg_args)
-            fileInfo = encoder.media_compress_encode(ffmpegArgs=ffmpeg_args)
-            replace_input_output(fileInfo=fileInfo)
-            fileInfo.output_filepath = fileInfo.input_filepath
-
-        if file_info.status == FileTaskStatus.ERROR:
-            logger.error(
-                f"미디어를 처리하는 도중, 오류가 발생했습니다.\nState: {file_info.status}\nInput Filepath: {file_info.input_filepath}\nOutput Filepath: {file_info.output_filepath}"
-            )
-        elif (is_skipped := file_info.status == FileTaskStatus.SKIPPED) or file_info.status == FileTaskStatus.SUCCESS:
-            if not is_skipped:
-                if is_replace:
-                    try:
-                        if (
-                            file_info.input_filesize > file_info.output_filesize
-                            or os.path.splitext(file_info.input_filepath)[1].lower()
-                            != os.path.splitext(file_info.output_filepath)[1].lower()
-                        ):
-                            replace_input_output(fileInfo=file_info)
-                        else:
-                            logger.warning(f"덮어쓰기 조건을 만족하지 못합니다. 출력파일을 삭제합니다.\nFileInfo: {file_info}")
-                            utils.remove(file_info.output_filepath)
-
-                            streamcopy(fileInfo=file_info)
-                    except Exception:
-                        logger.error("Replace 작업 실패", exc_info=True)
-        elif file_info.status == FileTaskStatus.SUSPEND:
-            logger.warning(
-                f"사용자에 의해 모든 작업이 중단됨.\nState: {file_info.status}\nInput Filepath: {file_info.input_filepath}\nOutput Filepath: {file_info.output_filepath}"
-            )
-            break
-        elif file_info.status == FileTaskStatus.PASS:
-            logger.warning(
-                f"작업이 통과되었습니다.\nState: {file_info.status}\nInput Filepath: {file_info.input_filepath}\nOutput Filepath: {file_info.output_filepath}"
-            )
-            utils.remove(file_info.output_filepath, raise_error=False)
-            if is_replace:
-                streamcopy(fileInfo=file_info)
-        else:
-            logger.error(f"상태가 올바르지 않은 작업이 있습니다.\nFileInfo: {file_info}")
+    fileInfo.output_filepath = output_filepath
+    return True
+
+
+def release_output_filepath(outputFilepath: str):
+    with _output_filepath_lock:
+        _reserved_output_filepaths.discard(outputFilepath)
+
+
+def replace_input_output(fileInfo: model.FileInfo):
+    """출력 파일로 입력 파일을 덮어씁니다.
+
+    Args:
+        fileInfo (model.FileInfo): 파일 정보
+    """
+
+    logger = log.get_logger(replace_input_output)
+
+    dest_filepath = os.path.splitext(fileInfo.input_filepath)[0] + os.path.splitext(fileInfo.output_filepath)[1]
+    src_filepath = fileInfo.output_filepath
+
+    is_removed = False
+    if (  # 파일 시스템이 대소문자를 구분하지 않을 경우
+        os.path.basename(fileInfo.input_filepath).lower() == os.path.basename(fileInfo.output_filepath).lower()
+    ) and fileInfo.is_input_file_exist:
+        is_removed = True
+        utils.remove(fileInfo.input_filepath)
+
+    utils.move(src_filepath, dest_filepath)
+    fileInfo.refresh_stat()
+    fileInfo.output_filepath = dest_filepath
+
+    utils.set_file_permission(fileInfo.output_filepath)
+
+    if (
+        not is_removed
+        and os.path.basename(fileInfo.input_filepath) != os.path.basename(fileInfo.output_filepath)
+        and fileInfo.is_input_file_exist
+    ):
+        utils.remove(fileInfo.input_filepath)
+
+    # 입력 파일이 제거되거나 출력 파일로 대체되었으므로, 다음 접근 시 상태 정보를 다시 가져옴
+    fileInfo.refresh_stat()
+
+    logger.info("덮어쓰기 성공")
+
+
+def streamcopy(fileInfo: model.FileInfo, encodeOption: model.EncodeOption):
+    """스트림 복사 및 메타데이터를 삽입한 뒤, 입력 파일을 덮어씁니다.
+
+    Args:
+        fileInfo (model.FileInfo): 파일 정보
+        encodeOption (model.EncodeOption): 인코드 옵션
+    """
+
+    logger = log.get_logger(streamcopy)
+
+    logger.info("스트림 복사 및 메타데이터를 삽입합니다.")
+    fileInfo.status = FileTaskStatus.INIT
+    ffmpeg_args = model.FFmpegArgs(fileInfo=fileInfo, encodeOption=encodeOption)
+    args_builder.add_stream_copy_args(ffmpegArgs=ffmpeg_args)
+    args_builder.add_metadata_args(ffmpegArgs=ffmpeg_args)
+    args_builder.add_user_args(ffmpegArgs=ffmpeg_args)
+    fileInfo = encoder.media_compress_encode(ffmpegArgs=ffmpeg_args)
+    replace_input_output(fileInfo=fileInfo)
+    fileInfo.output_filepath = fileInfo.input_filepath
+
+
+def process_file(
+    fileInfo: Union[model.FileInfo, model.FileRecord],
+    encodeOption: model.EncodeOption,
+    outputDirpath: str,
+    alreadyExistsMode: str,
+    stopEvent: Optional[threading.Event] = None,
+    probeInfo: Optional[Dict] = None,
+) -> Optional[model.FileInfo]:
+    """하나의 파일을 인코딩하고, 덮어쓰기 및 스트림 복사 후속 작업을 처리합니다.
+
+    Args:
+        fileInfo (Union[model.FileInfo, model.FileRecord]): 파일 정보, FileRecord 일 경우 FileInfo 로 변환하여 사용
+        encodeOption (model.EncodeOption): 인코드 옵션
+        outputDirpath (str): 출력 디렉토리 경로
+        alreadyExistsMode (str): 출력 폴더에 같은 이름의 파일이 있을 경우, 사용할 모드
+        stopEvent (Optional[threading.Event], optional): 병렬 작업 중단 이벤트. Defaults to None.
+        probeInfo (Optional[Dict], optional): 미리 실행한 ffprobe 결과, None 일 경우 인코딩 단계에서 실행. Defaults to None.
+
+    Returns:
+        Optional[model.FileInfo]: 최종 파일 정보, 작업을 시작하지 못한 경우 None을 반환합니다.
+    """
+
+    logger = log.get_logger(process_file)
+
+    ffmpeg_args: model.FFmpegArgs
+
+    try:
+        if isinstance(fileInfo, model.FileRecord):
+            fileInfo = fileInfo.to_file_info()
+        ffmpeg_args = model.FFmpegArgs(fileInfo=fileInfo, encodeOption=encodeOption, probeInfo=probeInfo)
+    except Exception:
+        logger.error(
+            f"파일 정보를 불러오는 도중 오류가 발생했습니다. Skipped.\nFileInfo: {pformat(fileInfo)}",
+            exc_info=True,
+        )
+        cache.record_job(fileInfo.input_filepath, FileTaskStatus.ERROR.name)
+        return None
+
+    try:
+        ext = ffmpeg_args.expected_ext
+    except Exception:
+        logger.error(f"출력 파일 확장자를 추정할 수 없습니다. Skipped.\nFFmpegArgs: {pformat(ffmpeg_args)}", exc_info=True)
+        cache.record_job(fileInfo.input_filepath, FileTaskStatus.ERROR.name)
+        return None
+
+    if not reserve_output_filepath(ffmpeg_args.file_info, outputDirpath, ext, alreadyExistsMode):
+        logger.info("이미 출력파일이 존재합니다... skipped.")
+        cache.record_job(fileInfo.input_filepath, FileTaskStatus.SKIPPED.name)
+        return None
+
+    reserved_output_filepath = ffmpeg_args.file_info.output_filepath
+    is_replace = ffmpeg_args.encode_option.is_replace
+
+    cache.record_job(
+        fileInfo.input_filepath,
+        FileTaskStatus.PROCESSING.name,
+        outputFilepath=reserved_output_filepath,
+        startedAt=time.time(),
+    )
+
+    try:
+        file_info = encoder.media_compress_encode(ffmpeg_args)
+    except Exception:
+        logger.error(f"처리하지 않은 오류가 발생하였습니다.\nArgs: {pformat(ffmpeg_args.as_dict())}")
+        cache.record_job(fileInfo.input_filepath, FileTaskStatus.ERROR.name, finishedAt=time.time())
+        raise
+    finally:
+        release_output_filepath(reserved_output_filepath)
+
+    del ffmpeg_args
+
+    if stopEvent is not None and stopEvent.is_set() and file_info.status == FileTaskStatus.ERROR:
+        # 사용자 입력에 의해 ffmpeg 프로세스가 함께 종료된 경우
+        file_info.status = FileTaskStatus.SUSPEND
+
+    if file_info.status == FileTaskStatus.ERROR:
+        logger.error(
+            f"미디어를 처리하는 도중, 오류가 발생했습니다.\nState: {file_info.status}\nInput Filepath: {file_info.input_filepath}\nOutput Filepath: {file_info.output_filepath}"
+        )
+    elif (is_skipped := file_info.status == FileTaskStatus.SKIPPED) or file_info.status == FileTaskStatus.SUCCESS:
+        if not is_skipped:
+            if is_replace and file_info.is_stat_stale(isOutput=False):
+                logger.warning(
+                    f"작업 도중 입력 파일이 변경되었습니다. 덮어쓰지 않고 출력파일을 유지합니다.\nFileInfo: {file_info}"
+                )
+            elif is_replace:
+                try:
+                    if (
+                        file_info.input_filesize > file_info.output_filesize
+                        or os.path.splitext(file_info.input_filepath)[1].lower()
+                        != os.path.splitext(file_info.output_filepath)[1].lower()
+                    ):
+                        replace_input_output(fileInfo=file_info)
+                    else:
+                        logger.warning(f"덮어쓰기 조건을 만족하지 못합니다. 출력파일을 삭제합니다.\nFileInfo: {file_info}")
+                        utils.remove(file_info.output_filepath)
+                        file_info.refresh_stat(isInput=False)
+
+                        streamcopy(fileInfo=file_info, encodeOption=encodeOption)
+                except Exception:
+                    logger.error("Replace 작업 실패", exc_info=True)
+    elif file_info.status == FileTaskStatus.SUSPEND:
+        logger.warning(
+            f"사용자에 의해 모든 작업이 중단됨.\nState: {file_info.status}\nInput Filepath: {file_info.input_filepath}\nOutput Filepath: {file_info.output_filepath}"
+        )
+        cache.record_job(file_info.input_filepath, file_info.status.name, finishedAt=time.time())
+        return file_info
+    elif file_info.status == FileTaskStatus.PASS:
+        logger.warning(
+            f"작업이 통과되었습니다.\nState: {file_info.status}\nInput Filepath: {file_info.input_filepath}\nOutput Filepath: {file_info.output_filepath}"
+        )
+        utils.remove(file_info.output_filepath, raise_error=False)
+        file_info.refresh_stat(isInput=False)
+        if is_replace:
+            try:
+                streamcopy(fileInfo=file_info, encodeOption=encodeOption)
+            finally:
+                # 통과된 작업에서 이어진 입력 파일 해시 계산이 남아 있지 않도록 함
+                file_info.cancel_input_file_MD5()
+    else:
+        logger.error(f"상태가 올바르지 않은 작업이 있습니다.\nFileInfo: {file_info}")
+
+    cache.record_job(
+        file_info.input_filepath,
+        file_info.status.name,
+        outputFilepath=file_info.output_filepath,
+        finishedAt=time.time(),
+    )
+
+    logger.info(f"처리완료\n최종 파일 정보: {pformat(file_info)}")
 
-        logger.info(f"처리완료\n최종 파일 정보: {pformat(file_info)}")
+    return file_info
 
 
 if __name__ == "__main__":
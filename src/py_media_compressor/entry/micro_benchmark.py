@@ -0,0 +1,234 @@
+import contextlib
+import io
+import os
+import queue
+import statistics
+import tempfile
+import timeit
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from py_media_compressor import encoder, log, model
+from py_media_compressor.common import DictDataBase, progress
+from py_media_compressor.encoder.encoder import msg_reader
+
+# 측정 대상 이름: 준비 함수 (임시 디렉토리 경로 -> (측정할 함수, 반복당 실행 횟수))
+MICRO_BENCHMARK_CASES: Dict[str, Callable[[str], Tuple[Callable[[], Any], int]]] = {}
+
+# ffmpeg -progress pipe:1 출력 한 묶음
+PROGRESS_BLOCK = (
+    "frame={frame}\n"
+    "fps=30.00\n"
+    "stream_0_0_q=28.0\n"
+    "bitrate=1234.5kbits/s\n"
+    "total_size={size}\n"
+    "out_time_us={time}\n"
+    "out_time_ms={time}\n"
+    "out_time=00:00:{seconds:09.6f}\n"
+    "dup_frames=0\n"
+    "drop_frames=0\n"
+    "speed=1.00x\n"
+    "progress=continue\n"
+)
+
+PROGRESS_BLOCK_COUNT = 200
+
+
+def micro_benchmark_case(name: str):
+    """측정 대상을 등록합니다.
+
+    Args:
+        name (str): 측정 대상 이름
+    """
+
+    def decorator(func):
+        MICRO_BENCHMARK_CASES[name] = func
+        return func
+
+    return decorator
+
+
+def _get_progress_lines() -> List[str]:
+    lines = []
+    for idx in range(PROGRESS_BLOCK_COUNT):
+        seconds = idx * 0.5
+        lines.extend(
+            PROGRESS_BLOCK.format(
+                frame=idx * 15, size=idx * 65536, time=int(seconds * 1000000), seconds=seconds
+            ).splitlines(keepends=True)
+        )
+    return lines
+
+
+@micro_benchmark_case("dict_data_get_value")
+def _case_dict_data_get_value(dirpath: str):
+    encode_option = model.EncodeOption()
+
+    def run():
+        return (encode_option.crf, encode_option.codec, encode_option.max_height, encode_option.is_force)
+
+    return run, 2000
+
+
+@micro_benchmark_case("dict_data_get_value_fallback")
+def _case_dict_data_get_value_fallback(dirpath: str):
+    # DictField 를 사용하지 않고, 호출한 속성 이름으로 항목을 찾는 기존 방식 (_get_value)
+    class FallbackData(DictDataBase):
+        def __init__(self) -> None:
+            super().__init__()
+            self._data = {"crf": 23, "codec": "h.264", "max_height": 1440, "is_force": False}
+
+        @property
+        def crf(self) -> int:
+            return self._get_value()
+
+        @property
+        def codec(self) -> str:
+            return self._get_value()
+
+        @property
+        def max_height(self) -> int:
+            return self._get_value()
+
+        @property
+        def is_force(self) -> bool:
+            return self._get_value()
+
+    data = FallbackData()
+
+    def run():
+        return (data.crf, data.codec, data.max_height, data.is_force)
+
+    return run, 2000
+
+
+@micro_benchmark_case("dict_data_set_value")
+def _case_dict_data_set_value(dirpath: str):
+    filepath = os.path.join(dirpath, "set_value.mp4")
+    with open(filepath, "wb") as f:
+        f.write(b"\0")
+
+    file_info = model.FileInfo(filepath)
+
+    def run():
+        file_info.output_filepath = filepath
+
+    return run, 2000
+
+
+@micro_benchmark_case("get_logger")
+def _case_get_logger(dirpath: str):
+    def run():
+        return log.get_logger(run)
+
+    return run, 1000
+
+
+@micro_benchmark_case("progress_parser")
+def _case_progress_parser(dirpath: str):
+    lines = [("stdout", line.encode("utf-8")) for line in _get_progress_lines()]
+    lines.append(("stderr", b"frame=  100 fps= 30 q=28.0 size=     256kB time=00:00:03.33 bitrate= 629.1kbits/s\n"))
+
+    def run():
+        pipe_queue = queue.Queue()
+        for line in lines:
+            pipe_queue.put(line)
+        pipe_queue.put(None)
+        pipe_queue.put(None)
+
+        progress.parser(pipe_queue, queue.Queue())
+
+    return run, 20
+
+
+@micro_benchmark_case("msg_reader")
+def _case_msg_reader(dirpath: str):
+    logger = log.get_logger(msg_reader)
+    duration = PROGRESS_BLOCK_COUNT * 0.5
+
+    msgs = []
+    for line in _get_progress_lines():
+        key, value = line.strip().split("=", 1)
+        msgs.append({"type": "stdout", key: value})
+
+    ffmpeg_args = SimpleNamespace(
+        file_info=SimpleNamespace(input_filesize=1 << 40),
+        probe_info={"format": {"duration": str(duration)}},
+        encode_option=model.EncodeOption(isSizeSkip=True),
+        is_streamcopy=False,
+        is_only_audio=False,
+    )
+
+    def run():
+        msg_queue = queue.Queue()
+        for msg in msgs:
+            msg_queue.put(msg)
+        msg_queue.put(None)
+
+        # 진행바 출력은 측정에서 제외
+        with contextlib.redirect_stderr(io.StringIO()):
+            msg_reader(logger, msg_queue, ffmpeg_args, queue.Queue(), [], True)
+
+    return run, 10
+
+
+@micro_benchmark_case("dedup")
+def _case_dedup(dirpath: str):
+    media_dirpath = os.path.join(dirpath, "dedup")
+    os.makedirs(media_dirpath, exist_ok=True)
+
+    # 크기가 모두 다른 파일, 크기만 같은 파일, 내용까지 같은 파일
+    for idx in range(100):
+        with open(os.path.join(media_dirpath, f"unique_{idx:03d}.mp4"), "wb") as f:
+            f.write(os.urandom(4096 + idx))
+    for idx in range(50):
+        for suffix in ["a", "b"]:
+            with open(os.path.join(media_dirpath, f"same_size_{idx:03d}_{suffix}.mp4"), "wb") as f:
+                f.write(os.urandom(65536))
+    for idx in range(25):
+        data = os.urandom(131072 + idx)
+        for suffix in ["a", "b"]:
+            with open(os.path.join(media_dirpath, f"duplicate_{idx:03d}_{suffix}.mp4"), "wb") as f:
+                f.write(data)
+
+    def run():
+        encoder.get_source_file([media_dirpath], [".mp4"], useDeduplicationFilter=True)
+
+    return run, 5
+
+
+def run_micro_benchmarks(caseNames: Optional[List[str]] = None, repeat: int = 5) -> List[Dict]:
+    """Python 코드의 주요 실행 경로를 합성 입력으로 측정합니다.
+
+    Args:
+        caseNames (Optional[List[str]], optional): 측정할 대상 이름, None 일 경우 모든 대상. Defaults to None.
+        repeat (int, optional): 측정 반복 횟수. Defaults to 5.
+
+    Returns:
+        List[Dict]: 측정 대상별 1회 실행 시간 (마이크로초) 결과
+    """
+
+    logger = log.get_logger(run_micro_benchmarks)
+
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="amcp_micro_benchmark_") as dirpath:
+        for name in caseNames if caseNames is not None else MICRO_BENCHMARK_CASES.keys():
+            func, number = MICRO_BENCHMARK_CASES[name](dirpath)
+
+            # 첫 실행 시의 초기화 비용 제외
+            func()
+
+            timings = [timing / number * 1000000 for timing in timeit.repeat(func, number=number, repeat=repeat)]
+            result = {
+                "case": name,
+                "number": number,
+                "repeat": repeat,
+                "best_us": round(min(timings), 3),
+                "mean_us": round(statistics.mean(timings), 3),
+                "stdev_us": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+            }
+            results.append(result)
+            logger.info(f"{name}: best={result['best_us']}us, mean={result['mean_us']}us")
+
+    return results
@@ -1,9 +1,11 @@
 from .encode_option import EncodeOption
 from .ffmpeg_args import FFmpegArgs
 from .file_info import FileInfo
+from .file_record import FileRecord
 
 __all__ = [
     "EncodeOption",
     "FFmpegArgs",
     "FileInfo",
+    "FileRecord",
 ]
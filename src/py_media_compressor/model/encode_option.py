@@ -1,7 +1,16 @@
-from py_media_compressor.common import DictDataBase
+from typing import Any, Dict
+
+from py_media_compressor.common import DictDataBase, DictField
+from py_media_compressor.const import ENCODER_PRESET_LIST
 
 
 class EncodeOption(DictDataBase):
+    """변경할 수 없는 인코드 옵션
+
+    모든 파일이 같은 객체를 공유하며, 일부 값만 다른 옵션이 필요할 경우 replace 로 새 객체를 만듭니다.
+    해시 가능하므로, 옵션별로 계산되는 값의 캐시 키로 사용할 수 있습니다.
+    """
+
     def __init__(
         self,
         maxHeight: int = 1440,
@@ -15,6 +24,17 @@ class EncodeOption(DictDataBase):
         isCuda: bool = False,
         isReplace: bool = False,
         isSizeSkip: bool = False,
+        threads: int = 0,
+        isHashWhileEncoding: bool = False,
+        chunks: int = 0,
+        targetSizeRatio: float = 0.0,
+        targetQuality: float = 0.0,
+        qualityMetric: str = "ssim",
+        sizeSkipWarmup: float = 0.1,
+        sizeSkipMargin: float = 0.2,
+        estimateThreshold: float = 0.0,
+        isEstimateWithSample: bool = False,
+        preset: str = "slower",
     ) -> None:
         """인코드 옵션
 
@@ -30,6 +50,17 @@ class EncodeOption(DictDataBase):
             isCuda (bool, optional): CUDA 그래픽카드를 사용하여 소스 파일을 디코드합니다. Defaults to False.
             isReplace (bool, optional): 원본 파일보다 작을 경우, 원본 파일을 덮어씁니다. 아닐 경우, 출력파일이 삭제됩니다. Defaults to False.
             isSizeSkip (bool, optional): 빠른 작업을 위해 인코딩 도중 출력파일 크기가 입력파일 크기보다 커지는 순간 즉시 건너뜁니다. Defaults to False.
+            threads (int, optional): ffmpeg 가 사용할 스레드 수. 0 일 경우, ffmpeg 가 자동으로 결정합니다. Defaults to 0.
+            isHashWhileEncoding (bool, optional): 인코딩 시작 전 입력 파일 해시를 계산하지 않고, 인코딩과 동시에 계산하여 출력 파일의 메타데이터에 기록합니다. Defaults to False.
+            chunks (int, optional): 하나의 파일을 여러 구간으로 나누어 동시에 인코딩할 구간 수. 2 미만일 경우, 나누지 않습니다. Defaults to 0.
+            targetSizeRatio (float, optional): 입력 파일 대비 목표 출력 크기 비율. 0 보다 클 경우, 샘플 구간을 인코딩하여 CRF 를 탐색합니다. Defaults to 0.0.
+            targetQuality (float, optional): 목표 품질 점수. 0 보다 클 경우, 샘플 구간을 인코딩하여 CRF 를 탐색합니다. Defaults to 0.0.
+            qualityMetric (str, optional): 품질 측정 방식 ("ssim" = 0~1, "vmaf" = 0~100, libvmaf 필요). Defaults to "ssim".
+            sizeSkipWarmup (float, optional): isSizeSkip 사용 시, 최종 출력 크기 추정을 시작할 최소 진행률 (0~1). Defaults to 0.1.
+            sizeSkipMargin (float, optional): isSizeSkip 사용 시, 추정 오차를 고려한 여유분 비율 (진행률에 따라 줄어듦). Defaults to 0.2.
+            estimateThreshold (float, optional): 인코딩 전 예측한 출력 크기 비율이 이 값보다 클 경우, 인코딩하지 않습니다. 0 일 경우, 예측하지 않습니다. Defaults to 0.0.
+            isEstimateWithSample (bool, optional): 출력 크기 비율 예측 시, 샘플 구간을 인코딩하여 보정합니다. Defaults to False.
+            preset (str, optional): 비디오 인코더 프리셋. Defaults to "slower".
         """
 
         assert isinstance(maxHeight, int)
@@ -43,6 +74,17 @@ class EncodeOption(DictDataBase):
         assert isinstance(isCuda, bool)
         assert isinstance(isReplace, bool)
         assert isinstance(isSizeSkip, bool)
+        assert isinstance(threads, int) and threads >= 0
+        assert isinstance(isHashWhileEncoding, bool)
+        assert isinstance(chunks, int) and chunks >= 0
+        assert isinstance(targetSizeRatio, (int, float)) and targetSizeRatio >= 0
+        assert isinstance(targetQuality, (int, float)) and targetQuality >= 0
+        assert qualityMetric in ["ssim", "vmaf"]
+        assert isinstance(sizeSkipWarmup, (int, float)) and 0 <= sizeSkipWarmup <= 1
+        assert isinstance(sizeSkipMargin, (int, float)) and sizeSkipMargin >= 0
+        assert isinstance(estimateThreshold, (int, float)) and estimateThreshold >= 0
+        assert isinstance(isEstimateWithSample, bool)
+        assert preset in ENCODER_PRESET_LIST
 
         super().__init__()
 
@@ -64,53 +106,94 @@ class EncodeOption(DictDataBase):
             "is_cuda": isCuda,
             "is_replace": isReplace,
             "is_size_skip": isSizeSkip,
+            "threads": threads,
+            "is_hash_while_encoding": isHashWhileEncoding,
+            "chunks": chunks,
+            "target_size_ratio": float(targetSizeRatio),
+            "target_quality": float(targetQuality),
+            "quality_metric": qualityMetric,
+            "size_skip_warmup": float(sizeSkipWarmup),
+            "size_skip_margin": float(sizeSkipMargin),
+            "estimate_threshold": float(estimateThreshold),
+            "is_estimate_with_sample": isEstimateWithSample,
+            "preset": preset,
         }
 
-    def clone(self):
-        clone_option = EncodeOption()
-        clone_option._data = self.as_clone_dict()  # TODO: 더 좋은 방법을 사용할 수 있으면 수정필요
-        return clone_option
-
-    @property
-    def max_height(self) -> int:
-        return self._get_value()
+        # 생성 이후의 속성 변경을 막기 위한 표시를 겸함
+        self._key = tuple(self._data.items())
 
-    @property
-    def is_force(self) -> bool:
-        return self._get_value()
+    def __setattr__(self, name: str, value: Any) -> None:
+        if "_key" in self.__dict__:
+            raise AttributeError(f"인코드 옵션은 변경할 수 없습니다. replace 를 사용하세요. ({name})")
+        super().__setattr__(name, value)
 
-    @property
-    def is_force_res(self) -> bool:
-        return self._get_value()
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"인코드 옵션은 변경할 수 없습니다. ({name})")
 
-    @property
-    def codec(self) -> str:
-        return self._get_value()
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EncodeOption):
+            return NotImplemented
+        return self._key == other._key
 
-    @property
-    def crf(self) -> int:
-        return self._get_value()
+    def __hash__(self) -> int:
+        return hash(self._key)
 
-    @property
-    def remove_error_output(self) -> bool:
-        return self._get_value()
+    def _as_dict(self) -> Dict[str, Any]:
+        # 내부 값이 변경되지 않도록 복사본을 반환
+        return dict(self._data)
 
-    @property
-    def use_progressbar(self) -> bool:
-        return self._get_value()
+    def replace(self, **overrides) -> "EncodeOption":
+        """일부 값만 변경한 새 인코드 옵션을 만듭니다.
 
-    @property
-    def leave(self) -> bool:
-        return self._get_value()
-
-    @property
-    def is_cuda(self) -> bool:
-        return self._get_value()
+        Args:
+            **overrides: 변경할 값, 생성자와 같은 인수 이름을 사용합니다. (예: crf=20, isReplace=True)
+                crf 는 생성 시 코덱에 맞게 결정된 값이 유지되므로, 코덱을 변경할 경우 crf 도 함께 지정합니다.
 
-    @property
-    def is_replace(self) -> bool:
-        return self._get_value()
+        Returns:
+            EncodeOption: 변경된 인코드 옵션, 변경할 값이 없을 경우 자기 자신을 반환합니다.
+        """
 
-    @property
-    def is_size_skip(self) -> bool:
-        return self._get_value()
+        if len(overrides) == 0:
+            return self
+
+        kwargs = {_to_parameter_name(key): value for key, value in self._data.items()}
+
+        if len(unknown_keys := overrides.keys() - kwargs.keys()) > 0:
+            raise TypeError(f"알 수 없는 인코드 옵션입니다. ({', '.join(sorted(unknown_keys))})")
+
+        kwargs.update(overrides)
+        return EncodeOption(**kwargs)
+
+    def clone(self) -> "EncodeOption":
+        """변경할 수 없는 객체이므로, 복사하지 않고 자기 자신을 반환합니다."""
+
+        return self
+
+    max_height: DictField[int] = DictField()
+    is_force: DictField[bool] = DictField()
+    is_force_res: DictField[bool] = DictField()
+    codec: DictField[str] = DictField()
+    crf: DictField[int] = DictField()
+    remove_error_output: DictField[bool] = DictField()
+    use_progressbar: DictField[bool] = DictField()
+    leave: DictField[bool] = DictField()
+    is_cuda: DictField[bool] = DictField()
+    is_replace: DictField[bool] = DictField()
+    is_size_skip: DictField[bool] = DictField()
+    threads: DictField[int] = DictField()
+    is_hash_while_encoding: DictField[bool] = DictField()
+    chunks: DictField[int] = DictField()
+    target_size_ratio: DictField[float] = DictField()
+    target_quality: DictField[float] = DictField()
+    quality_metric: DictField[str] = DictField()
+    size_skip_warmup: DictField[float] = DictField()
+    size_skip_margin: DictField[float] = DictField()
+    estimate_threshold: DictField[float] = DictField()
+    is_estimate_with_sample: DictField[bool] = DictField()
+    preset: DictField[str] = DictField()
+
+
+def _to_parameter_name(key: str) -> str:
+    # _data 항목 이름 (snake_case) 을 생성자 인수 이름 (camelCase) 으로 변환
+    first, *others = key.split("_")
+    return first + "".join(other.capitalize() for other in others)
@@ -1,7 +1,6 @@
-from typing import Any, Dict, List
-
-import ffmpeg
+from typing import Any, Dict, List, Optional
 
+from py_media_compressor import cache
 from py_media_compressor.common import DictDataExtendBase
 from py_media_compressor.const import IGNORE_STREAM_FILTER
 from py_media_compressor.model.encode_option import EncodeOption
@@ -9,10 +8,17 @@ from py_media_compressor.model.file_info import FileInfo
 
 
 class FFmpegArgs(DictDataExtendBase):
-    def __init__(self, fileInfo: FileInfo, encodeOption: EncodeOption = EncodeOption(), metadatas: Dict = {}) -> None:
+    def __init__(
+        self,
+        fileInfo: FileInfo,
+        encodeOption: EncodeOption = EncodeOption(),
+        metadatas: Dict = {},
+        probeInfo: Optional[Dict] = None,
+    ) -> None:
         assert isinstance(fileInfo, FileInfo)
         assert isinstance(encodeOption, EncodeOption)
         assert isinstance(metadatas, dict)
+        assert probeInfo is None or isinstance(probeInfo, dict)
 
         super().__init__()
 
@@ -20,7 +26,11 @@ class FFmpegArgs(DictDataExtendBase):
         self._encode_option = encodeOption
 
         self._file_info = fileInfo
-        self._probe_info = ffmpeg.probe(self.file_info.input_filepath)
+        # 미리 실행한 ffprobe 결과가 있을 경우, 다시 실행하지 않음
+        self._probe_info = probeInfo if probeInfo is not None else cache.get_probe_info(self.file_info.input_filepath)
+
+        # 인코딩과 동시에 계산될 입력 파일 해시의 자리 표시자 (출력 파일 메타데이터에 기록된 뒤 교체됨)
+        self._input_hash_placeholder = None
 
         self._video_stream = None
         self._audio_streams = []
@@ -64,6 +74,14 @@ class FFmpegArgs(DictDataExtendBase):
     def file_info(self):
         return self._file_info
 
+    @property
+    def input_hash_placeholder(self) -> Optional[str]:
+        return self._input_hash_placeholder
+
+    @input_hash_placeholder.setter
+    def input_hash_placeholder(self, placeholder: Optional[str]):
+        self._input_hash_placeholder = placeholder
+
     @property
     def probe_info(self) -> Dict:
         return self._probe_info
@@ -1,88 +1,224 @@
 import os
+import stat
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
 
-from py_media_compressor import utils
-from py_media_compressor.common import DictDataBase
+from py_media_compressor import cache, utils
+from py_media_compressor.common import DictDataBase, DictField
 from py_media_compressor.model.enum.file_task_status import FileTaskStatus
 
 
+def _get_file_stat(filepath: str) -> Optional[utils.FileStat]:
+    try:
+        file_stat = os.stat(filepath)
+    except (OSError, ValueError):
+        return None
+
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+
+    return utils.FileStat(
+        size=file_stat.st_size, mtime_ns=file_stat.st_mtime_ns, inode=file_stat.st_ino, device=file_stat.st_dev
+    )
+
+
 class FileInfo(DictDataBase):
     def __init__(self, inputFilepath: str) -> None:
         super().__init__()
 
         self._data = {"input_filepath": inputFilepath}
 
+        # 파일 경로별 상태 정보 스냅숏 (파일이 없을 경우 None), refresh_stat 호출 전까지 파일 시스템에 다시 접근하지 않음
+        self.__stats: Dict[str, Optional[utils.FileStat]] = {}
+
         assert self.is_input_file_exist, f"입력 파일이 존재하지 않습니다. Filepath: {inputFilepath}"
 
         self.output_filepath = ""
         self.status = FileTaskStatus.INIT
 
-        self.__input_file_MD5_size = 0
-        self.__output_file_MD5_size = 0
+        # 해시 계산 시점의 (파일 크기, 수정 시각), 값이 달라진 경우에만 다시 계산
+        self.__input_file_MD5_key = None
+        self.__output_file_MD5_key = None
+
+        # 별도 스레드에서 계산 중인 입력 파일 해시 (결과, 취소 이벤트, 스레드), 같은 파일의 후속 작업에서 공유
+        self.__input_file_MD5_job: Optional[Tuple[Future, threading.Event, threading.Thread]] = None
+        self.__input_file_MD5_job_lock = threading.Lock()
+
+    input_filepath: DictField[str] = DictField()
+    output_filepath: DictField[str] = DictField(readonly=False)
+    status: DictField[FileTaskStatus] = DictField(readonly=False)
+
+    def __get_stat(self, filepath: str) -> Optional[utils.FileStat]:
+        if filepath not in self.__stats:
+            self.__stats[filepath] = _get_file_stat(filepath)
+        return self.__stats[filepath]
 
     @property
-    def input_filepath(self) -> str:
-        return self._get_value()
+    def input_stat(self) -> Optional[utils.FileStat]:
+        return self.__get_stat(self.input_filepath)
 
     @property
-    def output_filepath(self) -> str:
-        return self._get_value()
+    def output_stat(self) -> Optional[utils.FileStat]:
+        return self.__get_stat(self.output_filepath)
+
+    def refresh_stat(self, isInput=True, isOutput=True):
+        """파일 상태 정보 스냅숏을 비워, 다음 접근 시 파일 시스템에서 다시 가져오도록 합니다.
+
+        인코딩, 이동, 삭제 등으로 파일을 변경한 뒤 호출합니다.
 
-    @output_filepath.setter
-    def output_filepath(self, outputFilepath: str):
-        self._set_value(outputFilepath)
+        Args:
+            isInput (bool, optional): 입력 파일의 스냅숏을 비웁니다. Defaults to True.
+            isOutput (bool, optional): 출력 파일의 스냅숏을 비웁니다. Defaults to True.
+        """
+
+        if isInput:
+            self.__stats.pop(self.input_filepath, None)
+        if isOutput:
+            self.__stats.pop(self.output_filepath, None)
+
+    def is_stat_stale(self, isInput=True, isOutput=True) -> bool:
+        """스냅숏을 가져온 이후 파일이 변경 (생성, 삭제 포함) 되었는지 확인합니다. 스냅숏은 갱신하지 않습니다.
+
+        Args:
+            isInput (bool, optional): 입력 파일을 확인합니다. Defaults to True.
+            isOutput (bool, optional): 출력 파일을 확인합니다. Defaults to True.
+
+        Returns:
+            bool: 스냅숏과 현재 파일 상태 정보가 다를 경우 True, 같거나 스냅숏이 없을 경우 False를 반환합니다.
+        """
+
+        filepaths = []
+        if isInput:
+            filepaths.append(self.input_filepath)
+        if isOutput:
+            filepaths.append(self.output_filepath)
+
+        return any(
+            filepath in self.__stats and self.__stats[filepath] != _get_file_stat(filepath) for filepath in filepaths
+        )
 
     @property
     def is_input_file_exist(self):
-        return os.path.isfile(self.input_filepath)
+        return self.input_stat is not None
 
     @property
     def is_output_file_exist(self):
-        return os.path.isfile(self.output_filepath)
+        return self.output_stat is not None
 
     @property
     def input_filesize(self) -> int:
-        if self.is_input_file_exist:
-            return self._set_value_pipe(os.path.getsize(self.input_filepath))
-        else:
-            return self._set_value_pipe(0)
+        file_stat = self.input_stat
+        return self._set_value_pipe(file_stat.size if file_stat is not None else 0, key="input_filesize")
 
     @property
     def output_filesize(self) -> int:
-        if self.is_output_file_exist:
-            return self._set_value_pipe(os.path.getsize(self.output_filepath))
-        else:
-            return self._set_value_pipe(0)
-
-    @property
-    def status(self) -> FileTaskStatus:
-        return self._get_value()
+        file_stat = self.output_stat
+        return self._set_value_pipe(file_stat.size if file_stat is not None else 0, key="output_filesize")
 
-    @status.setter
-    def status(self, status: FileTaskStatus):
-        self._set_value(status)
+    def __get_hash_key(self, filepath: str):
+        if (file_stat := self.__get_stat(filepath)) is None:
+            return None
+        return (file_stat.size, file_stat.mtime_ns)
 
     @property
     def input_file_MD5(self) -> str:
-        md5 = self._get_value()
+        md5 = self._get_value("input_file_MD5")
+        key = self.__get_hash_key(self.input_filepath)
 
-        if (
-            utils.is_str_empty_or_space(md5) or self.__input_file_MD5_size == self.input_filesize
-        ):  # 값의 신뢰도를 위해 이전 파일 크기와 현재 파일 크기가 같은지도 확인
-            md5 = utils.get_MD5_hash(self.input_filepath, useProgressbar=True)
-            self.__input_file_MD5_size = self.input_filesize
-            self._set_value(md5)
+        # 값의 신뢰도를 위해 이전 해시 계산 시점의 파일 크기 및 수정 시각이 현재와 같은지 확인
+        if utils.is_str_empty_or_space(md5) or self.__input_file_MD5_key != key:
+            md5 = self.__calc_input_file_MD5()
+
+        return md5
 
+    def __calc_input_file_MD5(self, cancelEvent: Optional[threading.Event] = None) -> str:
+        key = self.__get_hash_key(self.input_filepath)
+        md5 = utils.get_MD5_hash(self.input_filepath, useProgressbar=True, cancelEvent=cancelEvent)
+        self.__input_file_MD5_key = key
+        self._set_value(md5, key="input_file_MD5")
         return md5
 
+    def start_input_file_MD5(self) -> Future:
+        """입력 파일 해시를 별도 스레드에서 계산합니다. 이미 계산 중이거나 계산이 끝난 경우, 해당 결과를 공유합니다.
+
+        Returns:
+            Future: 입력 파일 MD5 해시값 (str)
+        """
+
+        with self.__input_file_MD5_job_lock:
+            if self.__input_file_MD5_job is not None:
+                future, cancel_event, _ = self.__input_file_MD5_job
+                if not cancel_event.is_set() and not (future.done() and future.exception() is not None):
+                    return future
+
+            future = Future()
+            cancel_event = threading.Event()
+
+            def calc():
+                try:
+                    future.set_result(self.__calc_input_file_MD5(cancelEvent=cancel_event))
+                except BaseException as ex:
+                    future.set_exception(ex)
+
+            thread = threading.Thread(target=calc, daemon=True)
+            thread.start()
+            self.__input_file_MD5_job = (future, cancel_event, thread)
+
+            return future
+
+    def cancel_input_file_MD5(self):
+        """별도 스레드에서 계산 중인 입력 파일 해시를 중단하고, 스레드가 종료될 때까지 기다립니다."""
+
+        with self.__input_file_MD5_job_lock:
+            job, self.__input_file_MD5_job = self.__input_file_MD5_job, None
+
+        if job is not None:
+            _, cancel_event, thread = job
+            cancel_event.set()
+            thread.join()
+
+    def get_known_input_file_MD5(self) -> Optional[str]:
+        """해시를 새로 계산하지 않고, 이미 계산된 값 (메모리 또는 영구 해시 캐시) 만 가져옵니다.
+
+        Returns:
+            Optional[str]: MD5 해시값, 아직 계산되지 않은 경우 None을 반환합니다.
+        """
+
+        md5 = self._get_value("input_file_MD5")
+        key = self.__get_hash_key(self.input_filepath)
+
+        if not utils.is_str_empty_or_space(md5) and self.__input_file_MD5_key == key:
+            return md5
+
+        if key is not None and (hash_cache := cache.get_hash_cache()) is not None:
+            return hash_cache.get(self.input_stat, "md5")
+
+        return None
+
+    @input_file_MD5.setter
+    def input_file_MD5(self, md5: str):
+        """미리 계산된 해시값을 설정합니다. (예: 중복 파일 필터링 단계에서 계산된 값)"""
+
+        self.__input_file_MD5_key = self.__get_hash_key(self.input_filepath)
+        self._set_value(md5, key="input_file_MD5")
+
     @property
     def output_file_MD5(self) -> str:
-        md5 = self._get_value()
+        md5 = self._get_value("output_file_MD5")
+        key = self.__get_hash_key(self.output_filepath)
 
-        if (
-            utils.is_str_empty_or_space(md5) or self.__output_file_MD5_size == self.output_filesize
-        ):  # 값의 신뢰도를 위해 이전 파일 크기와 현재 파일 크기가 같은지도 확인
+        # 값의 신뢰도를 위해 이전 해시 계산 시점의 파일 크기 및 수정 시각이 현재와 같은지 확인
+        if utils.is_str_empty_or_space(md5) or self.__output_file_MD5_key != key:
             md5 = utils.get_MD5_hash(self.output_filepath, useProgressbar=True)
-            self.__output_file_MD5_size = self.output_filesize
-            self._set_value(md5)
+            self.__output_file_MD5_key = key
+            self._set_value(md5, key="output_file_MD5")
 
         return md5
+
+    @output_file_MD5.setter
+    def output_file_MD5(self, md5: str):
+        """미리 계산된 해시값을 설정합니다."""
+
+        self.__output_file_MD5_key = self.__get_hash_key(self.output_filepath)
+        self._set_value(md5, key="output_file_MD5")
@@ -0,0 +1,63 @@
+import os
+import sys
+from typing import Any, Dict, Optional
+
+from py_media_compressor.common import DictBase
+from py_media_compressor.model.enum.file_task_status import FileTaskStatus
+from py_media_compressor.model.file_info import FileInfo
+
+
+class FileRecord(DictBase):
+    """검색된 소스 파일 하나의 최소 정보 (경로, 크기, 해시, 상태) 를 담는 경량 레코드입니다.
+
+    수백만 개의 파일을 검색할 때의 메모리 사용량을 줄이기 위해 __slots__ 를 사용하며, 폴더 경로는 같은 폴더의 파일끼리 공유합니다.
+    파일 시스템에 접근하지 않으므로, 실제로 인코딩할 때 to_file_info 로 FileInfo 로 변환하여 사용합니다.
+    """
+
+    __slots__ = ("_dirpath", "_filename", "input_filesize", "input_file_MD5", "status")
+
+    def __init__(
+        self,
+        inputFilepath: str,
+        inputFilesize: int = 0,
+        inputFileMD5: Optional[str] = None,
+        status: FileTaskStatus = FileTaskStatus.INIT,
+    ) -> None:
+        dirpath, filename = os.path.split(inputFilepath)
+
+        self._dirpath = sys.intern(dirpath)
+        self._filename = filename
+        self.input_filesize = inputFilesize
+        self.input_file_MD5 = inputFileMD5
+        self.status = status
+
+    @property
+    def input_filepath(self) -> str:
+        return os.path.join(self._dirpath, self._filename)
+
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "input_filepath": self.input_filepath,
+            "input_filesize": self.input_filesize,
+            "input_file_MD5": self.input_file_MD5,
+            "status": self.status,
+        }
+
+    def __repr__(self) -> str:
+        return f"FileRecord({self.input_filepath!r}, {self.input_filesize}, status={self.status.name})"
+
+    def to_file_info(self) -> FileInfo:
+        """인코딩에 사용할 FileInfo 로 변환합니다.
+
+        Returns:
+            FileInfo: 변환된 FileInfo
+        """
+
+        # 입력 파일 크기는 FileInfo 생성 시 만들어지는 상태 정보 스냅숏에서 가져옴
+        file_info = FileInfo(self.input_filepath)
+
+        if self.input_file_MD5:
+            file_info.input_file_MD5 = self.input_file_MD5
+        file_info.status = self.status
+
+        return file_info
@@ -1,18 +1,33 @@
-from .io import (
+from .hashing import (
+    calc_file_hash,
+    get_available_hash_algorithms,
+    get_file_hash,
     get_MD5_hash,
+    get_partial_file_hash,
+    new_hasher,
+)
+from .io import (
+    FileStat,
+    get_file_stat,
     get_media_files,
+    iter_media_files,
     load_config,
     move,
     overwrite_small_file,
     remove,
     save_config,
+    scan_media_files,
     set_file_permission,
 )
+from .mp4 import MP4_FILE_EXT_LIST, patch_mp4_comment, read_mp4_comment
 from .process import (
+    KeyboardControl,
     check_command_availability,
+    get_keyboard_control,
     process_control_wait,
     set_low_process_priority,
 )
+from .profiler import StageProfiler
 from .str_format import is_str_empty_or_space, pformat, string_decode
 
 __all__ = [
@@ -20,14 +35,29 @@ __all__ = [
     "is_str_empty_or_space",
     "string_decode",
     "get_media_files",
+    "iter_media_files",
+    "scan_media_files",
+    "FileStat",
+    "get_file_stat",
     "overwrite_small_file",
     "save_config",
     "load_config",
     "get_MD5_hash",
+    "get_file_hash",
+    "get_partial_file_hash",
+    "calc_file_hash",
+    "new_hasher",
+    "get_available_hash_algorithms",
     "set_file_permission",
+    "MP4_FILE_EXT_LIST",
+    "read_mp4_comment",
+    "patch_mp4_comment",
     "check_command_availability",
     "process_control_wait",
+    "KeyboardControl",
+    "get_keyboard_control",
     "set_low_process_priority",
     "move",
     "remove",
+    "StageProfiler",
 ]
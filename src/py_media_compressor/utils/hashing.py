@@ -0,0 +1,266 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+
+import tqdm
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+_MIN_BUFFER_SIZE = 1048576  # 1 * 1024 * 1024 (1MB)
+_MAX_BUFFER_SIZE = 16777216  # 16 * 1024 * 1024 (16MB)
+
+# 진행 상황 갱신 최소 간격 (초)
+_PROGRESS_INTERVAL = 0.2
+
+_HASHLIB_ALGORITHMS = ["md5", "sha1", "sha256", "blake2b", "blake2s"]
+_XXHASH_ALGORITHMS = ["xxh64", "xxh3_64", "xxh3_128"]
+
+
+def get_available_hash_algorithms() -> List[str]:
+    """사용 가능한 해시 알고리즘 목록을 가져옵니다.
+    blake3, xxhash 계열 알고리즘은 해당 패키지가 설치된 경우에만 사용할 수 있습니다.
+
+    Returns:
+        List[str]: 해시 알고리즘 이름 리스트
+    """
+
+    algorithms = list(_HASHLIB_ALGORITHMS)
+    if blake3 is not None:
+        algorithms.append("blake3")
+    if xxhash is not None:
+        algorithms.extend(_XXHASH_ALGORITHMS)
+    return algorithms
+
+
+def new_hasher(algorithm: str = "md5"):
+    """해시 알고리즘 이름에 해당하는 hasher 객체를 생성합니다.
+
+    Args:
+        algorithm (str, optional): 해시 알고리즘 이름. Defaults to "md5".
+
+    Returns:
+        hashlib 호환 hasher 객체 (update, hexdigest 지원)
+    """
+
+    assert algorithm in get_available_hash_algorithms(), f"지원하지 않는 해시 알고리즘입니다. Algorithm: {algorithm}"
+
+    if algorithm in _HASHLIB_ALGORITHMS:
+        return hashlib.new(algorithm)
+    elif algorithm == "blake3":
+        return blake3.blake3()
+    else:
+        return getattr(xxhash, algorithm)()
+
+
+def get_hash_buffer_size(fileSize: int) -> int:
+    """파일 크기에 맞는 읽기 버퍼 크기를 계산합니다. (1MB ~ 16MB)
+
+    Args:
+        fileSize (int): 파일 크기
+
+    Returns:
+        int: 버퍼 크기
+    """
+
+    return min(max(fileSize // 64, _MIN_BUFFER_SIZE), _MAX_BUFFER_SIZE)
+
+
+def calc_file_hash(
+    filepath: str,
+    algorithm: str = "md5",
+    blockSize: Optional[int] = None,
+    useProgressbar: bool = False,
+    progressCallback: Optional[Callable[[int], None]] = None,
+    cancelEvent: Optional[threading.Event] = None,
+) -> str:
+    """파일 전체의 해시값을 계산합니다. (캐시를 사용하지 않음)
+
+    재사용되는 버퍼에 readinto 로 직접 읽으므로, 블록마다 새 bytes 객체를 만들지 않습니다.
+
+    Args:
+        filepath (str): 파일 경로
+        algorithm (str, optional): 해시 알고리즘 이름. Defaults to "md5".
+        blockSize (Optional[int], optional): 한 번에 읽어올 블록 크기. Defaults to None. (None 일 경우, 파일 크기에 따라 자동 결정)
+        useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
+        progressCallback (Optional[Callable[[int], None]], optional): 읽은 바이트 수를 전달받는 함수. (일정 간격으로 모아서 호출됨) Defaults to None.
+        cancelEvent (Optional[threading.Event], optional): 설정될 경우, 다음 블록을 읽기 전에 계산을 중단합니다. Defaults to None.
+
+    Raises:
+        RuntimeWarning: cancelEvent 에 의해 계산이 중단된 경우
+
+    Returns:
+        str: 해시값
+    """
+
+    file_size = os.path.getsize(filepath)
+    if blockSize is None:
+        blockSize = get_hash_buffer_size(file_size)
+
+    hasher = new_hasher(algorithm)
+    buffer = bytearray(blockSize)
+    view = memoryview(buffer)
+
+    bar = (
+        tqdm.tqdm(
+            total=file_size,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            desc=f"Calculating {algorithm.upper()} Hash...: {os.path.basename(filepath)}",
+            leave=False,
+            mininterval=_PROGRESS_INTERVAL,
+        )
+        if useProgressbar
+        else None
+    )
+
+    pending_bytes = 0
+    last_update_time = time.monotonic()
+
+    def flush_progress():
+        if bar is not None:
+            bar.update(pending_bytes)
+        if progressCallback is not None:
+            progressCallback(pending_bytes)
+
+    try:
+        with open(filepath, "rb", buffering=0) as f:
+            while (read_size := f.readinto(buffer)) > 0:
+                if cancelEvent is not None and cancelEvent.is_set():
+                    raise RuntimeWarning(f"해시 계산이 취소되었습니다. Filepath: {filepath}")
+
+                hasher.update(view[:read_size])
+
+                pending_bytes += read_size
+                if (now := time.monotonic()) - last_update_time >= _PROGRESS_INTERVAL:
+                    flush_progress()
+                    pending_bytes = 0
+                    last_update_time = now
+
+        flush_progress()
+    finally:
+        if bar is not None:
+            bar.close()
+
+    return hasher.hexdigest()
+
+
+def get_file_hash(
+    filepath: str,
+    algorithm: str = "md5",
+    blockSize: Optional[int] = None,
+    useProgressbar: bool = False,
+    useCache: bool = True,
+    progressCallback: Optional[Callable[[int], None]] = None,
+    cancelEvent: Optional[threading.Event] = None,
+) -> str:
+    """파일의 해시값을 구합니다.
+
+    Args:
+        filepath (str): 파일 경로
+        algorithm (str, optional): 해시 알고리즘 이름. Defaults to "md5".
+        blockSize (Optional[int], optional): 한 번에 읽어올 블록 크기. Defaults to None. (None 일 경우, 파일 크기에 따라 자동 결정)
+        useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
+        useCache (bool, optional): 영구 해시 캐시 사용 여부. (파일이 변경되지 않았다면 다시 계산하지 않음) Defaults to True.
+        progressCallback (Optional[Callable[[int], None]], optional): 읽은 바이트 수를 전달받는 함수. Defaults to None.
+        cancelEvent (Optional[threading.Event], optional): 설정될 경우, 다음 블록을 읽기 전에 계산을 중단합니다. Defaults to None.
+
+    Returns:
+        str: 해시값
+    """
+
+    assert os.path.isfile(filepath), "파일이 존재하지 않습니다."
+
+    def calc_hash() -> str:
+        return calc_file_hash(
+            filepath,
+            algorithm=algorithm,
+            blockSize=blockSize,
+            useProgressbar=useProgressbar,
+            progressCallback=progressCallback,
+            cancelEvent=cancelEvent,
+        )
+
+    if useCache:
+        from py_media_compressor import cache
+
+        return cache.get_cached_file_hash(filepath, algorithm, calc_hash)
+    else:
+        return calc_hash()
+
+
+def get_MD5_hash(
+    filepath: str,
+    blockSize: Optional[int] = None,
+    useProgressbar: bool = False,
+    useCache: bool = True,
+    cancelEvent: Optional[threading.Event] = None,
+) -> str:
+    """파일의 MD5 해시값을 구합니다.
+
+    Args:
+        filepath (str): 파일 경로
+        blockSize (Optional[int], optional): 한 번에 읽어올 블록 크기. Defaults to None. (None 일 경우, 파일 크기에 따라 자동 결정)
+        useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
+        useCache (bool, optional): 영구 해시 캐시 사용 여부. (파일이 변경되지 않았다면 다시 계산하지 않음) Defaults to True.
+        cancelEvent (Optional[threading.Event], optional): 설정될 경우, 다음 블록을 읽기 전에 계산을 중단합니다. Defaults to None.
+
+    Returns:
+        str: MD5 해시값
+    """
+
+    return get_file_hash(
+        filepath, "md5", blockSize=blockSize, useProgressbar=useProgressbar, useCache=useCache, cancelEvent=cancelEvent
+    )
+
+
+def get_partial_file_hash(
+    filepath: str, chunkSize: int = 4194304, algorithm: str = "md5", useCache: bool = True
+) -> str:
+    """파일의 처음, 중간, 마지막 부분만 읽어 해시값을 구합니다.
+    파일 크기가 chunkSize * 3 이하일 경우, 파일 전체를 읽으므로 전체 해시와 같은 수준의 신뢰도를 가집니다.
+
+    Args:
+        filepath (str): 파일 경로
+        chunkSize (int, optional): 각 부분의 크기. Defaults to 4194304 (4MB).
+        algorithm (str, optional): 해시 알고리즘 이름. Defaults to "md5".
+        useCache (bool, optional): 영구 해시 캐시 사용 여부. Defaults to True.
+
+    Returns:
+        str: 부분 해시값 (파일 크기를 포함하여 계산됨)
+    """
+
+    assert os.path.isfile(filepath), "파일이 존재하지 않습니다."
+
+    def calc_hash() -> str:
+        file_size = os.path.getsize(filepath)
+
+        hasher = new_hasher(algorithm)
+        hasher.update(str(file_size).encode())
+
+        with open(filepath, "rb") as f:
+            if file_size <= chunkSize * 3:
+                hasher.update(f.read())
+            else:
+                for offset in (0, (file_size - chunkSize) // 2, file_size - chunkSize):
+                    f.seek(offset)
+                    hasher.update(f.read(chunkSize))
+
+        return hasher.hexdigest()
+
+    if useCache:
+        from py_media_compressor import cache
+
+        return cache.get_cached_file_hash(filepath, f"{algorithm}-partial-{chunkSize}", calc_hash)
+    else:
+        return calc_hash()
@@ -1,96 +1,135 @@
-import hashlib
 import os
 import platform
 import shutil
-from glob import escape, glob
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-import tqdm
 import yaml
 
 
-def get_media_files(path: str, useRealpath=False, mediaExtFilter: List[str] = None) -> List[str]:
-    """경로에 해당하는 미디어 파일 및 폴더 내의 모든 미디어 파일을 가져옵니다.
+def scan_media_files(
+    path: str, useRealpath=False, mediaExtFilter: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, int]]:
+    """경로에 해당하는 미디어 파일 및 폴더 내의 모든 미디어 파일을 검색하는 즉시 반환합니다.
+
+    os.scandir 의 DirEntry 가 가진 파일 정보를 재사용하므로, 파일마다 별도의 시스템 호출을 하지 않습니다.
+    POSIX 시스템에서는 심볼릭 링크를 무시하며, 이름이 "." 으로 시작하는 숨김 파일 및 폴더는 검색하지 않습니다.
 
     Args:
         path (str): 경로
         useRealpath (bool, optional): 절대 경로를 사용합니다. Defaults to False.
-        mediaExtFilter (List[str], optional): 확장자 필터. Defaults to None.
+        mediaExtFilter (Optional[Iterable[str]], optional): 확장자 필터. Defaults to None.
 
-    Returns:
-        List[str]: 파일의 목록을 반환합니다.
+    Yields:
+        Tuple[str, int]: 파일 경로, 파일 크기
     """
 
     if useRealpath:
         path = os.path.realpath(path)
 
-    def check_symlink(path: str) -> bool:
-        if os.name == "posix":
-            return os.path.islink(path)
-        else:
-            return False
+    ignore_symlink = os.name == "posix"
+
+    if ignore_symlink and os.path.islink(path):
+        return
 
-    if check_symlink(path):
-        return []
+    ext_filter = frozenset(ext.lower() for ext in mediaExtFilter) if mediaExtFilter is not None else None
 
-    if mediaExtFilter is not None:
-        ext_filter = (
-            lambda p: os.path.isfile(p) and os.path.splitext(p)[1].lower() in mediaExtFilter and not check_symlink(p)
-        )
-    else:
-        ext_filter = lambda p: os.path.isfile(p) and not check_symlink(p)
+    def is_media_file(filepath: str) -> bool:
+        return ext_filter is None or os.path.splitext(filepath)[1].lower() in ext_filter
 
     if os.path.isfile(path):
         if os.path.splitext(path)[-1].lower() == ".list":
             with open(path, "r", encoding="utf-8") as f:
-                paths = [line.strip().strip("\"',").strip() for line in f.readlines()]
-            return list(filter(ext_filter, paths))
+                for line in f:
+                    filepath = line.strip().strip("\"',").strip()
+                    if (
+                        is_media_file(filepath)
+                        and os.path.isfile(filepath)
+                        and not (ignore_symlink and os.path.islink(filepath))
+                    ):
+                        yield (filepath, os.path.getsize(filepath))
         else:
-            return [path]
+            yield (path, os.path.getsize(path))
     elif os.path.isdir(path):
-        path = os.path.join(escape(path), "**")
+        dirpaths = [path]
+        while len(dirpaths) > 0:
+            dirpath = dirpaths.pop()
+
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            sub_dirpaths = []
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+
+                try:
+                    if entry.is_symlink() and ignore_symlink:
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dirpaths.append(entry.path)
+                    elif entry.is_file() and is_media_file(entry.name):
+                        yield (entry.path, entry.stat().st_size)
+                except OSError:
+                    continue
+
+            # 하위 폴더를 이름 순서대로 탐색
+            dirpaths.extend(reversed(sub_dirpaths))
+
+
+def iter_media_files(path: str, useRealpath=False, mediaExtFilter: Optional[Iterable[str]] = None) -> Iterator[str]:
+    """경로에 해당하는 미디어 파일 및 폴더 내의 모든 미디어 파일을 검색하는 즉시 반환합니다.
+
+    Args:
+        path (str): 경로
+        useRealpath (bool, optional): 절대 경로를 사용합니다. Defaults to False.
+        mediaExtFilter (Optional[Iterable[str]], optional): 확장자 필터. Defaults to None.
+
+    Yields:
+        str: 파일 경로
+    """
+
+    for filepath, _ in scan_media_files(path, useRealpath=useRealpath, mediaExtFilter=mediaExtFilter):
+        yield filepath
+
+
+def get_media_files(path: str, useRealpath=False, mediaExtFilter: List[str] = None) -> List[str]:
+    """경로에 해당하는 미디어 파일 및 폴더 내의 모든 미디어 파일을 가져옵니다.
+
+    Args:
+        path (str): 경로
+        useRealpath (bool, optional): 절대 경로를 사용합니다. Defaults to False.
+        mediaExtFilter (List[str], optional): 확장자 필터. Defaults to None.
+
+    Returns:
+        List[str]: 파일의 목록을 반환합니다.
+    """
+
+    return list(iter_media_files(path, useRealpath=useRealpath, mediaExtFilter=mediaExtFilter))
+
 
-        return list(filter(ext_filter, glob(path, recursive=True)))
-    else:
-        return []
+class FileStat(NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+    device: int
 
 
-def get_MD5_hash(filepath: str, blockSize: int = 65536, useProgressbar: bool = False) -> str:
-    """파일의 MD5 해시값을 구합니다.
+def get_file_stat(filepath: str) -> FileStat:
+    """캐시 키로 사용할 수 있는 파일 상태 정보를 가져옵니다.
 
     Args:
         filepath (str): 파일 경로
-        blockSize (int, optional): 한 번에 읽어올 파일의 블록 크기. Defaults to 65536 (64KB).
-        useProgressbar (bool, optional): 진행바 사용 여부. Defaults to False.
 
     Returns:
-        str: MD5 해시값
+        FileStat: 파일 크기, 수정 시각 (ns), inode, 장치 번호
     """
 
-    assert os.path.isfile(filepath), "파일이 존재하지 않습니다."
-
-    hasher = hashlib.md5()
-
-    if useProgressbar:
-        file_size = os.path.getsize(filepath)
-        total_blocks = (file_size + blockSize - 1) // blockSize
-
-        with open(filepath, "rb") as f:
-            for byte_block in tqdm.tqdm(
-                iter(lambda: f.read(blockSize), b""),
-                total=total_blocks,
-                unit="KB",
-                unit_scale=blockSize / 1024,
-                desc=f"Calculating MD5 Hash...: {os.path.basename(filepath)}",
-                leave=False,
-            ):
-                hasher.update(byte_block)
-    else:
-        with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(blockSize), b""):
-                hasher.update(byte_block)
-
-    return hasher.hexdigest()
+    stat = os.stat(filepath)
+    return FileStat(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino, device=stat.st_dev)
 
 
 def overwrite_small_file(originFilepath: str, destinationFilepath: str, orginFileRemove=True) -> bool:
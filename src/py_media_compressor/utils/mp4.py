@@ -0,0 +1,165 @@
+import os
+import struct
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+# 비정상적인 파일에서 과도한 메모리 사용을 막기 위한 Comment 최대 크기
+_MAX_COMMENT_SIZE = 1048576  # 1 * 1024 * 1024 (1MB)
+
+MP4_FILE_EXT_LIST = [".mp4", ".m4a", ".m4v", ".mov"]
+
+
+def _iter_boxes(f: BinaryIO, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """지정된 범위 안의 MP4 박스(atom)를 순회합니다. 박스 내용은 읽지 않습니다.
+
+    Yields:
+        Tuple[bytes, int, int]: 박스 타입, 내용 시작 위치, 박스 끝 위치
+    """
+
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+
+        size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+
+        if size == 1:
+            large_size = f.read(8)
+            if len(large_size) < 8:
+                return
+            size = struct.unpack(">Q", large_size)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+
+        if size < header_size or pos + size > end:
+            return
+
+        yield (box_type, pos + header_size, pos + size)
+
+        pos += size
+
+
+def _find_box(f: BinaryIO, start: int, end: int, boxType: bytes) -> Optional[Tuple[int, int]]:
+    for box_type, box_start, box_end in _iter_boxes(f, start, end):
+        if box_type == boxType:
+            return (box_start, box_end)
+    return None
+
+
+def _find_ilst_comment_range(f: BinaryIO, start: int, end: int) -> Optional[Tuple[int, int]]:
+    if (cmt := _find_box(f, start, end, b"\xa9cmt")) is None:
+        return None
+
+    if (data := _find_box(f, *cmt, b"data")) is None:
+        return None
+
+    data_start, data_end = data
+    data_start += 8  # type indicator (4 bytes) + locale (4 bytes)
+    if data_start > data_end:
+        return None
+
+    return (data_start, data_end)
+
+
+def _find_udta_comment_range(f: BinaryIO, start: int, end: int) -> Optional[Tuple[int, int]]:
+    if (meta := _find_box(f, start, end, b"meta")) is not None:
+        meta_start, meta_end = meta
+
+        # ISO 형식의 meta 박스는 version, flags (4 bytes) 를 포함
+        f.seek(meta_start)
+        if f.read(4) == b"\x00\x00\x00\x00":
+            meta_start += 4
+
+        if (ilst := _find_box(f, meta_start, meta_end, b"ilst")) is not None:
+            if (comment_range := _find_ilst_comment_range(f, *ilst)) is not None:
+                return comment_range
+
+    # QuickTime 형식 (udta 바로 아래의 ©cmt 박스)
+    if (cmt := _find_box(f, start, end, b"\xa9cmt")) is not None:
+        cmt_start, cmt_end = cmt
+        f.seek(cmt_start)
+        if len(header := f.read(4)) == 4:
+            length = struct.unpack(">H", header[:2])[0]
+            if cmt_start + 4 + length <= cmt_end:
+                return (cmt_start + 4, cmt_start + 4 + length)
+
+    return None
+
+
+def _find_comment_range(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    file_size = os.fstat(f.fileno()).st_size
+
+    boxes = _iter_boxes(f, 0, file_size)
+    if (first_box := next(boxes, None)) is None or first_box[0] != b"ftyp":
+        return None
+
+    for box_type, box_start, box_end in boxes:
+        if box_type == b"moov":
+            if (udta := _find_box(f, box_start, box_end, b"udta")) is not None:
+                return _find_udta_comment_range(f, *udta)
+            return None
+
+    return None
+
+
+def read_mp4_comment(filepath: str) -> Optional[str]:
+    """ffprobe 를 실행하지 않고, MP4 컨테이너의 Comment 메타데이터를 직접 읽습니다.
+
+    박스 헤더만 따라가며 필요한 위치로 이동하므로, 파일 크기와 관계없이 몇 KB만 읽습니다.
+
+    Args:
+        filepath (str): 파일 경로
+
+    Returns:
+        Optional[str]: Comment 메타데이터, MP4 형식이 아니거나 Comment가 없을 경우 None을 반환합니다.
+    """
+
+    with open(filepath, "rb") as f:
+        if (comment_range := _find_comment_range(f)) is None:
+            return None
+
+        comment_start, comment_end = comment_range
+        if comment_end - comment_start > _MAX_COMMENT_SIZE:
+            return None
+
+        f.seek(comment_start)
+        return f.read(comment_end - comment_start).decode("utf-8", errors="replace")
+
+
+def patch_mp4_comment(filepath: str, oldValue: str, newValue: str) -> bool:
+    """MP4 컨테이너의 Comment 메타데이터 안의 문자열을 파일을 다시 쓰지 않고 그 자리에서 교체합니다.
+    박스 크기가 바뀌지 않도록, 두 문자열의 UTF-8 바이트 길이는 같아야 합니다.
+
+    Args:
+        filepath (str): 파일 경로
+        oldValue (str): Comment 안에서 찾을 문자열
+        newValue (str): 교체할 문자열
+
+    Returns:
+        bool: 교체에 성공한 경우 True, Comment 또는 문자열을 찾지 못한 경우 False를 반환합니다.
+    """
+
+    old_bytes = oldValue.encode("utf-8")
+    new_bytes = newValue.encode("utf-8")
+
+    assert len(old_bytes) == len(new_bytes), "교체할 문자열의 길이가 같아야 합니다."
+
+    with open(filepath, "r+b") as f:
+        if (comment_range := _find_comment_range(f)) is None:
+            return False
+
+        comment_start, comment_end = comment_range
+        if comment_end - comment_start > _MAX_COMMENT_SIZE:
+            return False
+
+        f.seek(comment_start)
+        if (idx := f.read(comment_end - comment_start).find(old_bytes)) < 0:
+            return False
+
+        f.seek(comment_start + idx)
+        f.write(new_bytes)
+
+    return True
@@ -3,7 +3,7 @@ import subprocess
 import threading
 import time
 from queue import Queue
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import psutil
 
@@ -116,6 +116,100 @@ class KBHit:
             return dr != []
 
 
+class KeyboardControl:
+    """키보드 입력을 하나의 스레드에서만 읽고, 등록된 모든 컨트롤 큐에 전달합니다.
+
+    여러 작업이 동시에 실행될 때에도 p 키 입력으로 모든 작업이 함께 일시 정지 및 재개됩니다.
+    터미널 설정은 첫 번째 큐가 등록될 때 변경되고, 마지막 큐가 해제될 때 복원됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._queues: List[Queue] = []
+        self._queues_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[threading.Event] = None
+        self._is_paused = False
+
+    @property
+    def is_paused(self) -> bool:
+        return self._is_paused
+
+    def register(self, controlQueue: Queue):
+        """컨트롤 큐를 등록합니다. 일시 정지 중일 경우, 즉시 "pause" 를 전달합니다.
+
+        Args:
+            controlQueue (Queue): 컨트롤 큐 ("pause", "resume" 이 전달됨)
+        """
+
+        with self._thread_lock:
+            with self._queues_lock:
+                self._queues.append(controlQueue)
+                if self._is_paused:
+                    controlQueue.put("pause")
+
+            if self._thread is None:
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._read_input, args=[self._stop_event], name="keyboard_control", daemon=True
+                )
+                self._thread.start()
+
+    def unregister(self, controlQueue: Queue):
+        """컨트롤 큐의 등록을 해제합니다. 등록된 큐가 없을 경우, 입력 스레드를 종료하고 터미널 설정을 복원합니다.
+
+        Args:
+            controlQueue (Queue): 컨트롤 큐
+        """
+
+        with self._thread_lock:
+            with self._queues_lock:
+                if controlQueue in self._queues:
+                    self._queues.remove(controlQueue)
+                if len(self._queues) > 0:
+                    return
+                self._is_paused = False
+
+            if self._thread is not None:
+                self._stop_event.set()
+                self._thread.join()
+                self._thread = None
+
+    def _read_input(self, stopEvent: threading.Event):
+        try:
+            kb = KBHit()
+        except Exception:
+            # 터미널이 아닌 경우 (파이프, 서비스 등) 키보드 입력을 사용하지 않음
+            return
+
+        try:
+            while not stopEvent.is_set():
+                try:
+                    if kb.kbhit() and kb.getch() == "p":
+                        with self._queues_lock:
+                            self._is_paused = not self._is_paused
+                            for q in self._queues:
+                                q.put("pause" if self._is_paused else "resume")
+                except Exception:
+                    pass
+                time.sleep(0.1)
+        finally:
+            kb.set_normal_term()
+
+
+_keyboard_control = KeyboardControl()
+
+
+def get_keyboard_control() -> KeyboardControl:
+    """모든 작업이 공유하는 키보드 입력 관리자를 가져옵니다.
+
+    Returns:
+        KeyboardControl: 키보드 입력 관리자
+    """
+
+    return _keyboard_control
+
+
 def process_control_wait(process: subprocess.Popen, control_queue: Optional[Queue]):
     """프로세스를 조작가능한 상태로 종료를 기다립니다.
     비동기적 입력 코드는 https://stackoverflow.com/a/2409034/12745351 이곳에서 참고했습니다.
@@ -132,7 +226,6 @@ def process_control_wait(process: subprocess.Popen, control_queue: Optional[Queu
     p_process = psutil.Process(process_id)
 
     exit_code_dict = {}
-    is_process_ended = False
     is_pause = False
     result = None
 
@@ -141,28 +234,15 @@ def process_control_wait(process: subprocess.Popen, control_queue: Optional[Queu
     else:
         q = control_queue
 
-    def wait_input():
-        kb = KBHit()
-
-        while not is_process_ended:
-            try:
-                if kb.kbhit():
-                    key = kb.getch()
-                    if key == "p":
-                        q.put("pause")
-            except Exception:
-                pass
-            time.sleep(0.1)
-
-        kb.set_normal_term()
-
     def process_wait(exit_code_dict):
         exit_code_dict["code"] = process.wait()
 
     process_wait_thread = threading.Thread(target=process_wait, args=[exit_code_dict])
-    input_thread = threading.Thread(target=wait_input)
     process_wait_thread.start()
-    input_thread.start()
+
+    # 동시에 실행 중인 모든 작업이 하나의 키보드 입력 스레드를 공유
+    keyboard_control = get_keyboard_control()
+    keyboard_control.register(q)
 
     try:
         while p_process.is_running():
@@ -170,13 +250,12 @@ def process_control_wait(process: subprocess.Popen, control_queue: Optional[Queu
                 time.sleep(0.1)
             else:
                 msg = q.get()
-                if msg == "pause":
-                    if is_pause:
-                        p_process.resume()
-                        is_pause = False
-                    else:
-                        p_process.suspend()
-                        is_pause = True
+                if msg == "pause" and not is_pause:
+                    p_process.suspend()
+                    is_pause = True
+                elif msg == "resume" and is_pause:
+                    p_process.resume()
+                    is_pause = False
                 elif msg == "pass":
                     p_process.kill()
                     result = "pass"
@@ -184,10 +263,10 @@ def process_control_wait(process: subprocess.Popen, control_queue: Optional[Queu
         if p_process.is_running():
             p_process.kill()
         result = "suspend"
+    finally:
+        keyboard_control.unregister(q)
 
-    is_process_ended = True
     process_wait_thread.join()
-    input_thread.join()
 
     return (exit_code_dict.get("code"), result)
 
@@ -0,0 +1,95 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Set
+
+
+class StageProfiler:
+    """작업 단계별로 cProfile 결과를 모아, 단계마다 하나의 pstats 파일로 저장합니다.
+
+    같은 단계가 여러 번 실행될 경우, 실행마다 측정한 결과를 합쳐서 저장합니다.
+    메인 스레드에서 실행된 단계만 측정하며, 다른 스레드에서 동시에 실행되는 단계 (병렬 작업, 파이프라인) 는 측정하지 않습니다.
+    (Python 3.12 이상에서는 동시에 하나의 프로파일러만 활성화할 수 있고, 활성화된 프로파일러가 모든 스레드를 측정하므로
+    단계별 결과를 구분할 수 없음)
+    """
+
+    def __init__(self, dirpath: str) -> None:
+        self._dirpath = dirpath
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, List[cProfile.Profile]] = {}
+        self._skipped_stages: Set[str] = set()
+
+    @property
+    def skipped_stages(self) -> Set[str]:
+        """측정하지 않은 실행이 있는 단계 이름"""
+
+        with self._lock:
+            return set(self._skipped_stages)
+
+    @contextmanager
+    def stage(self, name: str):
+        """해당 범위의 실행을 name 단계로 측정합니다.
+
+        Args:
+            name (str): 단계 이름
+
+        Yields:
+            bool: 측정하는 경우 True, 메인 스레드가 아니거나 이미 다른 단계를 측정 중이어서 측정하지 않는 경우 False
+        """
+
+        profile = cProfile.Profile()
+
+        try:
+            if threading.current_thread() is not threading.main_thread():
+                raise ValueError("메인 스레드에서만 측정합니다.")
+            profile.enable()
+        except ValueError:
+            # 다른 스레드에서 실행되거나, 이미 다른 단계를 측정 중인 경우
+            with self._lock:
+                self._skipped_stages.add(name)
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.setdefault(name, []).append(profile)
+
+    def dump(self, sortKey: str = "cumulative", limit: int = 30) -> List[str]:
+        """단계별 측정 결과를 {단계 이름}.prof (pstats) 및 {단계 이름}.txt (요약) 파일로 저장합니다.
+
+        Args:
+            sortKey (str, optional): 요약 정렬 기준. Defaults to "cumulative".
+            limit (int, optional): 요약에 포함할 함수 수. Defaults to 30.
+
+        Returns:
+            List[str]: 저장된 pstats 파일 경로 리스트
+        """
+
+        os.makedirs(self._dirpath, exist_ok=True)
+
+        with self._lock:
+            profiles = {name: list(profiles) for name, profiles in self._profiles.items()}
+
+        filepaths = []
+
+        for name, stage_profiles in profiles.items():
+            stats = pstats.Stats(stage_profiles[0])
+            for profile in stage_profiles[1:]:
+                stats.add(profile)
+
+            filepath = os.path.join(self._dirpath, f"{name}.prof")
+            stats.dump_stats(filepath)
+            filepaths.append(filepath)
+
+            summary = io.StringIO()
+            pstats.Stats(filepath, stream=summary).sort_stats(sortKey).print_stats(limit)
+            with open(os.path.join(self._dirpath, f"{name}.txt"), "w", encoding="utf-8") as f:
+                f.write(summary.getvalue())
+
+        return filepaths
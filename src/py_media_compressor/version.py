@@ -1,3 +1,3 @@
 package_name = "py_media_compressor"
 version = "1.9.0"
-metadata_version = 1
+metadata_version = 2